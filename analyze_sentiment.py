@@ -62,6 +62,16 @@ class SentimentAnalyzer:
             print(f"⚠ Error analyzing text: {e} - analyze_sentiment.py:62")
             return "NA"
 
+    def analyze_article(self, article) -> str:
+        """
+        Phân tích sentiment của một bài báo (Article scraper trả về hoặc row News)
+
+        Args:
+            article: Object có .title và .content
+        """
+        # Combine title + content preview for analysis
+        return self.analyze(f"{article.title}. {(article.content or '')[:300]}")
+
 
 def update_sentiment_scores(batch_size: int = 50, source: str = None, all_records: bool = False):
     """
@@ -138,11 +148,8 @@ def update_sentiment_scores(batch_size: int = 50, source: str = None, all_record
 
             for i, news in enumerate(news_items, 1):
                 try:
-                    # Combine title + content preview for analysis
-                    text = f"{news.title}. {news.content[:300]}"
-
                     # Analyze sentiment
-                    sentiment = analyzer.analyze(text)
+                    sentiment = analyzer.analyze_article(news)
 
                     # Update database
                     news.sentiment_score = sentiment
@@ -0,0 +1,236 @@
+"""
+Benchmark HTML parser backend cho các scraper
+
+1. Lưu trang chi tiết mẫu của từng nguồn (cần mạng):
+    python benchmark_parsers.py save --out bench_pages --limit 5
+
+2. Chạy lại _fetch_article_detail trên các trang đã lưu với từng parser,
+   so sánh thời gian và kiểm tra kết quả trích xuất có giống nhau không:
+    python benchmark_parsers.py run --pages bench_pages --parsers html.parser lxml
+
+   Thêm --full-page để tắt targeted parse (parse cả trang) và so sánh với lần chạy mặc định.
+
+3. Đo tốc độ parse ngày xuất bản (scrapers/dates.py), không cần mạng:
+    python benchmark_parsers.py dates --count 1000000
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import scrapers
+from config import config
+from scrapers.dates import DATE_SAMPLES, parse_timestamp
+from scrapers.parsepool import parse_pool
+from scrapers.seen import seen_store
+from scrapers.stats import scrape_stats
+from scrapers.urlmodel import url_model
+from utils.html_parser import set_parser
+
+# published_at mặc định là thời điểm chạy khi trang không có ngày, bỏ qua lệch nhỏ
+TIMESTAMP_TOLERANCE = 120
+
+
+def scraper_classes(names=None) -> dict:
+    """{tên class: class} của tất cả scrapers (hoặc các class được chọn)"""
+    classes = {
+        name: getattr(scrapers, name)
+        for name in scrapers.__all__
+        if name.endswith('Scraper') and name != 'NewsScraperBase'
+    }
+    if names:
+        classes = {name: cls for name, cls in classes.items() if name in names}
+    return classes
+
+
+def save_pages(out_dir: Path, names=None, limit: int = 5):
+    """Chạy fetch_news của từng nguồn, lưu HTML + tham số của các lần gọi _fetch_article_detail"""
+    # Lấy cả bài đã có trong DB / seen-set để có đủ trang mẫu
+    config.SKIP_EXISTING = False
+    seen_store.enabled = False
+    url_model.enabled = False
+    # detail() bên dưới thay fetch_html trên instance scraper: phải gọi _fetch_article_detail
+    # lần lượt trên thread hiện tại (không qua thread pool của fetch_articles hay process pool)
+    parse_pool.enabled = False
+
+    index = []
+    for name, cls in scraper_classes(names).items():
+        scraper = cls()
+        scraper.detail_workers = 1
+        fetch_html = scraper.fetch_html
+        fetch_detail = getattr(scraper, '_fetch_article_detail', None)
+        if fetch_detail is None:
+            print(f"⏭ {name}: không có trang chi tiết")
+            continue
+
+        saved = []
+
+        def detail(*args, **kwargs):
+            if len(saved) >= limit:
+                return None
+            pages = []
+
+            def capture(url, listing=False):
+                html = fetch_html(url, listing=listing)
+                if html:
+                    pages.append(html)
+                return html
+
+            scraper.fetch_html = capture
+            try:
+                result = fetch_detail(*args, **kwargs)
+            finally:
+                scraper.fetch_html = fetch_html
+            if pages:
+                saved.append((args, kwargs, pages[-1]))
+            return result
+
+        scraper._fetch_article_detail = detail
+        try:
+            scraper.fetch_news()
+        except Exception as e:
+            print(f"✗ {name}: {e}")
+
+        source_dir = out_dir / name
+        source_dir.mkdir(parents=True, exist_ok=True)
+        for i, (args, kwargs, html) in enumerate(saved):
+            path = source_dir / f"{i}.html"
+            path.write_text(html, encoding='utf-8')
+            index.append({'scraper': name, 'file': str(path.relative_to(out_dir)), 'args': args, 'kwargs': kwargs})
+        print(f"✓ {name}: lưu {len(saved)} trang")
+
+    with open(out_dir / 'index.json', 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    print(f"\n✓ Index: {out_dir / 'index.json'} ({len(index)} trang)")
+
+
+def _same(a, b) -> bool:
+    if a is None or b is None:
+        return a is b
+    a, b = list(a), list(b)
+    if len(a) != len(b):
+        return False
+    if isinstance(a[0], int) and isinstance(b[0], int) and abs(a[0] - b[0]) <= TIMESTAMP_TOLERANCE:
+        a[0] = b[0]
+    return a == b
+
+
+def run_benchmark(pages_dir: Path, parsers: list, repeat: int = 3):
+    """Đo thời gian _fetch_article_detail trên trang đã lưu với từng parser và so sánh kết quả"""
+    with open(pages_dir / 'index.json', 'r', encoding='utf-8') as f:
+        index = json.load(f)
+
+    classes = scraper_classes()
+    timings = defaultdict(lambda: defaultdict(float))  # scraper -> parser -> giây
+    pages = defaultdict(int)
+    mismatches = []
+
+    # Tắt log của scraper trong lúc đo
+    real_stdout = sys.stdout
+
+    for entry in index:
+        name = entry['scraper']
+        html = (pages_dir / entry['file']).read_text(encoding='utf-8')
+        scraper = classes[name]()
+        scraper.fetch_html = lambda url, listing=False: html
+        pages[name] += 1
+
+        results = {}
+        for parser in parsers:
+            set_parser(parser)
+            sys.stdout = io.StringIO()
+            try:
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    result = scraper._fetch_article_detail(*entry['args'], **entry['kwargs'])
+                timings[name][parser] += (time.perf_counter() - start) / repeat
+            finally:
+                sys.stdout = real_stdout
+            results[parser] = result
+
+        baseline = results[parsers[0]]
+        for parser in parsers[1:]:
+            if not _same(baseline, results[parser]):
+                mismatches.append((name, entry['file'], parser, baseline, results[parser]))
+
+    header = ''.join(f"{p:>14}" for p in parsers)
+    print(f"\n{'Scraper':32}{'pages':>6}{header}{'speedup':>10}")
+    total = defaultdict(float)
+    for name in sorted(timings):
+        row = ''.join(f"{timings[name][p] / pages[name] * 1000:11.1f} ms" for p in parsers)
+        speedup = timings[name][parsers[0]] / max(timings[name][parsers[-1]], 1e-9)
+        print(f"{name:32}{pages[name]:>6}{row}{speedup:9.1f}x")
+        for p in parsers:
+            total[p] += timings[name][p]
+    if total:
+        print(f"{'TOTAL':32}{sum(pages.values()):>6}" + ''.join(f"{total[p] * 1000:11.1f} ms" for p in parsers)
+              + f"{total[parsers[0]] / max(total[parsers[-1]], 1e-9):9.1f}x")
+
+    if mismatches:
+        print(f"\n⚠ {len(mismatches)} trang cho kết quả khác với {parsers[0]}:")
+        for name, file, parser, expected, actual in mismatches:
+            print(f"  {name} {file} ({parser})")
+            if expected is None or actual is None:
+                print(f"    {parsers[0]}: {expected is not None}, {parser}: {actual is not None}")
+                continue
+            for i, (a, b) in enumerate(zip(expected, actual)):
+                if a != b:
+                    print(f"    field {i}: {str(a)[:80]!r} != {str(b)[:80]!r}")
+    else:
+        print(f"\n✓ Kết quả trích xuất giống nhau trên tất cả {sum(pages.values())} trang")
+
+
+def run_date_benchmark(count: int):
+    """Parse `count` chuỗi ngày (lặp lại các mẫu thực tế), in tốc độ và số lỗi"""
+    samples = (DATE_SAMPLES * (count // len(DATE_SAMPLES) + 1))[:count]
+    scrape_stats.reset()
+
+    start = time.perf_counter()
+    results = [parse_timestamp(text, 0, 'benchmark') for text in samples]
+    elapsed = time.perf_counter() - start
+
+    failures = scrape_stats.count('benchmark', 'date_fail')
+    print(f"{count} chuỗi trong {elapsed:.2f}s = {count / elapsed:,.0f} chuỗi/giây "
+          f"({elapsed / count * 1e6:.2f} µs/chuỗi), lỗi: {failures}")
+    if failures or not all(results):
+        print("⚠ Có mẫu không parse được")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backend")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    save = sub.add_parser('save', help='Lưu trang chi tiết mẫu của từng nguồn')
+    save.add_argument('--out', default='bench_pages')
+    save.add_argument('--limit', type=int, default=5, help='Số trang mỗi nguồn')
+    save.add_argument('--sources', nargs='*', help='Tên class scraper (mặc định: tất cả)')
+
+    run = sub.add_parser('run', help='Chạy benchmark trên trang đã lưu')
+    run.add_argument('--pages', default='bench_pages')
+    run.add_argument('--parsers', nargs='+', default=['html.parser', 'lxml'])
+    run.add_argument('--repeat', type=int, default=3)
+    run.add_argument('--full-page', action='store_true', help='Parse cả trang thay vì chỉ detail_regions')
+
+    dates = sub.add_parser('dates', help='Đo tốc độ parse ngày xuất bản')
+    dates.add_argument('--count', type=int, default=1_000_000)
+
+    args = parser.parse_args()
+    if args.command == 'dates':
+        run_date_benchmark(args.count)
+    elif args.command == 'save':
+        save_pages(Path(args.out), args.sources, args.limit)
+    else:
+        config.TARGETED_PARSE = not args.full_page
+        run_benchmark(Path(args.pages), args.parsers, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -23,4 +23,66 @@ class Config:
     PAGE_LOAD_TIMEOUT = int(os.getenv("PAGE_LOAD_TIMEOUT", "30"))
     REQUEST_DELAY = int(os.getenv("REQUEST_DELAY", "2"))
 
+    # Rate limit theo domain (token bucket): mặc định 1 request / REQUEST_DELAY giây (REQUEST_DELAY=0: không giới hạn)
+    RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "1"))
+
+    # HTTP client dùng chung
+    HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "32"))  # Số host giữ pool (>= số nguồn)
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "4"))  # Số connection keep-alive tối đa / host
+    HTTP2 = os.getenv("HTTP2", "false").lower() == "true"  # Cần cài httpx[http2]
+
+    # Cache trên đĩa (validators ETag/Last-Modified, ...)
+    CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+    CONDITIONAL_GET = os.getenv("CONDITIONAL_GET", "true").lower() == "true"  # Gửi If-None-Match cho trang danh sách / RSS
+    RESPONSE_CACHE = os.getenv("RESPONSE_CACHE", "false").lower() == "true"  # Cache trang chi tiết trên đĩa
+    RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "604800"))  # TTL mặc định (giây), mỗi nguồn có thể override
+    RESPONSE_CACHE_MAX_MB = int(os.getenv("RESPONSE_CACHE_MAX_MB", "500"))  # Tổng dung lượng tối đa, vượt thì evict LRU
+
+    SKIP_EXISTING = os.getenv("SKIP_EXISTING", "true").lower() == "true"  # Kiểm tra DB trước khi fetch trang chi tiết
+    SEEN_FILTER = os.getenv("SEEN_FILTER", "true").lower() == "true"  # Bloom filter URL đã lấy (CACHE_DIR/seen)
+    SEEN_FILTER_BITS = int(os.getenv("SEEN_FILTER_BITS", str(8 * 1024 * 1024)))  # Số bit mỗi nguồn (8M bit = 1 MB)
+    REDIRECT_CACHE = os.getenv("REDIRECT_CACHE", "true").lower() == "true"  # Nhớ redirect vĩnh viễn 301/308 URL gốc -> URL cuối (CACHE_DIR/redirects.json)
+    URL_FILTER = os.getenv("URL_FILTER", "true").lower() == "true"  # Lọc link không giống URL bài viết (học từ các lần fetch, CACHE_DIR/url_patterns.json)
+    URL_FILTER_MIN_ARTICLES = int(os.getenv("URL_FILTER_MIN_ARTICLES", "30"))  # Số bài tối thiểu của nguồn trước khi bắt đầu lọc
+    URL_FILTER_MAX_MISSES = int(os.getenv("URL_FILTER_MAX_MISSES", "3"))  # Hình dạng URL hụt bấy nhiêu lần (chưa ra bài nào) thì bỏ
+    MEDIA_POLICY = os.getenv("MEDIA_POLICY", "video=metadata,podcast=metadata,live=skip,gallery=fetch")  # Bài không phải bài chữ: fetch | metadata (chỉ lưu từ trang danh sách) | skip
+    MAX_BODY_BYTES = int(os.getenv("MAX_BODY_BYTES", str(5 * 1024 * 1024)))  # Giới hạn body trang chi tiết (byte)
+
+    HTML_PARSER = os.getenv("HTML_PARSER", "lxml")  # lxml (nhanh) | html.parser | html5lib
+    TARGETED_PARSE = os.getenv("TARGETED_PARSE", "true").lower() == "true"  # Chỉ parse detail_regions của trang chi tiết
+    HEAD_META = os.getenv("HEAD_META", "true").lower() == "true"  # Lấy title / ngày / chuyên mục từ meta + JSON-LD trong <head> trước khi tìm trong DOM
+    READABILITY_FALLBACK = os.getenv("READABILITY_FALLBACK", "true").lower() == "true"  # Trích nội dung theo heuristic khi selector của nguồn không lấy được
+
+    # Retry / circuit breaker
+    RETRY_MAX_ATTEMPTS = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))  # Số lần thử tối đa cho mỗi request
+    RETRY_BACKOFF_BASE = float(os.getenv("RETRY_BACKOFF_BASE", "1"))  # Giây, nhân đôi sau mỗi lần thử (có jitter)
+    RETRY_BACKOFF_MAX = float(os.getenv("RETRY_BACKOFF_MAX", "30"))  # Chờ tối đa giữa 2 lần thử (kể cả Retry-After)
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))  # Số lỗi liên tiếp để ngắt domain
+    CIRCUIT_COOLDOWN = int(os.getenv("CIRCUIT_COOLDOWN", "300"))  # Giây bỏ qua domain sau khi ngắt
+
+    # Fetch đồng thời
+    MAX_IN_FLIGHT_PER_HOST = int(os.getenv("MAX_IN_FLIGHT_PER_HOST", "1"))  # Số request đồng thời tối đa / host
+    DETAIL_WORKERS = int(os.getenv("DETAIL_WORKERS", "4"))  # Số trang chi tiết mỗi nguồn fetch cùng lúc (vẫn theo MAX_IN_FLIGHT_PER_HOST / rate limit)
+    PARSE_PROCESSES = os.getenv("PARSE_PROCESSES", "false").lower() == "true"  # Parse trang chi tiết trong process pool thay vì trên thread fetch
+    PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "0"))  # Số process parse, 0 = số core CPU
+    PARSE_TIMEOUT = int(os.getenv("PARSE_TIMEOUT", "60"))  # Giây chờ process parse một trang, quá thì parse trên thread
+    SCRAPE_ALL_WORKERS = int(os.getenv("SCRAPE_ALL_WORKERS", "6"))  # Số nguồn scrape_all chạy cùng lúc (1 = lần lượt như trước)
+
+    # Điều phối nhiều node qua bảng crawl_jobs (python main.py worker)
+    COORDINATOR_NODE = os.getenv("COORDINATOR_NODE", "")  # Tên node trong lease_owner (mặc định hostname-pid)
+    COORDINATOR_LEASE = int(os.getenv("COORDINATOR_LEASE", "300"))  # Giây giữ một job, node chết thì hết hạn và node khác nhận lại
+    COORDINATOR_SOURCE_INTERVAL = int(os.getenv("COORDINATOR_SOURCE_INTERVAL", "1800"))  # Giây tối thiểu giữa 2 lần quét danh sách một nguồn
+    COORDINATOR_BATCH = int(os.getenv("COORDINATOR_BATCH", "10"))  # Số job article mỗi lần nhận
+    COORDINATOR_MAX_ATTEMPTS = int(os.getenv("COORDINATOR_MAX_ATTEMPTS", "3"))  # Số lần thử một link trước khi đánh dấu failed
+    COORDINATOR_RETRY_DELAY = int(os.getenv("COORDINATOR_RETRY_DELAY", "60"))  # Giây chờ trước khi thử lại link lỗi mạng
+    COORDINATOR_POLL = int(os.getenv("COORDINATOR_POLL", "5"))  # Giây chờ khi hàng đợi tạm hết việc
+    COORDINATOR_RETENTION_DAYS = int(os.getenv("COORDINATOR_RETENTION_DAYS", "7"))  # Giữ job article đã xong bao nhiêu ngày
+
+    # Pipeline listing -> fetch -> extract -> dedup -> persist (python main.py pipeline)
+    PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "32"))  # Số item tối đa chờ trước mỗi stage (đầy thì stage trước phải chờ)
+    PIPELINE_DISCOVER_WORKERS = int(os.getenv("PIPELINE_DISCOVER_WORKERS", "4"))  # Số nguồn quét trang danh sách / RSS cùng lúc
+    PIPELINE_FETCH_WORKERS = int(os.getenv("PIPELINE_FETCH_WORKERS", "8"))  # Số trang chi tiết fetch cùng lúc (vẫn theo rate limit / host)
+    PIPELINE_EXTRACT_WORKERS = int(os.getenv("PIPELINE_EXTRACT_WORKERS", "2"))  # Số thread parse / trích xuất nội dung
+    PIPELINE_PERSIST_WORKERS = int(os.getenv("PIPELINE_PERSIST_WORKERS", "2"))  # Số thread ghi DB
+
 config = Config()
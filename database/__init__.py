@@ -1,3 +1,4 @@
+from .article import Article
 from .models import db, Database, News
 
-__all__ = ['db', 'Database', 'News']
+__all__ = ['db', 'Database', 'News', 'Article']
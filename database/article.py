@@ -0,0 +1,23 @@
+from typing import NamedTuple, Optional
+
+
+class Article(NamedTuple):
+    """
+    Một bài báo scraper trả về, các field theo đúng cột của bảng news.
+
+    NamedTuple (không có __dict__ riêng cho mỗi bài) nên nhẹ như tuple cũ, và giữ nguyên
+    thứ tự (published_at, title, link, content, source, stock_related, sentiment_score,
+    server_pushed, category) để code cũ unpack theo vị trí vẫn chạy.
+    """
+    published_at: int
+    title: str
+    link: str
+    content: str
+    source: str
+    stock_related: str = "NA"
+    sentiment_score: str = "NA"
+    server_pushed: bool = False
+    category: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return self._asdict()
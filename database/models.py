@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, String, Text, BigInteger, Boolean, text
+from sqlalchemy import create_engine, Column, String, Text, BigInteger, Boolean, Integer, DateTime, Index, text, or_
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -7,6 +7,7 @@ import uuid
 import sys
 sys.path.append('..')
 from config import config
+from database.article import Article
 
 Base = declarative_base()
 
@@ -30,8 +31,12 @@ class News(Base):
         CONSTRAINT news_pkey PRIMARY KEY (id),
         CONSTRAINT news_title_key UNIQUE (title)
     )
+    CREATE INDEX IF NOT EXISTS ix_news_link ON public.news (link)
     """
     __tablename__ = 'news'
+    __table_args__ = (
+        Index('ix_news_link', 'link'),  # find_existing tra link trước khi fetch trang chi tiết
+    )
     
     # Primary key - UUID
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default=text("gen_random_uuid()"))
@@ -85,6 +90,35 @@ class News(Base):
         }
 
 
+class CrawlJob(Base):
+    """
+    Hàng đợi công việc dùng chung giữa nhiều node crawl (scrapers/coordinator.py).
+
+    - kind='source': quét trang danh sách / RSS của một scraper (key = 'source:<tên class>')
+    - kind='article': fetch trang chi tiết của một link (key = link chuẩn, unique nên mỗi link chỉ fetch một lần)
+
+    Node nhận việc bằng SELECT ... FOR UPDATE SKIP LOCKED và giữ lease tới lease_until;
+    node chết thì lease hết hạn và node khác nhận lại.
+    """
+    __tablename__ = 'crawl_jobs'
+    __table_args__ = (
+        Index('ix_crawl_jobs_claim', 'kind', 'status', 'lease_until'),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    key = Column(Text, nullable=False, unique=True)
+    kind = Column(Text, nullable=False)
+    scraper = Column(Text, nullable=False)  # Tên class scraper
+    link = Column(Text, nullable=True)
+    args = Column(Text, nullable=True)  # JSON list tham số thêm của fetch_article (category RSS, title...)
+    status = Column(Text, nullable=False, default='pending')  # pending | leased | done | failed
+    lease_owner = Column(Text, nullable=True)
+    lease_until = Column(DateTime(timezone=True), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=text("now()"))
+
+
 class Database:
     """Database connection và operations"""
     
@@ -95,47 +129,37 @@ class Database:
     def create_tables(self):
         """Tạo tất cả các tables"""
         Base.metadata.create_all(self.engine)
+        # create_all không thêm index vào bảng đã có sẵn (DB tạo trước khi có ix_news_link)
+        for index in News.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
         print("✓ Database tables created successfully!")
     
     def get_session(self):
         """Lấy database session"""
         return self.Session()
     
-    def insert_news(self, news_data: tuple) -> bool:
+    def insert_article(self, article: Article) -> bool:
         """
         Insert một bài báo vào database.
         Tương tự hàm insert_news trong Rust.
         
         Args:
-            news_data: tuple gồm (published_at, title, link, content, source, stock_related, sentiment_score, server_pushed)
+            article: Article scraper trả về (các field trùng tên cột bảng news)
         
         Returns:
             True nếu insert thành công, False nếu đã tồn tại hoặc lỗi
         """
         session = self.get_session()
         try:
-            published_at, title, link, content, source, stock_related, sentiment_score, server_pushed = news_data
-            
             # Kiểm tra xem title đã tồn tại chưa (UNIQUE constraint)
-            existing = session.query(News).filter_by(title=title).first()
+            existing = session.query(News.id).filter_by(title=article.title).first()
             if existing:
-                print(f"⏭ Skipped (exists): {title[:50]}...")
+                print(f"⏭ Skipped (exists): {article.title[:50]}...")
                 return False
             
-            # Insert new record
-            news = News(
-                published_at=published_at,
-                title=title,
-                link=link,
-                content=content,
-                source=source,
-                stock_related=stock_related,
-                sentiment_score=sentiment_score,
-                server_pushed=server_pushed,
-            )
-            session.add(news)
+            session.add(News(**article._asdict()))
             session.commit()
-            print(f"✓ Inserted: {title[:50]}...")
+            print(f"✓ Inserted: {article.title[:50]}...")
             return True
             
         except Exception as e:
@@ -145,45 +169,16 @@ class Database:
         finally:
             session.close()
     
-    def insert_news_with_category(self, news_data: tuple, category: str = None) -> bool:
+    def insert_news(self, news_data: tuple) -> bool:
         """
-        Insert một bài báo với category.
-        
-        Args:
-            news_data: tuple gồm (published_at, title, link, content, source, stock_related, sentiment_score, server_pushed)
-            category: Chuyên mục của bài báo
+        Insert từ tuple (published_at, title, link, content, source, stock_related, sentiment_score, server_pushed[, category]).
+        Giữ cho code cũ, scraper mới trả Article và gọi insert_article.
         """
-        session = self.get_session()
-        try:
-            published_at, title, link, content, source, stock_related, sentiment_score, server_pushed = news_data
-            
-            existing = session.query(News).filter_by(title=title).first()
-            if existing:
-                print(f"⏭ Skipped (exists): {title[:50]}...")
-                return False
-            
-            news = News(
-                published_at=published_at,
-                title=title,
-                link=link,
-                content=content,
-                source=source,
-                stock_related=stock_related,
-                sentiment_score=sentiment_score,
-                server_pushed=server_pushed,
-                category=category,
-            )
-            session.add(news)
-            session.commit()
-            print(f"✓ Inserted: {title[:50]}...")
-            return True
-            
-        except Exception as e:
-            session.rollback()
-            print(f"✗ Error inserting news: {e}")
-            return False
-        finally:
-            session.close()
+        return self.insert_article(Article(*news_data))
+    
+    def insert_news_with_category(self, news_data: tuple, category: str = None) -> bool:
+        """Insert từ tuple 8 phần tử kèm category (giữ cho code cũ)"""
+        return self.insert_article(Article(*news_data[:8], category=category))
     
     def update_content_by_id(self, news_id: str, content: str) -> bool:
         """
@@ -233,6 +228,38 @@ class Database:
         finally:
             session.close()
     
+    def find_existing(self, links: list, titles: list = None) -> tuple:
+        """
+        Kiểm tra một lượt các link / title đã có trong DB chưa (dùng trước khi fetch trang chi tiết).
+
+        Args:
+            links: Danh sách link ứng viên từ trang danh sách / RSS
+            titles: Danh sách title ứng viên (nếu trang danh sách có)
+
+        Returns:
+            (set link đã tồn tại, set title đã tồn tại)
+        """
+        links = [l for l in links if l]
+        titles = [t for t in (titles or []) if t]
+        if not links and not titles:
+            return set(), set()
+
+        session = self.get_session()
+        try:
+            conditions = []
+            if links:
+                conditions.append(News.link.in_(links))
+            if titles:
+                conditions.append(News.title.in_(titles))
+            rows = session.query(News.link, News.title).filter(or_(*conditions)).all()
+
+            link_set, title_set = set(links), set(titles)
+            existing_links = {r.link for r in rows if r.link in link_set}
+            existing_titles = {r.title for r in rows if r.title in title_set}
+            return existing_links, existing_titles
+        finally:
+            session.close()
+
     def get_news_without_content(self, source: str = None) -> list:
         """Lấy các bài chưa có content để fetch sau"""
         session = self.get_session()
@@ -1,7 +1,11 @@
 import sys
 import os
 import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import List, Tuple
 
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -33,7 +37,22 @@ from scrapers import (
     VietnamFinanceScraper,
     XaydungChinhsachScraper,
 )
-from database.models import db
+from config import config
+from database import Article, db
+from scrapers.cache import response_cache
+from scrapers.coordinator import Coordinator
+from scrapers.dates import print_date_stats
+from scrapers.decoding import print_decode_stats
+from scrapers.extract import print_parse_stats
+from scrapers.readability import print_readability_stats
+from scrapers.http_client import http_client
+from scrapers.media import print_media_stats
+from scrapers.pipeline import ScrapePipeline
+from scrapers.redirects import print_redirect_stats, redirect_store
+from scrapers.retry import print_retry_stats
+from scrapers.seen import seen_store
+from scrapers.stats import scrape_stats
+from scrapers.urlmodel import print_url_filter_stats, url_model
 from utils.exporters import export_to_csv, export_to_json
 
 def scrape_xaydungchinhsach(save_to_db: bool = True, export_csv: bool = True) -> list:
@@ -385,10 +404,12 @@ def scrape_thoibaonganhang(save_to_db: bool = True, export_csv: bool = True) ->
 
     return articles
 
-def _save_and_export(articles: list, source_name: str, save_to_db: bool, export_csv: bool):
+def _save_and_export(articles: List[Article], source_name: str, save_to_db: bool, export_csv: bool):
     """Helper function để save và export"""
     if not articles:
         print(f"\n⚠ No articles scraped from {source_name}!")
+        redirect_store.flush()
+        url_model.flush()
         return
 
     print(f"\n📊 Total articles scraped: {len(articles)}")
@@ -397,15 +418,8 @@ def _save_and_export(articles: list, source_name: str, save_to_db: bool, export_
         print("\n💾 Saving to database...")
         saved_count = 0
         for article in articles:
-            # article tuple: (published_at, title, link, content, source, stock_related, sentiment_score, server_pushed, category)
-            if len(article) == 9:
-                data = article[:8]
-                category = article[8]
-                if db.insert_news_with_category(data, category):
-                    saved_count += 1
-            else:
-                if db.insert_news(article):
-                    saved_count += 1
+            if db.insert_article(article):
+                saved_count += 1
 
         print(f"✓ Saved {saved_count}/{len(articles)} articles to database")
 
@@ -413,23 +427,189 @@ def _save_and_export(articles: list, source_name: str, save_to_db: bool, export_
         print("\n📁 Exporting to CSV...")
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        articles_dict = []
-        for a in articles:
-            articles_dict.append({
-                'published_at': a[0],
-                'title': a[1],
-                'link': a[2],
-                'content': a[3],
-                'source': a[4],
-                'stock_related': a[5],
-                'sentiment_score': a[6],
-                'server_pushed': a[7],
-                'category': a[8] if len(a) > 8 else '',
-            })
-
-        csv_path = export_to_csv(articles_dict, filename=f"{source_name}_{timestamp}")
+        csv_path = export_to_csv(articles, filename=f"{source_name}_{timestamp}")
         print(f"✓ Exported to: {csv_path}")
 
+    # Ghi nhận URL đã lấy (kể cả khi DB lỗi) để lần chạy sau không fetch lại
+    for article in articles:
+        seen_store.add(article.source, [article.link])
+    seen_store.flush()
+    redirect_store.flush()
+    url_model.flush()
+
+
+# (scraper, kwargs của fetch_news) theo thứ tự của scrape_all, dùng cho chế độ pipeline
+PIPELINE_SOURCES = [
+    (CafeFScraper, {'max_pages': 1, 'max_articles_per_page': 20}),
+    (CafelandScraper, {'max_pages': 1, 'max_articles_per_page': 20}),
+    (VnExpressScraper, {'max_pages': 1}),
+    (VnEconomyScraper, {'max_articles': 20}),
+    (VOVScraper, {'max_pages': 1}),
+    (VietnametScraper, {}),
+    (DanTriRSSScraper, {}),
+    (ThanhNienRSSScraper, {}),
+    (TuoiTreRSSScraper, {}),
+    (LaoDongScraper, {'max_articles': 20}),
+    (NLDScraper, {'max_articles': 20}),
+    (VietStockScraper, {'max_articles': 15}),
+    (ANTTRSSScraper, {}),
+    (CNARSSScraper, {}),
+    (QDNDRSSScraper, {}),
+    (KinhTeNgoaiThuongScraper, {}),
+    (ThoiBaoNganHangScraper, {'max_articles': 15}),
+    (TaiChinhDoanhNghiepScraper, {'max_articles': 15}),
+    (BaoChinhPhuScraper, {'max_articles': 15}),
+    (TinNhanhChungKhoanScraper, {'max_articles': 15}),
+    (NguoiQuanSatScraper, {'max_articles': 20}),
+    (ThoiBaoTaiChinhScraper, {'max_articles': 15}),
+    (Coin68Scraper, {'max_articles': 10}),
+    (VietnamFinanceScraper, {'max_articles': 15}),
+    (XaydungChinhsachScraper, {'max_articles': 10}),
+]
+
+
+def scrape_pipeline(save_to_db: bool = True, export_csv: bool = True) -> list:
+    """
+    Scrape tất cả các nguồn qua pipeline theo stage (scrapers/pipeline.py): quét danh sách, fetch trang
+    chi tiết, parse và ghi DB chạy chồng lên nhau, nối bằng queue có giới hạn.
+    """
+    print("\n" + "="*60)
+    print("🏭 PIPELINE: LISTING → FETCH → EXTRACT → DEDUP → PERSIST")
+    print("="*60)
+
+    if save_to_db:
+        try:
+            db.create_tables()
+        except Exception as e:
+            print(f"⚠ Database warning: {e} ")
+
+    scrape_stats.reset()
+    pipeline = ScrapePipeline(save_to_db=save_to_db, collect=export_csv)
+    articles = pipeline.run((cls(), kwargs) for cls, kwargs in PIPELINE_SOURCES)
+
+    if export_csv and articles:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        csv_path = export_to_csv(articles, filename=f"pipeline_news_{timestamp}")
+        print(f"✓ Exported to: {csv_path}")
+
+    pipeline.print_stats()
+    http_client.print_stats()
+    response_cache.print_stats()
+    print_parse_stats()
+    print_retry_stats()
+    print_url_filter_stats()
+    print_media_stats()
+
+    return articles
+
+
+# Thứ tự gộp kết quả vào file export của scrape_all (không phụ thuộc nguồn nào chạy xong trước)
+SCRAPE_ALL_SOURCES = [
+    scrape_cafef,
+    scrape_cafeland,
+    scrape_vnexpress,
+    scrape_vneconomy,
+    scrape_vov,
+    scrape_vietnamnet,
+    scrape_dantri,
+    scrape_thanhnien,
+    scrape_tuoitre,
+    scrape_laodong,
+    scrape_nld,
+    scrape_vietstock,
+    scrape_antt,
+    scrape_cna,
+    scrape_qdnd,
+    scrape_kinhte,
+    scrape_thoibaonganhang,
+    scrape_taichinhdoanhnghiep,
+    scrape_baochinhphu,
+    scrape_tinnhanhchungkhoan,
+    scrape_nguoiquansat,
+    scrape_thoibaotaichinh,
+    scrape_coin68,
+    scrape_vietnamfinance,
+    scrape_xaydungchinhsach,
+]
+
+
+def _run_source(func) -> Tuple[list, float, str]:
+    """Chạy một scrape_* (lỗi của nguồn không làm dừng các nguồn khác), trả (bài, giây, tên worker)"""
+    start = time.perf_counter()
+    try:
+        articles = func(save_to_db=True, export_csv=False) or []
+    except Exception as e:
+        print(f"✗ Error in {func.__name__}: {e}")
+        articles = []
+    return articles, time.perf_counter() - start, threading.current_thread().name
+
+
+def _run_sources(funcs: list, workers: int) -> list:
+    """
+    Chạy các scrape_* song song trên pool `workers` thread. Giới hạn theo domain (rate limiter,
+    host limiter) dùng chung toàn process nên vẫn giữ nguyên khi nhiều nguồn chạy cùng lúc.
+
+    Returns:
+        Bài của tất cả nguồn, gộp theo đúng thứ tự `funcs`
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='source') as pool:
+        results = list(pool.map(_run_source, funcs))
+    wall = time.perf_counter() - start
+
+    all_articles = []
+    for articles, _, _ in results:
+        all_articles.extend(articles)
+
+    _print_source_times(funcs, results, wall, workers)
+    return all_articles
+
+
+def _print_source_times(funcs: list, results: list, wall: float, workers: int):
+    """In wall time từng nguồn và critical path (chuỗi nguồn trên worker bận lâu nhất)"""
+    print(f"\n⏱ Source wall time (tổng {wall:.1f}s, {workers} workers):")
+    rows = sorted(zip(funcs, results), key=lambda row: row[1][1], reverse=True)
+    for func, (articles, seconds, worker) in rows:
+        name = func.__name__.replace('scrape_', '')
+        print(f"  {name:25} {seconds:7.1f}s  articles={len(articles):4}  worker={worker}")
+
+    chains = {}
+    for func, (_, seconds, worker) in zip(funcs, results):
+        chains.setdefault(worker, []).append((func.__name__.replace('scrape_', ''), seconds))
+    worker, chain = max(chains.items(), key=lambda item: sum(seconds for _, seconds in item[1]))
+    path = " → ".join(f"{name} ({seconds:.1f}s)" for name, seconds in chain)
+    print(f"  Critical path [{worker}]: {path} = {sum(seconds for _, seconds in chain):.1f}s")
+
+
+def scrape_worker(save_to_db: bool = True, export_csv: bool = False) -> list:
+    """
+    Chạy như một node trong cụm nhiều node: nhận nguồn / link từ bảng crawl_jobs dùng chung
+    (scrapers/coordinator.py), các node không quét trùng nguồn và không fetch trùng link.
+    """
+    print("\n" + "="*60)
+    print("🛰  CRAWL WORKER (POSTGRES WORK QUEUE)")
+    print("="*60)
+
+    db.create_tables()
+    scrape_stats.reset()
+    coordinator = Coordinator(PIPELINE_SOURCES, save_to_db=save_to_db, collect=export_csv)
+    coordinator.run()
+    articles = coordinator.articles
+
+    if export_csv and articles:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        csv_path = export_to_csv(articles, filename=f"worker_news_{timestamp}")
+        print(f"✓ Exported to: {csv_path}")
+
+    coordinator.print_stats()
+    http_client.print_stats()
+    print_parse_stats()
+    print_retry_stats()
+    print_url_filter_stats()
+    print_media_stats()
+
+    return articles
+
 
 def scrape_all():
     """Scrape tất cả các nguồn"""
@@ -444,33 +624,8 @@ def scrape_all():
         print(f"⚠ Database warning: {e} ")
         print("Will export to CSV only... ")
 
-    all_articles = []
-
-    all_articles.extend(scrape_cafef(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_cafeland(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_vnexpress(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_vneconomy(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_vov(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_vietnamnet(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_dantri(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_thanhnien(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_tuoitre(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_laodong(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_nld(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_vietstock(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_antt(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_cna(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_qdnd(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_kinhte(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_thoibaonganhang(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_taichinhdoanhnghiep(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_baochinhphu(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_tinnhanhchungkhoan(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_nguoiquansat(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_thoibaotaichinh(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_coin68(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_vietnamfinance(save_to_db=True, export_csv=False))
-    all_articles.extend(scrape_xaydungchinhsach(save_to_db=True, export_csv=False))
+    scrape_stats.reset()
+    all_articles = _run_sources(SCRAPE_ALL_SOURCES, config.SCRAPE_ALL_WORKERS)
 
     print("\n" + "="*60)
     print("📁 FINAL EXPORT")
@@ -478,22 +633,8 @@ def scrape_all():
 
     if all_articles:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        articles_dict = []
-        for a in all_articles:
-            articles_dict.append({
-                'published_at': a[0],
-                'title': a[1],
-                'link': a[2],
-                'content': a[3],
-                'source': a[4],
-                'stock_related': a[5],
-                'sentiment_score': a[6],
-                'server_pushed': a[7],
-                'category': a[8] if len(a) > 8 else '',
-            })
-
-        csv_path = export_to_csv(articles_dict, filename=f"all_news_{timestamp}")
-        json_path = export_to_json(articles_dict, filename=f"all_news_{timestamp}")
+        csv_path = export_to_csv(all_articles, filename=f"all_news_{timestamp}")
+        json_path = export_to_json(all_articles, filename=f"all_news_{timestamp}")
 
         print(f"\n{'='*60}")
         print(f"✅ DONE!")
@@ -502,6 +643,17 @@ def scrape_all():
         print(f"CSV: {csv_path}")
         print(f"JSON: {json_path}")
 
+    http_client.print_stats()
+    response_cache.print_stats()
+    print_decode_stats()
+    print_parse_stats()
+    print_date_stats()
+    print_readability_stats()
+    print_retry_stats()
+    print_redirect_stats()
+    print_url_filter_stats()
+    print_media_stats()
+
     return all_articles
 
 
@@ -584,6 +736,10 @@ if __name__ == "__main__":
         elif mode == 'vietstock':
             db.create_tables()
             scrape_vietstock()
+        elif mode == 'pipeline':
+            scrape_pipeline()
+        elif mode == 'worker':
+            scrape_worker()
         else:
             scrape_all()
 
@@ -21,6 +21,8 @@ from apscheduler.triggers.interval import IntervalTrigger
 # Import các scraper functions từ main.py
 from main import (
     scrape_all,
+    scrape_pipeline,
+    scrape_worker,
     scrape_cafef,
     scrape_cafeland,
     scrape_vnexpress,
@@ -58,6 +60,8 @@ class NewsScraperScheduler:
     # Mapping function names trong config → actual Python functions
     SCRAPER_FUNCTIONS = {
         'scrape_all': scrape_all,
+        'scrape_pipeline': scrape_pipeline,
+        'scrape_worker': scrape_worker,
         'scrape_cafef': scrape_cafef,
         'scrape_cafeland': scrape_cafeland,
         'scrape_vnexpress': scrape_vnexpress,
@@ -2,7 +2,7 @@
 News Scrapers Package - Organized by scraper type
 """
 
-from scrapers.base import NewsScraperBase
+from scrapers.base import ListingItem, NewsScraperBase
 
 # Import from RSS scrapers
 from scrapers.rss import (
@@ -43,6 +43,7 @@ from scrapers.selenium import (
 
 __all__ = [
     'NewsScraperBase',
+    'ListingItem',
     # RSS Scrapers
     'VnEconomyScraper',
     'DanTriRSSScraper',
@@ -1,61 +1,557 @@
 
-import requests
 from datetime import datetime
+import html as html_lib
+import re
+import threading
 import time
-from typing import Optional
-import gzip
-import brotli
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import feedparser
+from bs4 import BeautifulSoup
+
+from config import config
+from database.article import Article
+from database.models import db
+from scrapers.hostlimit import host_limiter, host_of, release_on_close
+from scrapers.cache import response_cache
+from scrapers.dates import VN_TZ, from_struct_time, parse_first, parse_timestamp, record_failure
+from scrapers.decoding import decode_body
+from scrapers.extract import ArticleSpec, Extracted
+from scrapers.head import scan_head
+from scrapers.http_client import TRANSIENT_ERRORS, http_client
+from scrapers.media import DEFAULT_POLICY, FETCH, METADATA, SKIP, TEXT, classify
+from scrapers.parsepool import parse_pool
+from scrapers.ratelimit import rate_limiter
+from scrapers.readability import extract_main_text
+from scrapers.redirects import is_permanent, redirect_store
+from scrapers.retry import RETRY_STATUS, CircuitOpenError, backoff_delay, circuit_breaker, retry_after_seconds
+from scrapers.seen import seen_store
+from scrapers.stats import scrape_stats
+from scrapers.streaming import read_body
+from scrapers.urlmodel import url_model
+from scrapers.validators import validator_store
+from utils.html_parser import make_soup
+from utils.urls import canonicalize
+
+# Lần fetch_html gần nhất của thread có lỗi mạng / HTTP không (fetch_article dùng để không tính là fetch hụt)
+_fetch_status = threading.local()
+# Sink của thread đang chạy discover(): fetch_article chuyển (link, args, kwargs) cho sink thay vì fetch
+_discovery = threading.local()
+
+
+class ListingItem(NamedTuple):
+    """Một bài lấy được từ trang danh sách (chưa fetch trang chi tiết)"""
+    link: str
+    title: str = ''
+    description: str = ''
+    kind: str = TEXT  # Loại bài theo markup trang danh sách (scrapers/media.py)
 
 
 class NewsScraperBase:
     """Base class cho tất cả news scrapers"""
 
     def __init__(self):
-        self.session = requests.Session()
         self.headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
             'Accept-Encoding': 'gzip, deflate, br',
             'Accept-Language': 'en-IN,en-US;q=0.9,en;q=0.8,vi;q=0.7',
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
         }
-        self.delay = 2  # Delay giữa các request (giây)
+        # Token bucket theo domain: rate = request/giây, burst = số request được gửi liền nhau
+        self.rate = 1 / config.REQUEST_DELAY if config.REQUEST_DELAY > 0 else 0  # 0 = không giới hạn
+        self.burst = config.RATE_LIMIT_BURST
+        self.max_in_flight = config.MAX_IN_FLIGHT_PER_HOST  # Số request đồng thời tối đa trên host của nguồn
+        self.cache_ttl = config.RESPONSE_CACHE_TTL  # TTL (giây) của response cache cho nguồn này, 0 = không cache
+        # Stream trang chi tiết: dừng đọc khi container nội dung (selector 'tag.class') đã đóng
+        self.stream_end_marker = None
+        self.max_body_bytes = config.MAX_BODY_BYTES  # Giới hạn cứng kích thước body
+        self.charset = None  # Ép charset khi server khai báo sai (mặc định: header -> <meta> -> utf-8)
+        # Các vùng trang chi tiết mà scraper đọc (xem utils/html_parser.py), None = parse cả trang
+        self.detail_regions = None
+        self.article_spec: Optional[ArticleSpec] = None  # Spec trích xuất trang chi tiết (scrapers/extract.py)
+        # Chuẩn hóa link bài viết (canonical_url, xem utils/urls.py)
+        self.base_url = None  # Gốc cho href tương đối, vd 'https://cafef.vn'
+        self.canonical_host = None  # Host chuẩn khi nguồn có nhiều host (có / không www)
+        self.url_rewrites: List[Tuple[str, str]] = []  # (regex, thay thế) trên path, đưa URL cũ / biến thể về URL chuẩn
+        self.drop_query = False  # URL bài viết của nguồn không dùng query string
+        # Bài video / podcast / trực tiếp / ảnh: {loại: fetch | metadata | skip} (scrapers/media.py)
+        self.media_policy = dict(DEFAULT_POLICY)
+        self._metadata_items: Dict[str, tuple] = {}  # link -> (loại, title, mô tả, published_at) của bài chỉ lưu metadata
+        self.detail_workers = config.DETAIL_WORKERS  # Số trang chi tiết của nguồn fetch cùng lúc (fetch_articles)
+        self._prefetched: Dict[str, str] = {}  # link -> HTML trang chi tiết đã fetch trước (scrapers/pipeline.py)
+        self._pending_validators: Dict[str, dict] = {}  # url -> header ETag / Last-Modified chờ commit_validators()
+
+    def _get(self, url: str, timeout: float = 30, headers: Optional[dict] = None, stream: bool = False):
+        """
+        GET qua HTTP client dùng chung, sau khi lấy token rate limit và slot của host.
+
+        Lỗi mạng và status 429/5xx được thử lại (exponential backoff có jitter, ưu tiên Retry-After).
+        Raise CircuitOpenError nếu domain đang bị ngắt do lỗi liên tiếp.
+        stream=True: trả response chưa đọc body (xem scrapers/streaming.py).
+        """
+        source = self._stats_source()
+        request_headers = {**self.headers, **headers} if headers else self.headers
+        max_attempts = max(1, config.RETRY_MAX_ATTEMPTS)
+
+        for attempt in range(1, max_attempts + 1):
+            if not circuit_breaker.allow(url):
+                scrape_stats.incr(source, 'circuit_skip')
+                raise CircuitOpenError(f"Circuit open for {host_of(url)}")
+
+            resp, error = None, None
+            # Lấy slot của host trước rồi mới lấy token: thread chờ slot không giữ sẵn token,
+            # nên khi một request chậm nhả slot các request sau vẫn cách nhau theo rate của domain
+            release = host_limiter.acquire(url, self.max_in_flight)
+            try:
+                rate_limiter.acquire(url, self.rate, self.burst)
+                resp = http_client.get(url, headers=request_headers, timeout=timeout, stream=stream)
+            except TRANSIENT_ERRORS as e:
+                error = e
+            finally:
+                # Response stream: giữ slot của host tới khi body đọc xong (resp.close())
+                if stream and resp is not None:
+                    release_on_close(resp, release)
+                else:
+                    release()
+
+            if resp is not None and resp.status_code not in RETRY_STATUS:
+                circuit_breaker.record_success(url)
+                return resp
+
+            if circuit_breaker.record_failure(url):
+                print(f"⚠ Circuit open: {host_of(url)} lỗi liên tiếp, bỏ qua trong {config.CIRCUIT_COOLDOWN}s")
+            if attempt == max_attempts:
+                break
+
+            delay = backoff_delay(attempt)
+            if resp is not None:
+                retry_after = retry_after_seconds(resp)
+                if retry_after is not None:
+                    if retry_after > config.RETRY_BACKOFF_MAX:
+                        break  # Server yêu cầu chờ quá lâu, để lần chạy sau
+                    delay = retry_after
 
-    def fetch_html(self, url: str) -> Optional[str]:
-        """Fetch và decode HTML từ URL"""
+            reason = f"HTTP {resp.status_code}" if resp is not None else type(error).__name__
+            print(f"⚠ Retry {attempt}/{max_attempts - 1} sau {delay:.1f}s ({reason}): {url}")
+            if resp is not None and stream:
+                resp.close()
+            scrape_stats.incr(source, 'retry')
+            time.sleep(delay)
+
+        # Hết lượt thử: trả response lỗi cuối cùng (caller gọi raise_for_status) hoặc raise lỗi mạng
+        if resp is not None:
+            return resp
+        raise error
+
+    def filter_new(self, items: list, limit: Optional[int] = None) -> list:
+        """
+        Bỏ các bài đã lấy trước khi fetch trang chi tiết:
+        kiểm tra seen-set trên đĩa trước (không cần DB), bỏ link không giống URL bài viết (url model),
+        phần còn lại kiểm tra DB bằng một query. Sau đó áp media_policy cho bài video / podcast / trực tiếp / ảnh.
+
+        Args:
+            items: List link (str) hoặc object có .link / .title (ListingItem, entry RSS)
+            limit: Số item tối đa trả về (max_articles). Cắt sau khi lọc, để link bị loại
+                   (chuyên mục, tag, video, bài đã có) không chiếm chỗ của bài mới
+
+        Returns:
+            Các item chưa có, giữ nguyên thứ tự. DB lỗi thì chỉ lọc theo seen-set.
+        """
+        return self._apply_media_policy(self._filter_existing(items), limit)
+
+    def _filter_existing(self, items: list) -> list:
+        if not items:
+            return items
+
+        source = self._stats_source()
+        total = len(items)
+        items = [item for item in items if not seen_store.seen(source, self._item_link(item))]
+        if len(items) < total:
+            print(f"⏭ Bỏ qua {total - len(items)}/{total} bài đã lấy ở lần chạy trước")
+            scrape_stats.incr(source, 'seen_skip', total - len(items))
+
+        total = len(items)
+        items = [item for item in items if url_model.allow(source, self._item_link(item))]
+        if len(items) < total:
+            print(f"⏭ Bỏ qua {total - len(items)}/{total} link không giống URL bài viết (url model)")
+            scrape_stats.incr(source, 'url_filtered', total - len(items))
+
+        if not config.SKIP_EXISTING or not items:
+            return items
+
+        links = [self._item_link(item) for item in items]
+        titles = ['' if isinstance(item, str) else getattr(item, 'title', '') for item in items]
         try:
-            resp = self.session.get(url, headers=self.headers, timeout=30)
-            resp.raise_for_status()
+            existing_links, existing_titles = db.find_existing(links, titles)
+        except Exception as e:
+            print(f"⚠ Không kiểm tra được bài đã có trong DB, fetch toàn bộ: {str(e).splitlines()[0]}")
+            return items
+
+        # Ghi link DB xác nhận đã có vào seen-set để lần sau không cần query
+        seen_store.add(source, existing_links)
+
+        new_items = [
+            item for item, link, title in zip(items, links, titles)
+            if link not in existing_links and not (title and title in existing_titles)
+        ]
+        skipped = len(items) - len(new_items)
+        if skipped:
+            print(f"⏭ Bỏ qua {skipped}/{len(items)} bài đã có trong DB")
+            scrape_stats.incr(source, 'existing_skip', skipped)
+        return new_items
+
+    def canonical_url(self, href: str, base: Optional[str] = None) -> str:
+        """
+        URL chuẩn của bài viết: tuyệt đối, theo quy tắc của nguồn, đi thẳng tới URL cuối nếu đã biết redirect.
+        Dùng cho mọi link lấy từ trang danh sách / RSS để dedup, cache và DB cùng một key.
+        """
+        url = canonicalize(href, base or self.base_url, self.url_rewrites, self.drop_query, self.canonical_host)
+        return redirect_store.resolve(url)
+
+    def _apply_media_policy(self, items: list, limit: Optional[int] = None) -> list:
+        """Bỏ / đánh dấu chỉ lưu metadata các item không phải bài chữ theo self.media_policy, giữ tối đa limit item"""
+        source = self._stats_source()
+        kept = []
+        skipped = untitled = 0
+        for item in items:
+            if limit is not None and len(kept) >= limit:
+                break
+            link = self._item_link(item)
+            kind = classify(item, link)
+            action = FETCH if kind == TEXT else self.media_policy.get(kind, FETCH)
+            title = '' if isinstance(item, str) else getattr(item, 'title', '')
+
+            if action == SKIP:
+                skipped += 1
+                continue
+            if action == METADATA and not title:
+                # Chỉ có link (scraper truyền str thay vì ListingItem): không đủ dữ liệu để lưu metadata
+                untitled += 1
+                continue
+            if action == METADATA:
+                self._metadata_items[link] = (kind, title, self._item_description(item), self._item_published(item))
+                scrape_stats.incr(source, 'media_metadata')
+            kept.append(item)
+
+        if skipped:
+            print(f"⏭ Bỏ qua {skipped}/{len(items)} bài video / podcast / trực tiếp (media_policy)")
+            scrape_stats.incr(source, 'media_skip', skipped)
+        if untitled:
+            print(f"⚠ Bỏ qua {untitled}/{len(items)} bài video / podcast / trực tiếp chỉ lưu metadata nhưng không có title")
+            scrape_stats.incr(source, 'media_untitled', untitled)
+        return kept
+
+    @staticmethod
+    def _item_description(item) -> str:
+        description = getattr(item, 'description', '') or ''
+        # Mô tả trong RSS có thể chứa HTML (ảnh, link)
+        return html_lib.unescape(re.sub(r'<[^>]+>', ' ', description)).strip() if '<' in description else description
+
+    @staticmethod
+    def _item_published(item) -> int:
+        now = int(datetime.now().timestamp())
+        if hasattr(item, 'get'):  # entry RSS
+            return from_struct_time(item.get('published_parsed'), now)
+        return now
+
+    def fetch_article(self, link: str, *args, **kwargs) -> Optional[Article]:
+        """
+        Fetch trang chi tiết qua _fetch_article_detail của scraper, ghi nhận URL có ra bài hay không
+        cho url model (lỗi mạng không tính là fetch hụt).
+
+        Bài chỉ lưu metadata (media_policy) được trả về từ dữ liệu trang danh sách, không fetch.
+        Trong discover() chỉ chuyển link cho sink và trả None.
+        """
+        sink = getattr(_discovery, 'sink', None)
+        if sink is not None:
+            sink(link, args, kwargs)
+            return None
+
+        media = self._metadata_items.pop(link, None)
+        if media is not None:
+            kind, title, description, published_at = media
+            return Article(published_at, title, link, description, self._stats_source(), category=kind.upper())
+
+        _fetch_status.failed = False
+        if parse_pool.enabled:
+            article = parse_pool.parse(self, link, args, kwargs)
+        else:
+            article = self._fetch_article_detail(link, *args, **kwargs)
+        if _fetch_status.failed:
+            return article
+
+        url_model.record(self._stats_source(), link, article is not None)
+        if article is None:
+            scrape_stats.incr(self._stats_source(), 'wasted_fetch')
+        return article
+
+    def fetch_articles(self, jobs: list) -> List[Article]:
+        """
+        Fetch trang chi tiết của nhiều bài cùng lúc trên thread pool (tối đa self.detail_workers thread).
+
+        Mỗi request vẫn đi qua rate limit / host limit của domain nên số request đồng thời thực tế
+        còn bị giới hạn bởi self.max_in_flight; phần parse chạy song song với request kế tiếp.
+
+        Args:
+            jobs: Mỗi phần tử là link, hoặc tuple (link, *args) truyền vào fetch_article
+
+        Không có trang nào lỗi thì lưu validator của các trang danh sách đã fetch (commit_validators),
+        có trang lỗi thì bỏ để lần chạy sau fetch lại đầy đủ danh sách.
+
+        Returns:
+            Các bài lấy được, theo đúng thứ tự jobs (lỗi của một URL chỉ làm mất bài đó)
+        """
+        calls = [(job, ()) if isinstance(job, str) else (job[0], tuple(job[1:])) for job in jobs]
+        total = len(calls)
 
-            # Handle content encoding
-            content_encoding = resp.headers.get('Content-Encoding', '')
+        def run(index: int, link: str, args: tuple) -> Tuple[Optional[Article], bool]:
+            print(f"[{index}/{total}] Fetching: {link[:60]}...", flush=True)
+            try:
+                article = self.fetch_article(link, *args)
+            except Exception as e:
+                print(f"✗ Error fetching article {link}: {e}")
+                return None, True
+            return article, article is None and getattr(_fetch_status, 'failed', False)
 
-            if 'br' in content_encoding:
-                try:
-                    return brotli.decompress(resp.content).decode('utf-8')
-                except:
-                    pass
+        discovering = getattr(_discovery, 'sink', None) is not None
+        # discover() (pipeline) chỉ lấy danh sách: gọi trên thread hiện tại để sink của thread nhận link
+        if total <= 1 or self.detail_workers <= 1 or discovering:
+            results = [run(i, link, args) for i, (link, args) in enumerate(calls, 1)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.detail_workers, total), thread_name_prefix='detail') as pool:
+                results = list(pool.map(lambda call: run(call[0], *call[1]), enumerate(calls, 1)))
 
-            if 'gzip' in content_encoding:
-                try:
-                    return gzip.decompress(resp.content).decode('utf-8')
-                except:
-                    pass
+        if not discovering:
+            if any(failed for _, failed in results):
+                self.discard_validators()
+            else:
+                self.commit_validators()
+        return [article for article, _ in results if article]
 
-            return resp.text
+    def discover(self, sink: Callable[[str, tuple, dict], None], **kwargs) -> List[Article]:
+        """
+        Chạy fetch_news chỉ để lấy danh sách bài (stage đầu của pipeline): mỗi lần fetch_news gọi
+        fetch_article thì (link, args, kwargs) được chuyển cho sink, không fetch trang chi tiết.
 
+        Returns:
+            Các bài fetch_news trả về luôn (nguồn lấy nội dung từ RSS, không qua fetch_article)
+        """
+        _discovery.sink = sink
+        try:
+            return self.fetch_news(**kwargs) or []
+        finally:
+            _discovery.sink = None
+
+    def prefetch(self, link: str) -> bool:
+        """
+        Fetch trước HTML trang chi tiết, lần fetch_html(link) sau (trong _fetch_article_detail) lấy lại
+        từ bộ nhớ. Tách phần chờ mạng khỏi phần parse để chạy ở hai stage khác nhau.
+
+        Returns:
+            False nếu fetch lỗi (bỏ bài, không tính là fetch hụt cho url model)
+        """
+        if link in self._metadata_items:
+            return True
+        html = self.fetch_html(link)
+        if html is None:
+            return False
+        self._prefetched[link] = html
+        return True
+
+    @staticmethod
+    def _item_link(item) -> str:
+        return item if isinstance(item, str) else item.link
+
+    def fetch_html(self, url: str, listing: bool = False) -> Optional[str]:
+        """
+        Fetch và decode HTML từ URL.
+
+        Args:
+            listing: Trang danh sách / anti-bot - không dùng response cache và không dừng ở stream_end_marker
+        """
+        if not listing:
+            html = self._prefetched.pop(url, None)
+            if html is not None:
+                return html
+
+        source = self._stats_source()
+        resolved = redirect_store.resolve(url)
+        if resolved != url:
+            scrape_stats.incr(source, 'redirect_skip')
+            url = resolved
+
+        use_cache = not listing and self.cache_ttl > 0
+        if use_cache:
+            html = response_cache.get(url, self.cache_ttl, source)
+            if html is not None:
+                return html
+
+        try:
+            html = self._fetch_streaming(url, None if listing else self.stream_end_marker)
+            if use_cache:
+                response_cache.put(url, html)
+            return html
+
+        except CircuitOpenError:
+            _fetch_status.failed = True
+            return None
         except Exception as e:
+            _fetch_status.failed = True
             print(f"✗ Error fetching {url}: {e} - multi_source_scraper.py:54")
             return None
 
+    def fetch_listing(self, url: str) -> Optional[str]:
+        """
+        Fetch trang danh sách / RSS feed với conditional GET (ETag / Last-Modified).
+
+        Returns:
+            HTML/XML, hoặc None nếu lỗi hay server trả 304 (danh sách chưa đổi -> bỏ qua cả nguồn)
+
+        ETag / Last-Modified của response 200 chỉ được giữ chờ (pending): lưu lại bằng commit_validators()
+        sau khi các bài trong danh sách đã lấy xong, để lần chạy sau không nhận 304 rồi mất các bài bị lỗi.
+        """
+        if not config.CONDITIONAL_GET:
+            return self.fetch_html(url, listing=True)
+
+        try:
+            resp = self._get(url, headers=validator_store.conditional_headers(url))
+            if resp.status_code == 304:
+                print(f"✓ Not modified (304), bỏ qua: {url}")
+                return None
+            resp.raise_for_status()
+
+            html = self._decode_response(resp)
+            self._pending_validators[url] = {key: resp.headers.get(key) for key in ('ETag', 'Last-Modified')}
+            return html
+
+        except CircuitOpenError as e:
+            print(f"⚠ {e}, bỏ qua: {url}")
+            return None
+        except Exception as e:
+            print(f"✗ Error fetching {url}: {e}")
+            return None
+
+    def commit_validators(self):
+        """
+        Lưu validator của các trang danh sách đã fetch (fetch_listing) khi bài của chúng đã lấy xong:
+        fetch_articles gọi khi không có trang chi tiết nào lỗi, pipeline / coordinator gọi sau khi xử lý nguồn.
+        Trong discover() thì không làm gì (bài chưa được fetch).
+        """
+        if getattr(_discovery, 'sink', None) is not None:
+            return
+        pending, self._pending_validators = self._pending_validators, {}
+        for url, headers in pending.items():
+            validator_store.save(url, headers)
+
+    def discard_validators(self):
+        """Bỏ validator đang chờ: có bài lỗi, lần chạy sau phải fetch lại đầy đủ danh sách"""
+        if self._pending_validators:
+            print(f"⚠ Có trang chi tiết lỗi, không lưu ETag / Last-Modified của {len(self._pending_validators)} trang danh sách")
+        self._pending_validators = {}
+
+    def _fetch_streaming(self, url: str, end_marker: Optional[str]) -> str:
+        """GET dạng stream: dừng ở end_marker hoặc max_body_bytes, rồi decode"""
+        resp = self._get(url, stream=True)
+        if resp.status_code >= 400:
+            resp.close()
+            resp.raise_for_status()
+
+        if resp.history:
+            scrape_stats.incr(self._stats_source(), 'redirect')
+            # Redirect tạm (302 / 303 / 307) không lưu: có thể là soft-404, anti-bot, A/B test
+            if is_permanent(resp.history):
+                redirect_store.record(url, str(resp.url))
+
+        content, stopped = read_body(resp, end_marker, self.max_body_bytes)
+        if stopped == 'max_bytes':
+            print(f"⚠ Body lớn hơn {self.max_body_bytes // 1024} KB, cắt bớt: {url}")
+        if stopped:
+            scrape_stats.incr(self._stats_source(), f'stream_{stopped}')
+        return self._decode_content(content, resp.headers)
+
+    def _decode_response(self, resp) -> str:
+        """Decode body của response thành text (một lượt, xem scrapers/decoding.py)"""
+        return self._decode_content(resp.content, resp.headers)
+
+    def _decode_content(self, content: bytes, headers) -> str:
+        source = self._stats_source()
+        with scrape_stats.timer(source, 'decode'):
+            text = decode_body(content, headers, self.charset)
+        scrape_stats.incr(source, 'decode')
+        scrape_stats.incr(source, 'decode_bytes', len(content))
+        return text
+
+    def _stats_source(self) -> str:
+        """Tên nguồn dùng làm key thống kê"""
+        return getattr(self, 'source', type(self).__name__)
+
+    def extract_article(self, html: str) -> Extracted:
+        """
+        Trích xuất trang chi tiết theo self.article_spec
+
+        Lấy title / date / category từ metadata <head> trước (quét regex, không dựng DOM),
+        sau đó chỉ parse các vùng spec còn cần và tìm các trường còn thiếu.
+        """
+        spec = self.article_spec
+        source = self._stats_source()
+        scrape_stats.incr(source, 'parse')
+        with scrape_stats.timer(source, 'parse'):
+            known = spec.from_head(scan_head(html)) if config.HEAD_META and spec.meta else {}
+            if known:
+                scrape_stats.incr(source, 'head_meta')
+            soup = make_soup(html, spec.regions_without(frozenset(known)))
+            article = spec.extract(soup, known)
+        if not article.content:
+            article = article._replace(content=self.fallback_content(html))
+        return article
+
+    def fallback_content(self, html: str, soup: Optional[BeautifulSoup] = None) -> str:
+        """
+        Nội dung chính theo heuristic (scrapers/readability.py) khi selector của nguồn không lấy được gì,
+        chạy trên HTML đã tải nên không tốn thêm request
+
+        Args:
+            html: HTML của trang
+            soup: Soup cả trang nếu scraper đã parse sẵn (bị sửa trong lúc trích xuất)
+        """
+        if not config.READABILITY_FALLBACK or not html:
+            return ''
+        source = self._stats_source()
+        with scrape_stats.timer(source, 'parse'):
+            content = extract_main_text(soup if soup is not None else make_soup(html))
+        scrape_stats.incr(source, 'readability' if content else 'readability_empty')
+        return content
+
+    def fetch_feed(self, url: str) -> feedparser.FeedParserDict:
+        """
+        Fetch RSS feed qua fetch_listing (rate limit + conditional GET) rồi parse bằng feedparser.
+        Link của các entry được đưa về URL chuẩn (canonical_url).
+        """
+        xml = self.fetch_listing(url)
+        feed = feedparser.parse(xml or '')
+        for entry in feed.entries:
+            if entry.get('link'):
+                entry['link'] = self.canonical_url(entry['link'])
+        return feed
+
+    def parse_published(self, value, default: int = 0) -> int:
+        """
+        Timestamp ngày xuất bản từ phần tử hoặc chuỗi (xem scrapers/dates.py).
+
+        Với phần tử HTML: ưu tiên data-time / datetime / content (meta), sau đó là text.
+        Không parse được thì trả về default và đếm lỗi theo nguồn.
+        """
+        if value is None or isinstance(value, str):
+            return parse_timestamp(value, default, self._stats_source())
+        values = [value.get(attr) for attr in ('data-time', 'datetime', 'content')]
+        values.append(value.get_text(" ", strip=True))
+        return parse_first(values, default, self._stats_source())
+
     def parse_date_to_timestamp(self, date_str: str, format_str: str) -> int:
-        """Parse date string thành Unix timestamp"""
+        """Parse date string theo format cố định thành Unix timestamp (giờ Việt Nam)"""
         try:
-            dt = datetime.strptime(date_str.strip(), format_str)
+            dt = datetime.strptime(date_str.strip(), format_str).replace(tzinfo=VN_TZ)
             return int(dt.timestamp())
-        except Exception as e:
-            print(f"⚠ Could not parse date '{date_str}': {e} - multi_source_scraper.py:63")
+        except Exception:
+            record_failure(date_str, self._stats_source())
             return 0
-
-    def sleep(self):
-        """Delay giữa các request"""
-        time.sleep(self.delay)
@@ -0,0 +1,156 @@
+"""
+Cache response HTTP trên đĩa cho fetch_html (tùy chọn, bật bằng RESPONSE_CACHE=true)
+
+- Key: URL đã chuẩn hóa (utils/urls.py: lowercase host, bỏ fragment, bỏ query tracking, sắp xếp query)
+- Body lưu dạng gzip, mỗi URL một file trong CACHE_DIR/responses
+- TTL theo nguồn (scraper.cache_ttl), tổng dung lượng giới hạn bởi RESPONSE_CACHE_MAX_MB,
+  vượt quá thì xóa các entry lâu nhất chưa được đọc (LRU theo mtime của file)
+
+Mục đích chính: chạy lại sau khi crash, hoặc các job trong scheduler_config.json chạy chồng nhau,
+thì không phải tải lại các trang chi tiết bài viết (gần như không đổi sau khi đăng).
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from config import config
+from scrapers.stats import scrape_stats
+from utils.urls import normalize_url
+
+
+class ResponseCache:
+    """Cache file-based, thread-safe, LRU theo tổng dung lượng"""
+
+    def __init__(self, directory: str, max_bytes: int, enabled: bool = True):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[Path, Tuple[int, float]]] = None  # path -> (size, last access)
+        self._total = 0
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.gz"
+
+    def _load_index(self):
+        # Quét thư mục một lần khi dùng lần đầu; mtime của file là thời điểm đọc gần nhất
+        if self._index is not None:
+            return
+        self._index = {}
+        self._total = 0
+        if self.directory.exists():
+            for path in self.directory.glob('*/*.gz'):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                self._index[path] = (st.st_size, st.st_mtime)
+                self._total += st.st_size
+
+    def _forget(self, path: Path):
+        size, _ = self._index.pop(path, (0, 0))
+        self._total -= size
+
+    def get(self, url: str, ttl: int, source: str = '') -> Optional[str]:
+        """
+        Lấy body đã cache của URL.
+
+        Returns:
+            Text đã decode, hoặc None nếu chưa cache / hết hạn (ttl giây)
+        """
+        if not self.enabled or ttl <= 0:
+            return None
+
+        path = self._path(normalize_url(url))
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError, EOFError):
+            scrape_stats.incr(source, 'cache_miss')
+            return None
+
+        if time.time() - entry.get('fetched_at', 0) > ttl:
+            scrape_stats.incr(source, 'cache_miss')
+            return None
+
+        now = time.time()
+        with self._lock:
+            self._load_index()
+            try:
+                os.utime(path, (now, now))
+                self._index[path] = (path.stat().st_size, now)
+            except OSError:
+                pass
+
+        scrape_stats.incr(source, 'cache_hit')
+        return entry.get('text')
+
+    def put(self, url: str, text: str):
+        """Ghi body vào cache rồi evict LRU nếu vượt quá dung lượng"""
+        if not self.enabled or not text:
+            return
+
+        key = normalize_url(url)
+        path = self._path(key)
+        payload = json.dumps({'url': key, 'fetched_at': int(time.time()), 'text': text}, ensure_ascii=False)
+        data = gzip.compress(payload.encode('utf-8'))
+
+        with self._lock:
+            self._load_index()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            self._forget(path)
+            self._index[path] = (len(data), time.time())
+            self._total += len(data)
+            self._evict()
+
+    def _evict(self):
+        if self._total <= self.max_bytes:
+            return
+        for path, _ in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self._total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            self._forget(path)
+
+    def size(self) -> Tuple[int, int]:
+        """(số entry, tổng số byte) hiện có trên đĩa"""
+        with self._lock:
+            self._load_index()
+            return len(self._index), self._total
+
+    def print_stats(self):
+        """In số cache hit/miss theo nguồn"""
+        if not self.enabled:
+            return
+
+        sources = scrape_stats.sources('cache_hit', 'cache_miss')
+        entries, total = self.size()
+        print(f"\n💾 Response cache: {entries} entries, {total / 1024 / 1024:.1f}/{self.max_bytes / 1024 / 1024:.0f} MB")
+        for source in sources:
+            hits = scrape_stats.count(source, 'cache_hit')
+            misses = scrape_stats.count(source, 'cache_miss')
+            ratio = hits / (hits + misses) * 100 if hits + misses else 0
+            print(f"  {source:35} hit={hits:4} miss={misses:4} ({ratio:.0f}%)")
+
+
+# Singleton dùng chung cho toàn bộ scrapers trong process
+response_cache = ResponseCache(
+    os.path.join(config.CACHE_DIR, 'responses'),
+    max_bytes=config.RESPONSE_CACHE_MAX_MB * 1024 * 1024,
+    enabled=config.RESPONSE_CACHE,
+)
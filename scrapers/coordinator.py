@@ -0,0 +1,348 @@
+"""
+Điều phối crawl nhiều node qua hàng đợi trong Postgres (bảng crawl_jobs, python main.py worker)
+
+Chạy scraper trên nhiều VM mà không điều phối thì node nào cũng quét mọi nguồn, fetch lại cùng một bài
+và tranh nhau ràng buộc unique news_title_key. Coordinator dùng chính database hiện có làm hàng đợi:
+
+- Mỗi scraper là một job kind='source'. Node nhận job bằng SELECT ... FOR UPDATE SKIP LOCKED (hai node
+  không bao giờ nhận cùng một dòng) và giữ thêm advisory lock theo nguồn trong lúc quét danh sách.
+  Nguồn đã quét xong chỉ được nhận lại sau COORDINATOR_SOURCE_INTERVAL giây.
+- Quét danh sách dùng NewsScraperBase.discover (như stage đầu của pipeline): mỗi link cần fetch trang chi
+  tiết thành một job kind='article', key = link nên INSERT ... ON CONFLICT DO NOTHING bỏ link đã có.
+- Mọi node nhận job article theo batch (SKIP LOCKED), fetch + parse + ghi DB rồi đánh dấu done. Lỗi mạng
+  thì trả job về hàng đợi sau COORDINATOR_RETRY_DELAY giây, quá COORDINATOR_MAX_ATTEMPTS lần thì failed.
+- Job nào cũng có lease (lease_until): node chết giữa chừng thì lease hết hạn và node khác nhận lại.
+  Job article hết lease ở lượt thử cuối cùng được đánh dấu failed (để purge dọn) thay vì nằm mãi ở leased.
+  Advisory lock là session-level nên cũng tự nhả khi kết nối của node chết bị đóng.
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from config import config
+from database.article import Article
+from database.models import db
+from scrapers.base import _fetch_status
+from scrapers.redirects import redirect_store
+from scrapers.seen import seen_store
+from scrapers.urlmodel import url_model
+
+_CLAIMABLE_SOURCE = """
+    kind = 'source' AND (
+        status = 'pending'
+        OR (status = 'leased' AND lease_until < now())
+        OR (status IN ('done', 'failed') AND finished_at < now() - :interval * interval '1 second')
+    )
+"""
+
+
+class Coordinator:
+    """
+    Một node crawl dùng bảng crawl_jobs làm hàng đợi chung với các node khác.
+
+    Args:
+        sources: (class scraper, kwargs của fetch_news) của các nguồn node này chạy được
+        save_to_db: Ghi bài vào bảng news
+        node: Tên node trong lease_owner (mặc định COORDINATOR_NODE hoặc hostname-pid)
+        collect: Giữ lại các bài node này đã lấy (vd để export CSV)
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[Tuple[type, dict]],
+        save_to_db: bool = True,
+        node: Optional[str] = None,
+        collect: bool = False,
+    ):
+        self.sources: Dict[str, Tuple[type, dict]] = {cls.__name__: (cls, kwargs) for cls, kwargs in sources}
+        self.save_to_db = save_to_db
+        self.collect = collect
+        self.articles: List[Article] = []
+        self.node = node or config.COORDINATOR_NODE or f"{socket.gethostname()}-{os.getpid()}"
+        self._scrapers: Dict[str, object] = {}
+        self._scrapers_lock = threading.Lock()
+        self.stats = {
+            'sources': 0, 'enqueued': 0, 'claimed': 0, 'done': 0,
+            'retried': 0, 'failed': 0, 'saved': 0, 'lock_busy': 0,
+        }
+
+    def _scraper(self, name: str):
+        """Instance scraper dùng chung trong node (fetch_article an toàn khi gọi từ nhiều thread)"""
+        # Lock để hai worker không tạo hai instance (validator / media state riêng) cho cùng một nguồn
+        with self._scrapers_lock:
+            scraper = self._scrapers.get(name)
+            if scraper is None:
+                scraper = self._scrapers[name] = self.sources[name][0]()
+            return scraper
+
+    # --- Hàng đợi ---
+
+    def register_sources(self):
+        """Tạo job source cho các nguồn chưa có trong bảng"""
+        with db.engine.begin() as conn:
+            conn.execute(
+                text("""
+                    INSERT INTO crawl_jobs (key, kind, scraper, status, attempts)
+                    VALUES (:key, 'source', :scraper, 'pending', 0)
+                    ON CONFLICT (key) DO NOTHING
+                """),
+                [{'key': f"source:{name}", 'scraper': name} for name in self.sources],
+            )
+
+    def purge(self):
+        """Xóa job article đã xong quá COORDINATOR_RETENTION_DAYS ngày (bài đã lưu vẫn được lọc bởi filter_new)"""
+        with db.engine.begin() as conn:
+            conn.execute(
+                text("""
+                    DELETE FROM crawl_jobs
+                    WHERE kind = 'article' AND status IN ('done', 'failed')
+                      AND finished_at < now() - :days * interval '1 day'
+                """),
+                {'days': config.COORDINATOR_RETENTION_DAYS},
+            )
+
+    def _claim_source(self) -> Optional[Tuple[int, str]]:
+        with db.engine.begin() as conn:
+            row = conn.execute(
+                text(f"""
+                    UPDATE crawl_jobs
+                    SET status = 'leased', lease_owner = :node,
+                        lease_until = now() + :lease * interval '1 second'
+                    WHERE id = (
+                        SELECT id FROM crawl_jobs
+                        WHERE {_CLAIMABLE_SOURCE} AND scraper = ANY(:names)
+                        ORDER BY finished_at NULLS FIRST, id
+                        LIMIT 1
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING id, scraper
+                """),
+                {
+                    'node': self.node,
+                    'lease': config.COORDINATOR_LEASE,
+                    'interval': config.COORDINATOR_SOURCE_INTERVAL,
+                    'names': list(self.sources),
+                },
+            ).first()
+        return (row.id, row.scraper) if row else None
+
+    def _finish(self, ids: List[int]):
+        if not ids:
+            return
+        with db.engine.begin() as conn:
+            conn.execute(
+                text("""
+                    UPDATE crawl_jobs
+                    SET status = 'done', finished_at = now(), lease_owner = NULL, lease_until = NULL
+                    WHERE id = ANY(:ids)
+                """),
+                {'ids': ids},
+            )
+
+    def _retry(self, ids: List[int]):
+        """Trả job về hàng đợi sau COORDINATOR_RETRY_DELAY giây, hết lượt thử thì failed"""
+        if not ids:
+            return
+        with db.engine.begin() as conn:
+            conn.execute(
+                text("""
+                    UPDATE crawl_jobs
+                    SET status = CASE WHEN attempts >= :max_attempts THEN 'failed' ELSE 'pending' END,
+                        finished_at = CASE WHEN attempts >= :max_attempts THEN now() END,
+                        lease_owner = NULL,
+                        lease_until = now() + :delay * interval '1 second'
+                    WHERE id = ANY(:ids)
+                """),
+                {'ids': ids, 'max_attempts': config.COORDINATOR_MAX_ATTEMPTS, 'delay': config.COORDINATOR_RETRY_DELAY},
+            )
+
+    def _enqueue(self, scraper_name: str, jobs: List[Tuple[str, tuple]]):
+        if not jobs:
+            return
+        with db.engine.begin() as conn:
+            conn.execute(
+                text("""
+                    INSERT INTO crawl_jobs (key, kind, scraper, link, args, status, attempts)
+                    VALUES (:key, 'article', :scraper, :link, :args, 'pending', 0)
+                    ON CONFLICT (key) DO NOTHING
+                """),
+                [
+                    {'key': link, 'scraper': scraper_name, 'link': link, 'args': json.dumps(list(args), ensure_ascii=False)}
+                    for link, args in jobs
+                ],
+            )
+        self.stats['enqueued'] += len(jobs)
+
+    def _claim_articles(self) -> list:
+        with db.engine.begin() as conn:
+            # Lease hết hạn ở lượt thử cuối (node chết giữa chừng): không nhận lại được nữa nên đánh dấu failed
+            self.stats['failed'] += conn.execute(
+                text("""
+                    UPDATE crawl_jobs
+                    SET status = 'failed', finished_at = now(), lease_owner = NULL, lease_until = NULL
+                    WHERE kind = 'article' AND status = 'leased' AND lease_until < now()
+                      AND attempts >= :max_attempts
+                """),
+                {'max_attempts': config.COORDINATOR_MAX_ATTEMPTS},
+            ).rowcount
+            return conn.execute(
+                text("""
+                    UPDATE crawl_jobs
+                    SET status = 'leased', lease_owner = :node,
+                        lease_until = now() + :lease * interval '1 second', attempts = attempts + 1
+                    WHERE id IN (
+                        SELECT id FROM crawl_jobs
+                        WHERE kind = 'article' AND status IN ('pending', 'leased')
+                          AND (lease_until IS NULL OR lease_until < now())
+                          AND attempts < :max_attempts AND scraper = ANY(:names)
+                        ORDER BY id
+                        LIMIT :batch
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING id, scraper, link, args
+                """),
+                {
+                    'node': self.node,
+                    'lease': config.COORDINATOR_LEASE,
+                    'max_attempts': config.COORDINATOR_MAX_ATTEMPTS,
+                    'names': list(self.sources),
+                    'batch': config.COORDINATOR_BATCH,
+                },
+            ).fetchall()
+
+    def _sources_in_progress(self) -> int:
+        """Số nguồn node khác đang quét (lease còn hạn) - job article của chúng sắp được thêm vào hàng đợi"""
+        with db.engine.connect() as conn:
+            return conn.execute(
+                text("SELECT count(*) FROM crawl_jobs WHERE kind = 'source' AND status = 'leased' AND lease_until > now()")
+            ).scalar()
+
+    # --- Xử lý job ---
+
+    def _persist(self, article: Article):
+        if self.save_to_db and db.insert_article(article):
+            self.stats['saved'] += 1
+        # Ghi nhận URL đã lấy (kể cả khi DB lỗi) để lần chạy sau không fetch lại
+        seen_store.add(article.source, [article.link])
+        if self.collect:
+            self.articles.append(article)
+
+    def _discover(self, job_id: int, name: str):
+        """Quét danh sách của một nguồn (giữ advisory lock của nguồn), đưa link cần fetch vào hàng đợi"""
+        # AUTOCOMMIT: kết nối giữ lock không nằm "idle in transaction" suốt lúc quét danh sách (chặn vacuum,
+        # bị idle_in_transaction_session_timeout cắt); advisory lock session-level không cần transaction
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as lock_conn:
+            lock_key = f"crawl_jobs:source:{name}"
+            locked = lock_conn.execute(text("SELECT pg_try_advisory_lock(hashtext(:key))"), {'key': lock_key}).scalar()
+            if not locked:
+                # Node khác vẫn đang quét nguồn này (lease của nó đã hết hạn nhưng chưa xong)
+                self.stats['lock_busy'] += 1
+                return
+            try:
+                print(f"\n🛰 [{self.node}] Quét danh sách: {name}")
+                scraper = self._scraper(name)
+                links: List[Tuple[str, tuple]] = []
+                articles = scraper.discover(lambda link, args, kw: links.append((link, args)), **self.sources[name][1])
+
+                # Bài chỉ lưu metadata (media_policy) có sẵn dữ liệu trên node này, không đưa vào hàng đợi
+                jobs = []
+                for link, args in links:
+                    if link in scraper._metadata_items:
+                        articles.append(scraper.fetch_article(link))
+                    else:
+                        jobs.append((link, args))
+
+                for article in articles:
+                    self._persist(article)
+                self._enqueue(name, jobs)
+                # Link đã nằm trong hàng đợi (bền trong DB): lưu validator của trang danh sách được rồi
+                scraper.commit_validators()
+                self._finish([job_id])
+                self.stats['sources'] += 1
+            except Exception as e:
+                # Giữ nguyên lease: hết hạn thì nguồn được nhận lại (bởi node này hoặc node khác)
+                print(f"✗ [{self.node}] Lỗi khi quét {name}: {e}")
+                if name in self._scrapers:
+                    self._scrapers[name].discard_validators()
+            finally:
+                lock_conn.execute(text("SELECT pg_advisory_unlock(hashtext(:key))"), {'key': lock_key})
+
+    def _fetch_job(self, job) -> Tuple[int, Optional[Article], bool]:
+        """(id, bài hoặc None, có lỗi mạng cần thử lại không)"""
+        try:
+            scraper = self._scraper(job.scraper)
+            article = scraper.fetch_article(job.link, *json.loads(job.args or '[]'))
+        except Exception as e:
+            print(f"✗ Error fetching article {job.link}: {e}")
+            return job.id, None, True
+        return job.id, article, article is None and getattr(_fetch_status, 'failed', False)
+
+    def _process_articles(self, jobs: list):
+        self.stats['claimed'] += len(jobs)
+        with ThreadPoolExecutor(max_workers=max(1, min(config.DETAIL_WORKERS, len(jobs))), thread_name_prefix='job') as pool:
+            results = list(pool.map(self._fetch_job, jobs))
+
+        done, retry = [], []
+        for job_id, article, failed in results:
+            if failed:
+                retry.append(job_id)
+                continue
+            if article is not None:
+                self._persist(article)
+            done.append(job_id)  # Trang không ra bài (không phải bài viết) cũng xong, không fetch lại
+
+        self._finish(done)
+        self._retry(retry)
+        self.stats['done'] += len(done)
+        self.stats['retried'] += len(retry)
+
+    def run(self, forever: bool = False):
+        """
+        Nhận và xử lý job tới khi hàng đợi hết việc (và không node nào còn đang quét danh sách).
+
+        Args:
+            forever: Không dừng khi hết việc, chờ COORDINATOR_POLL giây rồi nhận tiếp
+        """
+        self.register_sources()
+        self.purge()
+
+        while True:
+            source = self._claim_source()
+            if source:
+                self._discover(*source)
+                continue
+
+            jobs = self._claim_articles()
+            if jobs:
+                self._process_articles(jobs)
+                continue
+
+            if not forever and not self._sources_in_progress():
+                break
+            # Hết việc: ghi các store xuống đĩa trong lúc chờ (forever=True không có "cuối lần chạy")
+            self._flush_stores()
+            time.sleep(config.COORDINATOR_POLL)
+
+        self._flush_stores()
+
+    @staticmethod
+    def _flush_stores():
+        seen_store.flush()
+        redirect_store.flush()
+        url_model.flush()
+
+    def print_stats(self):
+        """In số job node này đã xử lý"""
+        s = self.stats
+        print(f"\n🛰 Coordinator [{self.node}]:")
+        print(
+            f"  sources={s['sources']:4} enqueued={s['enqueued']:5} claimed={s['claimed']:5} done={s['done']:5} "
+            f"retried={s['retried']:4} failed={s['failed']:4} saved={s['saved']:5} lock_busy={s['lock_busy']:3}"
+        )
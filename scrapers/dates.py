@@ -0,0 +1,187 @@
+"""
+Parse ngày xuất bản của các báo Việt Nam thành Unix timestamp
+
+Các dạng đã gặp:
+- ISO (meta article:published_time, <time datetime>): "2026-01-01T21:35:00+07:00", "2026-01-02T08:00:11+0700"
+- Unix timestamp (data-time): "1767315611"
+- Ngày/tháng/năm kèm giờ, thứ trong tuần, GMT...:
+  "Thứ hai, 29/12/2025, 15:50 (GMT+7)", "Thứ Hai, 16:54, 29/12/2025", "29-12-2025 - 16:16 PM",
+  "31/12/2025 9:05 PM", "02/01/2026 11:02:40", "01-01-2026 21:11:44+07:00", "03/01/2026"
+
+Chuỗi không có múi giờ được hiểu theo giờ Việt Nam (Asia/Ho_Chi_Minh, UTC+7, không có DST),
+không phụ thuộc timezone của máy chạy scraper. Timestamp được tính bằng số học (cache theo ngày),
+không tạo datetime cho mỗi chuỗi. Lỗi parse được đếm theo nguồn (print_date_stats) thay vì in ra.
+"""
+
+import calendar
+import functools
+import re
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from scrapers.stats import scrape_stats
+
+try:
+    from zoneinfo import ZoneInfo
+    VN_TZ = ZoneInfo('Asia/Ho_Chi_Minh')
+except Exception:  # Python < 3.9 hoặc thiếu tzdata
+    VN_TZ = timezone(timedelta(hours=7), 'Asia/Ho_Chi_Minh')
+
+VN_OFFSET = 7 * 3600  # Asia/Ho_Chi_Minh cố định UTC+7 từ 1975
+
+# Số mẫu chuỗi lỗi giữ lại mỗi nguồn để debug
+FAILED_SAMPLES = 5
+
+_WEEKDAY_RE = re.compile(
+    r'^\s*(?:thứ\s*(?:hai|ba|tư|năm|sáu|bảy|[2-7])|chủ\s*nhật|cn|t[2-7])\b\s*[,-]?\s*',
+    re.I,
+)
+_ISO_RE = re.compile(
+    r'^\s*(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2}))?(?:\.\d+)?\s*(Z|[+-]\d{2}:?\d{2})?)?'
+)
+# Epoch giây (9-10 chữ số) hoặc mili giây (12-13 chữ số); 11 chữ số không phải epoch
+_EPOCH_RE = re.compile(r'^\s*(\d{9,10}|\d{12,13})\s*$')
+_DMY_RE = re.compile(r'(?<!\d)(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})(?!\d)')
+_TIME_RE = re.compile(r'(?<!\d)(\d{1,2}):(\d{2})(?::(\d{2}))?(?:\s*([AaPp])[Mm]\b)?')
+
+# Các dạng ngày thực tế của các nguồn (benchmark_parsers.py dates, tests/test_dates.py)
+DATE_SAMPLES = [
+    "2026-01-01T21:35:00+07:00",            # meta article:published_time
+    "2026-01-02T08:00:11+0700",             # tinnhanhchungkhoan <time datetime>
+    "1767315611",                           # data-time
+    "Thứ hai, 29/12/2025, 15:50 (GMT+7)",   # vnexpress
+    "Thứ Hai, 16:54, 29/12/2025",           # vov
+    "29-12-2025 - 16:16 PM",                # cafef
+    "31/12/2025 9:05 PM",                   # cafeland
+    "Thứ Sáu, 26/12/2025 - 22:10",          # vietnamnet
+    "02/01/2026 11:02:40",                  # antt
+    "01-01-2026 21:11:44+07:00",            # vietstock
+    "Chủ nhật, 04/01/2026",                 # qdnd
+    "01/01/2026, 10:52",                    # taichinhdoanhnghiep
+]
+
+_failed_lock = threading.Lock()
+_failed: Dict[str, List[str]] = defaultdict(list)
+
+
+@functools.lru_cache(maxsize=8192)
+def _day_start(year: int, month: int, day: int) -> int:
+    """Timestamp 00:00 UTC của ngày (raise ValueError nếu ngày không hợp lệ)"""
+    datetime(year, month, day)
+    return calendar.timegm((year, month, day, 0, 0, 0))
+
+
+def _offset_seconds(tz: str) -> int:
+    if tz == 'Z':
+        return 0
+    sign = -1 if tz[0] == '-' else 1
+    digits = tz[1:].replace(':', '')
+    return sign * (int(digits[:2]) * 3600 + int(digits[2:4]) * 60)
+
+
+def _parse(text: str) -> Optional[int]:
+    match = _ISO_RE.match(text)
+    if match:
+        year, month, day, hour, minute, second, tz = match.groups()
+        ts = _day_start(int(year), int(month), int(day))
+        if hour is not None:
+            ts += int(hour) * 3600 + int(minute) * 60 + int(second or 0)
+        return ts - (_offset_seconds(tz) if tz else VN_OFFSET)
+
+    match = _EPOCH_RE.match(text)
+    if match:
+        value = match.group(1)
+        return int(value) // 1000 if len(value) >= 12 else int(value)
+
+    text = _WEEKDAY_RE.sub('', text, count=1)
+    date = _DMY_RE.search(text)
+    if not date:
+        return None
+    day, month, year = date.groups()
+    ts = _day_start(int(year), int(month), int(day)) - VN_OFFSET
+
+    # Giờ có thể đứng trước ngày (VOV) hoặc sau ngày
+    time = _TIME_RE.search(text, date.end()) or _TIME_RE.search(text, 0, date.start())
+    if time:
+        hour, minute, second, period = time.groups()
+        hour = int(hour)
+        if period in ('p', 'P') and hour < 12:
+            hour += 12
+        elif period in ('a', 'A') and hour == 12:
+            hour = 0
+        if hour > 23 or int(minute) > 59:
+            return None
+        ts += hour * 3600 + int(minute) * 60 + int(second or 0)
+    return ts
+
+
+def _try_parse(text: Optional[str]) -> Optional[int]:
+    if not text:
+        return None
+    try:
+        return _parse(text)
+    except (ValueError, OverflowError):
+        return None
+
+
+def parse_timestamp(text: Optional[str], default: int = 0, source: Optional[str] = None) -> int:
+    """
+    Parse chuỗi ngày xuất bản.
+
+    Args:
+        text: Chuỗi ngày (các dạng ở docstring module)
+        default: Giá trị trả về khi không parse được
+        source: Nguồn, dùng để đếm lỗi
+    """
+    ts = _try_parse(text)
+    if ts is None:
+        record_failure(text, source)
+        return default
+    return ts
+
+
+def parse_first(values: Iterable[Optional[str]], default: int = 0, source: Optional[str] = None) -> int:
+    """Parse giá trị đầu tiên hợp lệ (vd attr datetime rồi tới text), chỉ đếm lỗi khi tất cả đều hỏng"""
+    last = None
+    for text in values:
+        ts = _try_parse(text)
+        if ts is not None:
+            return ts
+        last = text or last
+    record_failure(last, source)
+    return default
+
+
+def record_failure(text: Optional[str], source: Optional[str] = None):
+    """Đếm một chuỗi ngày không parse được"""
+    source = source or 'unknown'
+    scrape_stats.incr(source, 'date_fail')
+    with _failed_lock:
+        samples = _failed[source]
+        if len(samples) < FAILED_SAMPLES:
+            samples.append((text or '')[:80])
+
+
+def from_struct_time(value, default: int = 0) -> int:
+    """Timestamp từ time.struct_time UTC của feedparser (published_parsed)"""
+    if not value:
+        return default
+    return calendar.timegm(value)
+
+
+def print_date_stats():
+    """In số chuỗi ngày không parse được theo nguồn (kèm vài mẫu)"""
+    sources = scrape_stats.sources('date_fail')
+    if not sources:
+        return
+
+    with _failed_lock:
+        failed = dict(_failed)
+        _failed.clear()
+
+    print("\n📅 Date parse failures:")
+    for source in sources:
+        print(f"  {source:35} failed={scrape_stats.count(source, 'date_fail'):4}  vd: {failed.get(source, [])}")
@@ -0,0 +1,87 @@
+"""
+Decode body HTTP thành text trong một lượt
+
+requests/httpx đã tự giải nén gzip/deflate/br theo Content-Encoding, nên ở đây chỉ giải nén
+khi body vẫn còn là gzip (server nén hai lần hoặc thiếu header). Charset được chọn theo thứ tự:
+override của nguồn -> charset trong Content-Type -> thẻ <meta> -> utf-8, rồi decode đúng một lần
+(không dùng chardet như resp.text).
+"""
+
+import codecs
+import gzip
+import re
+from typing import Optional
+
+from scrapers.stats import scrape_stats
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Chỉ tìm thẻ meta trong phần đầu document
+META_SCAN_BYTES = 4096
+_HEADER_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+
+
+def _valid_charset(name) -> Optional[str]:
+    if not name:
+        return None
+    if isinstance(name, bytes):
+        name = name.decode('ascii', errors='ignore')
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+def header_charset(content_type: str) -> Optional[str]:
+    """Charset khai báo trong header Content-Type (None nếu không có)"""
+    match = _HEADER_CHARSET_RE.search(content_type or '')
+    return _valid_charset(match.group(1)) if match else None
+
+
+def meta_charset(content: bytes) -> Optional[str]:
+    """Charset khai báo trong <meta charset> / <meta http-equiv="Content-Type">"""
+    match = _META_CHARSET_RE.search(content[:META_SCAN_BYTES])
+    return _valid_charset(match.group(1)) if match else None
+
+
+def decode_body(content: bytes, headers, charset: Optional[str] = None) -> str:
+    """
+    Decode body của response.
+
+    Args:
+        content: Body (bytes) đã được HTTP client giải nén
+        headers: Header của response
+        charset: Override của nguồn (dùng cho server khai báo sai encoding)
+    """
+    if content[:2] == GZIP_MAGIC:
+        try:
+            content = gzip.decompress(content)
+        except (OSError, EOFError):
+            pass
+
+    encoding = (
+        _valid_charset(charset)
+        or header_charset(headers.get('Content-Type', ''))
+        or meta_charset(content)
+        or 'utf-8'
+    )
+    return content.decode(encoding, errors='replace')
+
+
+def print_decode_stats():
+    """In thời gian decode theo nguồn"""
+    sources = scrape_stats.sources('decode')
+    if not sources:
+        return
+
+    print("\n🔤 Decode time:")
+    for source in sources:
+        pages = scrape_stats.count(source, 'decode')
+        seconds = scrape_stats.seconds(source, 'decode')
+        kb = scrape_stats.count(source, 'decode_bytes') / 1024
+        early_stops = scrape_stats.count(source, 'stream_end_marker')
+        print(
+            f"  {source:35} pages={pages:4} size={kb:8.0f} KB time={seconds * 1000:7.1f} ms "
+            f"early_stop={early_stops:4}"
+        )
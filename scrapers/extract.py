@@ -0,0 +1,304 @@
+"""
+Trích xuất trang chi tiết theo spec khai báo (ArticleSpec)
+
+Mỗi nguồn mô tả trang chi tiết bằng dữ liệu: chuỗi selector fallback cho title / date / category /
+sapo / body, thẻ nào trong body là đoạn văn, vùng rác cần bỏ qua, separator... Spec được compile một
+lần lúc import: selector được compile sẵn (soupsieve) kèm bộ lọc nhanh theo tên tag / class / id của
+phần cuối selector, sau đó extract() duyệt cây đúng một lượt để lấy tất cả các trường.
+
+Spec cũng suy ra các vùng cần parse (regions) cho targeted parse, xem utils/html_parser.py.
+
+Tầng đầu tiên là metadata trong <head> (og/article meta, JSON-LD, xem scrapers/head.py): trường nào
+đã có ở đó thì không tìm trong DOM nữa, vùng của nó cũng không cần parse.
+"""
+
+import re
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import soupsieve as sv
+from bs4 import BeautifulSoup, Tag
+
+from scrapers.stats import scrape_stats
+from utils.html_parser import Region
+
+_COMBINATOR_RE = re.compile(r'\s*[>+~]\s*|\s+')
+_ATTR_RE = re.compile(r'\[[^\]]*\]')
+_TAG_RE = re.compile(r'^([\w-]+)')
+_CLASS_RE = re.compile(r'\.([\w-]+)')
+_ID_RE = re.compile(r'#([\w-]+)')
+
+# Key trong <head> (scan_head) cho từng trường, theo thứ tự ưu tiên.
+# Category không có mặc định: mỗi nguồn chọn breadcrumb / chuyên mục riêng.
+DEFAULT_META = {
+    'title': ('ld:headline',),
+    'date': ('article:published_time', 'ld:datepublished'),
+}
+
+
+class Extracted(NamedTuple):
+    """Kết quả trích xuất một trang chi tiết"""
+    title: str
+    date: Union[Tag, str, None]  # Chuỗi ngày từ <head> hoặc phần tử chứa ngày (parse_published)
+    category: str
+    content: str
+    extra: Dict[str, Tag]
+
+
+class _Selector:
+    """Selector đã compile, lọc nhanh bằng tag / class / id của compound cuối trước khi match đầy đủ"""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self._pattern = sv.compile(selector)
+        last = _ATTR_RE.sub('', _COMBINATOR_RE.split(selector.strip())[-1])
+        tag = _TAG_RE.match(last)
+        self._tag = tag.group(1).lower() if tag else None
+        self._classes = _CLASS_RE.findall(last)
+        ids = _ID_RE.findall(last)
+        self._id = ids[0] if ids else None
+
+    def match(self, tag: Tag) -> bool:
+        if self._tag and tag.name != self._tag:
+            return False
+        if self._id and tag.get('id') != self._id:
+            return False
+        if self._classes:
+            classes = tag.get('class') or ()
+            if not all(c in classes for c in self._classes):
+                return False
+        return self._pattern.match(tag)
+
+
+def _region_of(selector: str) -> Optional[str]:
+    """Compound đầu tiên của selector (vùng chứa phần tử), None nếu không dùng được cho SoupStrainer"""
+    first = _COMBINATOR_RE.split(selector.strip())[0]
+    try:
+        Region(first)
+    except ValueError:
+        return None
+    return first
+
+
+def _chain(selectors) -> Tuple[str, ...]:
+    if not selectors:
+        return ()
+    if isinstance(selectors, str):
+        return (selectors,)
+    return tuple(selectors)
+
+
+class ArticleSpec:
+    """
+    Mô tả trang chi tiết của một nguồn.
+
+    Mỗi trường nhận một selector hoặc list selector fallback (selector đầu tiên có kết quả được dùng).
+
+    Args:
+        title, date, category, sapo: Selector của từng trường
+        body: Container nội dung; container đầu tiên cho ra nội dung khác rỗng được dùng
+        paragraphs: Selector đơn (tag / class) của các đoạn văn trong body
+        fallback_paragraphs: Dùng khi body không có đoạn nào (vd figcaption của bài ảnh)
+        noise: Vùng rác trong body (quảng cáo, tin liên quan...), đoạn văn bên trong bị bỏ qua
+        category_index: Lấy kết quả thứ n của selector category (breadcrumb: 1 = bỏ "Trang chủ")
+        category_attr: Attr dùng khi phần tử category không có text (vd 'content' của thẻ meta)
+        date_pattern: Regex mà text của phần tử ngày phải khớp (dùng khi selector ngày quá chung)
+        min_paragraph_length: Bỏ đoạn ngắn hơn
+        skip_phrases: Bỏ đoạn chứa một trong các cụm từ (không phân biệt hoa thường)
+        unique: Bỏ đoạn trùng lặp
+        separator: Chuỗi nối sapo + các đoạn
+        extra: {tên: selector} các phần tử bổ sung nguồn cần (trả về trong Extracted.extra)
+        meta: {trường: key trong <head>} ghi đè DEFAULT_META (title / date / category), () = chỉ dùng DOM
+    """
+
+    def __init__(
+        self,
+        title=(),
+        date=(),
+        category=(),
+        sapo=(),
+        body=(),
+        paragraphs: Sequence[str] = ('p',),
+        fallback_paragraphs: Sequence[str] = (),
+        noise: Sequence[str] = (),
+        category_index: int = 0,
+        category_attr: Optional[str] = None,
+        date_pattern: Optional[str] = None,
+        min_paragraph_length: int = 1,
+        skip_phrases: Sequence[str] = (),
+        unique: bool = False,
+        separator: str = ' ',
+        extra: Optional[Dict[str, Sequence[str]]] = None,
+        meta: Optional[Dict[str, Sequence[str]]] = None,
+    ):
+        self.category_index = category_index
+        self.category_attr = category_attr
+        self.date_pattern = re.compile(date_pattern) if date_pattern else None
+        self.min_paragraph_length = max(1, min_paragraph_length)
+        self.skip_phrases = tuple(phrase.lower() for phrase in skip_phrases)
+        self.unique = unique
+        self.separator = separator
+        self.meta = {
+            name: keys for name, keys in {**DEFAULT_META, **{k: _chain(v) for k, v in (meta or {}).items()}}.items()
+            if keys
+        }
+
+        fields = {'title': title, 'date': date, 'category': category, 'sapo': sapo}
+        for name, selectors in (extra or {}).items():
+            fields[f'extra:{name}'] = selectors
+        # (trường, độ ưu tiên, selector)
+        self._fields: List[Tuple[str, int, _Selector]] = [
+            (name, priority, _Selector(selector))
+            for name, selectors in fields.items()
+            for priority, selector in enumerate(_chain(selectors))
+        ]
+        self._body = [_Selector(selector) for selector in _chain(body)]
+        self._noise = [_Selector(selector) for selector in noise]
+        self._paragraphs = [Region(selector) for selector in paragraphs]
+        self._fallback_paragraphs = [Region(selector) for selector in fallback_paragraphs]
+
+        self._regions: Dict[FrozenSet[str], Optional[List[str]]] = {}
+        self.regions = self.regions_without(frozenset())
+
+    def regions_without(self, known: FrozenSet[str]) -> Optional[List[str]]:
+        """Các vùng cần parse khi các trường `known` đã có từ <head> (None = parse cả trang)"""
+        if known not in self._regions:
+            selectors = [s.selector for name, _, s in self._fields if name not in known]
+            selectors += [s.selector for s in self._body]
+            regions = [_region_of(selector) for selector in selectors]
+            # Có selector không suy ra được vùng thì phải parse cả trang
+            self._regions[known] = None if None in regions else list(dict.fromkeys(regions))
+        return self._regions[known]
+
+    def from_head(self, head: Dict[str, str]) -> Dict[str, str]:
+        """Các trường lấy được từ metadata <head> (kết quả của scan_head)"""
+        found = {}
+        for name, keys in self.meta.items():
+            for key in keys:
+                if head.get(key):
+                    found[name] = head[key]
+                    break
+        return found
+
+    @staticmethod
+    def _is(regions: List[Region], tag: Tag) -> bool:
+        return any(region.match(tag.name, tag.attrs) for region in regions)
+
+    def _accept(self, text: str) -> bool:
+        if len(text) < self.min_paragraph_length:
+            return False
+        if self.skip_phrases:
+            lowered = text.lower()
+            return not any(phrase in lowered for phrase in self.skip_phrases)
+        return True
+
+    def extract(self, soup: BeautifulSoup, known: Optional[Dict[str, str]] = None) -> Extracted:
+        """Duyệt cây một lượt, lấy các trường theo spec (trừ các trường đã có trong `known`)"""
+        known = known or {}
+        fields = [field for field in self._fields if field[0] not in known]
+        best: Dict[str, Tuple[int, Tag]] = {}  # trường -> (độ ưu tiên, phần tử)
+        counts: Dict[int, int] = {}  # selector category -> số lần khớp
+        bodies: List[Optional[list]] = [None] * len(self._body)  # đoạn văn theo từng container
+        fallbacks: List[list] = [[] for _ in self._body]
+
+        stack = [(child, (), False) for child in reversed(soup.contents) if isinstance(child, Tag)]
+        while stack:
+            tag, active, noisy = stack.pop()
+
+            for index, (name, priority, selector) in enumerate(fields):
+                found = best.get(name)
+                if found is not None and found[0] <= priority:
+                    continue
+                if not selector.match(tag):
+                    continue
+                if name == 'category' and self.category_index:
+                    counts[index] = counts.get(index, 0) + 1
+                    if counts[index] != self.category_index + 1:
+                        continue
+                if name == 'date' and self.date_pattern and not self.date_pattern.search(tag.get_text(strip=True)):
+                    continue
+                best[name] = (priority, tag)
+
+            for i, selector in enumerate(self._body):
+                if bodies[i] is None and selector.match(tag):
+                    bodies[i] = []
+                    active = active + (i,)
+
+            if active and not noisy:
+                if any(selector.match(tag) for selector in self._noise):
+                    noisy = True
+                else:
+                    for regions, target in ((self._paragraphs, bodies), (self._fallback_paragraphs, fallbacks)):
+                        if regions and self._is(regions, tag):
+                            text = tag.get_text(strip=True)
+                            if self._accept(text):
+                                for i in active:
+                                    target[i].append(text)
+
+            for child in reversed(tag.contents):
+                if isinstance(child, Tag):
+                    stack.append((child, active, noisy))
+
+        def element(name: str) -> Optional[Tag]:
+            found = best.get(name)
+            return found[1] if found else None
+
+        title_el = element('title')
+        sapo_el = element('sapo')
+        category_el = element('category')
+
+        category = known.get('category', '')
+        if not category and category_el is not None:
+            category = category_el.get_text(strip=True)
+            if not category and self.category_attr:
+                category = (category_el.get(self.category_attr) or '').strip()
+
+        content = ''
+        for i in range(len(self._body)):
+            parts = bodies[i] or fallbacks[i]
+            if parts:
+                content = self._join(sapo_el, parts)
+                break
+        else:
+            if sapo_el is not None:
+                content = self._join(sapo_el, [])
+
+        extra = {
+            name[len('extra:'):]: el
+            for name, (_, el) in best.items()
+            if name.startswith('extra:')
+        }
+        return Extracted(
+            title=known.get('title') or (title_el.get_text(strip=True) if title_el is not None else ''),
+            date=known.get('date') or element('date'),
+            category=category,
+            content=content,
+            extra=extra,
+        )
+
+    def _join(self, sapo_el: Optional[Tag], parts: List[str]) -> str:
+        texts = []
+        if sapo_el is not None:
+            sapo = sapo_el.get_text(strip=True)
+            if sapo:
+                texts.append(sapo)
+        for text in parts:
+            if self.unique and text in texts:
+                continue
+            texts.append(text)
+        return self.separator.join(texts).strip()
+
+
+def print_parse_stats():
+    """In thời gian parse + trích xuất trang chi tiết theo nguồn"""
+    sources = scrape_stats.sources('parse')
+    if not sources:
+        return
+
+    print("\n🧩 Parse time:")
+    for source in sources:
+        pages = scrape_stats.count(source, 'parse')
+        seconds = scrape_stats.seconds(source, 'parse')
+        per_page = seconds / pages * 1000 if pages else 0
+        head = scrape_stats.count(source, 'head_meta')
+        print(f"  {source:35} pages={pages:4} head_meta={head:4} time={seconds * 1000:8.1f} ms "
+              f"avg={per_page:6.1f} ms/page")
@@ -0,0 +1,89 @@
+"""
+Đọc metadata bài viết từ <head> bằng regex, không dựng DOM
+
+Hầu hết các báo đều có og:title, article:published_time, article:section và block JSON-LD
+NewsArticle trong <head>. Quét phần đầu document (tới </head> hoặc <body>) đủ để lấy các trường
+này, ArticleSpec chỉ phải tìm trong DOM những trường còn thiếu (xem scrapers/extract.py).
+
+Key trả về:
+- Thẻ meta: giá trị property / name / itemprop viết thường, vd 'og:title', 'article:published_time'
+- JSON-LD (NewsArticle, Article...): 'ld:headline', 'ld:datepublished', 'ld:articlesection',
+  'ld:description', 'ld:author'
+"""
+
+import html as html_lib
+import json
+import re
+from typing import Dict
+
+# Không tìm thấy </head> thì chỉ quét chừng này ký tự đầu
+HEAD_SCAN_LIMIT = 200_000
+
+LD_TYPES = {'NewsArticle', 'Article', 'ReportageNewsArticle', 'AnalysisNewsArticle', 'BlogPosting'}
+LD_FIELDS = ('headline', 'datePublished', 'articleSection', 'description', 'author')
+
+_HEAD_END_RE = re.compile(r'</head\s*>|<body[\s>]', re.I)
+_META_RE = re.compile(r'<meta\s([^>]*)>', re.I)
+_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+_LD_RE = re.compile(r'<script[^>]*application/ld\+json[^>]*>(.*?)</script\s*>', re.I | re.S)
+
+
+def _head(html: str) -> str:
+    end = _HEAD_END_RE.search(html, 0, HEAD_SCAN_LIMIT)
+    return html[:end.start()] if end else html[:HEAD_SCAN_LIMIT]
+
+
+def _text(value) -> str:
+    """Giá trị JSON-LD dạng chuỗi (list lấy phần tử đầu, object lấy 'name')"""
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    if isinstance(value, dict):
+        value = value.get('name', '')
+    return html_lib.unescape(str(value)).strip()
+
+
+def _ld_articles(data):
+    """Các object kiểu bài viết trong một block JSON-LD (kể cả trong list / @graph)"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _ld_articles(item)
+    elif isinstance(data, dict):
+        types = data.get('@type')
+        if isinstance(types, str):
+            types = [types]
+        if LD_TYPES.intersection(types or ()):
+            yield data
+        if '@graph' in data:
+            yield from _ld_articles(data['@graph'])
+
+
+def scan_head(html: str) -> Dict[str, str]:
+    """Metadata trong <head>: {key: giá trị}, giá trị đầu tiên khác rỗng của mỗi key được giữ"""
+    head = _head(html)
+    result: Dict[str, str] = {}
+
+    for match in _META_RE.finditer(head):
+        attrs = {}
+        for name, dq, sq, bare in _ATTR_RE.findall(match.group(1)):
+            attrs[name.lower()] = dq or sq or bare
+        key = attrs.get('property') or attrs.get('name') or attrs.get('itemprop')
+        content = attrs.get('content')
+        if key and content:
+            key = key.lower()
+            if key not in result:
+                result[key] = html_lib.unescape(content).strip()
+
+    for match in _LD_RE.finditer(head):
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            continue
+        for article in _ld_articles(data):
+            for field in LD_FIELDS:
+                key = f'ld:{field.lower()}'
+                if key not in result and article.get(field):
+                    value = _text(article[field])
+                    if value:
+                        result[key] = value
+
+    return result
@@ -0,0 +1,68 @@
+"""
+Giới hạn request đồng thời theo host cho các scrapers
+
+- HostLimiter: giới hạn số request đang chạy (in-flight) trên mỗi host, dùng chung toàn process
+  (scrape_all chạy nhiều nguồn song song, fetch_articles chạy nhiều trang chi tiết song song)
+"""
+
+import threading
+from typing import Callable, Dict
+from urllib.parse import urlparse
+
+from config import config
+
+
+def host_of(url: str) -> str:
+    """Lấy host (đã lowercase, bỏ www.) từ URL"""
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class HostLimiter:
+    """
+    Giới hạn số request đồng thời cho từng host (threading semaphore, dùng chung mọi thread).
+    Với response stream, slot được giữ tới khi body đọc xong và response đóng (release_on_close).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+    def _semaphore(self, host: str, limit: int) -> threading.BoundedSemaphore:
+        # Limit được chốt bởi scraper đầu tiên đăng ký host đó
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(max(1, limit))
+                self._semaphores[host] = sem
+            return sem
+
+    def acquire(self, url: str, limit: int = None) -> Callable[[], None]:
+        """Chờ lấy một slot của host, trả về hàm nhả slot (gọi nhiều lần chỉ nhả một lần)"""
+        sem = self._semaphore(host_of(url), limit or config.MAX_IN_FLIGHT_PER_HOST)
+        sem.acquire()
+        released = threading.Event()
+
+        def release():
+            if not released.is_set():
+                released.set()
+                sem.release()
+
+        return release
+
+
+def release_on_close(resp, release: Callable[[], None]):
+    """Nhả slot của host khi response stream được đóng (resp.close() sau khi đọc body)"""
+    close = resp.close
+
+    def close_and_release():
+        try:
+            close()
+        finally:
+            release()
+
+    resp.close = close_and_release
+
+
+# Singleton dùng chung cho toàn bộ scrapers trong process
+host_limiter = HostLimiter()
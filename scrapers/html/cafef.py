@@ -1,9 +1,18 @@
+from database.article import Article
 from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
-from datetime import datetime
+from scrapers.extract import ArticleSpec
+from typing import List, Optional
+from utils.html_parser import make_soup
 import re
 
+ARTICLE_SPEC = ArticleSpec(
+    title=['h1.title', 'h1'],
+    date='span.pdate[data-role="publishdate"]',
+    category='a[data-role="cate-name"]',
+    category_attr='title',
+    body=['.detail-content', '.contentdetail', '.detail_content', 'article .content'],
+)
+
 
 class CafeFScraper(NewsScraperBase):
     """
@@ -13,9 +22,12 @@ class CafeFScraper(NewsScraperBase):
     def __init__(self):
         super().__init__()
         self.source = "cafef.vn"
+        self.base_url = "https://cafef.vn"
         self.headers['Referer'] = 'https://cafef.vn/'
+        self.stream_end_marker = 'div.detail-content'  # Dừng đọc trang chi tiết sau container nội dung
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self, max_pages: int = 1, max_articles_per_page: int = 20) -> List[Tuple]:
+    def fetch_news(self, max_pages: int = 1, max_articles_per_page: int = 20) -> List[Article]:
         """
         Fetch tin tức từ CafeF từ trang /doc-nhanh
 
@@ -34,14 +46,13 @@ class CafeFScraper(NewsScraperBase):
                 url = f"https://cafef.vn/doc-nhanh/trang-{page}.chn"
 
             print(f"\n📄 Page {page}/{max_pages}: {url} - multi_source_scraper.py:956")
-            self.sleep()
 
-            html = self.fetch_html(url)
+            html = self.fetch_listing(url)
             if not html:
                 print(f"⚠ Failed to fetch page {page}, skipping - multi_source_scraper.py:961")
                 continue
 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
 
             # Find all article links với pattern -188*.chn
             links = soup.find_all('a', href=re.compile(r'-\d{15,}\.chn$'))
@@ -51,7 +62,7 @@ class CafeFScraper(NewsScraperBase):
             for link in links:
                 href = link.get('href', '')
                 if href:
-                    full_url = href if href.startswith('http') else f"https://cafef.vn{href}"
+                    full_url = self.canonical_url(href)
                     # Exclude pagination pages
                     if '/trang-' in full_url:
                         continue
@@ -65,82 +76,32 @@ class CafeFScraper(NewsScraperBase):
 
             print(f"Found {len(article_urls)} new article URLs on page {page} - multi_source_scraper.py:986")
 
-            # Limit articles per page
-            article_urls = article_urls[:max_articles_per_page]
+            # Limit articles per page (sau khi lọc, link bị loại không tính vào giới hạn)
+            article_urls = self.filter_new(article_urls, limit=max_articles_per_page)
 
             # Fetch article details
-            for i, article_url in enumerate(article_urls, 1):
-                print(f"[{i}/{len(article_urls)}] Fetching: {article_url[:60]}... - multi_source_scraper.py:993", flush=True)
-                self.sleep()
-
-                article_data = self._fetch_article_detail(article_url)
-                if article_data:
-                    all_articles.append(article_data)
+            all_articles.extend(self.fetch_articles(article_urls))
 
         print(f"\n✓ Total articles collected: {len(all_articles)} - multi_source_scraper.py:1000")
         return all_articles
 
-    def _fetch_article_detail(self, link: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str) -> Optional[Article]:
         """Fetch chi tiết một bài báo CafeF"""
         html = self.fetch_html(link)
         if not html:
             return None
 
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Extract title
-        title_el = soup.select_one('h1.title') or soup.select_one('h1')
-        title = title_el.get_text(strip=True) if title_el else ''
+        article = self.extract_article(html)
 
+        title = article.title
         if not title:
             return None
 
         # Extract date từ span.pdate[data-role="publishdate"]
         # Format: "29-12-2025 - 16:16 PM"
-        published_at = 0
-
-        date_el = soup.select_one('span.pdate[data-role="publishdate"]')
-        if date_el:
-            date_text = date_el.get_text(strip=True)
-            # Parse: "29-12-2025 - 16:16 PM" -> datetime
-            date_match = re.search(r'(\d{1,2})-(\d{1,2})-(\d{4})\s*-\s*(\d{1,2}):(\d{2})', date_text)
-            if date_match:
-                day, month, year, hour, minute = date_match.groups()
-                try:
-                    dt = datetime(int(year), int(month), int(day), int(hour), int(minute))
-                    published_at = int(dt.timestamp())
-                except:
-                    pass
-
-        # Extract content
-        content_selectors = ['.detail-content', '.contentdetail', '.detail_content', 'article .content']
-        content = ""
-
-        for selector in content_selectors:
-            content_el = soup.select_one(selector)
-            if content_el:
-                paragraphs = content_el.select('p')
-                content = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-                if content:
-                    break
-
-        # Extract category từ a[data-role="cate-name"]
-        category = "ĐỌC NHANH"  # Default
-
-        category_el = soup.select_one('a[data-role="cate-name"]')
-        if category_el:
-            # Lấy text hoặc title nếu text rỗng, sau đó in hoa
-            category = (category_el.get_text(strip=True) or category_el.get('title', 'ĐỌC NHANH')).strip().upper()
-
-
-        return (
-            published_at,
-            title,
-            link,
-            content,
-            self.source,
-            "NA",
-            "NA",
-            False,
-            category,
-        )
+        published_at = self.parse_published(article.date)
+
+        # Category từ a[data-role="cate-name"] (text hoặc title), in hoa
+        category = (article.category or "ĐỌC NHANH").upper()
+
+        return Article(published_at, title, link, article.content, self.source, category=category)
@@ -1,8 +1,8 @@
-from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
-from datetime import datetime
-import re
+from database.article import Article
+from scrapers.base import ListingItem, NewsScraperBase
+from scrapers.media import classify_element
+from typing import List, Optional
+from utils.html_parser import make_soup
 
 
 class CafelandScraper(NewsScraperBase):
@@ -13,9 +13,14 @@ class CafelandScraper(NewsScraperBase):
     def __init__(self):
         super().__init__()
         self.source = "cafeland.vn"
+        self.base_url = "https://cafeland.vn"
         self.headers['Referer'] = 'https://cafeland.vn/'
+        self.detail_regions = [
+            'div.info-date', '#sevenBoxNewContentInfo', '#sevenBoxNewContentInfoNo',
+            '#sevenBoxNewContenDAtInfo', 'div.sevenPostContent', 'a[itemprop="item"]',
+        ]
 
-    def fetch_news(self, max_pages: int = 1, max_articles_per_page: int = 20) -> List[Tuple]:
+    def fetch_news(self, max_pages: int = 1, max_articles_per_page: int = 20) -> List[Article]:
         """
         Fetch tin tức từ Cafeland trang "Bất động sản mới nhất"
 
@@ -28,7 +33,6 @@ class CafelandScraper(NewsScraperBase):
         print(f"\n📰 Crawling Cafeland.vn  Bất động sản mới nhất - multi_source_scraper.py:753")
 
         for page in range(1, max_pages + 1):
-            self.sleep()
 
             # Build URL
             if page == 1:
@@ -38,13 +42,13 @@ class CafelandScraper(NewsScraperBase):
 
             print(f"\n📄 Page {page}/{max_pages}: {url} - multi_source_scraper.py:764")
 
-            html = self.fetch_html(url)
+            html = self.fetch_listing(url)
             if not html:
                 print(f"⚠ Failed to fetch page {page}, skipping - multi_source_scraper.py:768")
                 continue
 
             # Parse listing page
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
             # Note: Articles are in <li class="loadBoxHomeMore">, not <div>
             articles = soup.select('li.loadBoxHomeMore')
 
@@ -54,9 +58,7 @@ class CafelandScraper(NewsScraperBase):
 
             print(f"Found {len(articles)} articles on page {page} - multi_source_scraper.py:780")
 
-            # Limit articles per page
-            articles = articles[:max_articles_per_page]
-
+            candidates = []
             for article in articles:
                 try:
                     # Extract title and link
@@ -70,66 +72,40 @@ class CafelandScraper(NewsScraperBase):
                     if not title or not link:
                         continue
 
-                    # Make sure link is absolute
-                    if not link.startswith('http'):
-                        link = f"https://cafeland.vn{link}"
+                    link = self.canonical_url(link)
 
                     # Extract description
                     desc_els = article.select('p')
                     description = desc_els[1].get_text(strip=True) if len(desc_els) > 1 else ""
 
-                    # Fetch article detail
-                    self.sleep()
-                    article_data = self._fetch_article_detail(link, title, description)
-                    if article_data:
-                        all_articles.append(article_data)
+                    candidates.append(ListingItem(link, title, description, classify_element(article)))
 
                 except Exception as e:
                     print(f"✗ Error parsing article: {e} - multi_source_scraper.py:813")
                     continue
 
+            # Fetch article detail (bỏ qua bài đã có trong DB, giới hạn số bài mỗi trang sau khi lọc)
+            items = self.filter_new(candidates, limit=max_articles_per_page)
+            all_articles.extend(self.fetch_articles([(item.link, item.title, item.description) for item in items]))
+
         print(f"\n✓ Total articles collected: {len(all_articles)} - multi_source_scraper.py:816")
         return all_articles
 
-    def _fetch_article_detail(self, link: str, title: str, description: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str, title: str, description: str) -> Optional[Article]:
         """Fetch chi tiết một bài báo"""
         html = self.fetch_html(link)
         if not html:
             return None
 
-        soup = BeautifulSoup(html, 'html.parser')
-
-        published_at = 0
-        date_el = soup.select_one('div.info-date.right')
+        soup = make_soup(html, self.detail_regions)
 
-        if date_el:
-            # Get text content, skipping audio element
-            date_text = date_el.get_text(strip=True)
-            # Remove any extra whitespace
-            date_text = re.sub(r'\s+', ' ', date_text).strip()
-
-            # Parse: "31/12/2025 9:05 PM"
-            # Try to match the date pattern
-            date_match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{2})\s*(AM|PM)', date_text)
-            if date_match:
-                day, month, year, hour, minute, period = date_match.groups()
-                try:
-                    hour = int(hour)
-                    # Convert to 24-hour format
-                    if period == 'PM' and hour != 12:
-                        hour += 12
-                    elif period == 'AM' and hour == 12:
-                        hour = 0
-
-                    dt = datetime(int(year), int(month), int(day), hour, int(minute))
-                    published_at = int(dt.timestamp())
-                except Exception as e:
-                    print(f"⚠ Could not parse date '{date_text}': {e} - multi_source_scraper.py:854")
+        # Format: "31/12/2025 9:05 PM"
+        published_at = self.parse_published(soup.select_one('div.info-date.right'))
 
         # Extract content
         # Try content containers (IDs for news articles, class for project pages)
         content_els = soup.select('#sevenBoxNewContentInfo, #sevenBoxNewContentInfoNo, #sevenBoxNewContenDAtInfo, div.sevenPostContent')
-        content = description
+        content = ""
 
         if content_els:
             paragraphs = []
@@ -169,9 +145,10 @@ class CafelandScraper(NewsScraperBase):
                     # Add valid paragraphs (including those with inline links)
                     paragraphs.append(elem)
 
-            content_text = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-            if content_text:
-                content = content_text
+            content = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
+        if not content:
+            # Không container nào khớp: trích nội dung chính (readability), cuối cùng mới dùng mô tả ở trang danh sách
+            content = self.fallback_content(html) or description
 
         category = "Bất động sản"  # Default
 
@@ -182,14 +159,4 @@ class CafelandScraper(NewsScraperBase):
             if category_text:
                 category = category_text.upper()
 
-        return (
-            published_at,
-            title,
-            link,
-            content,
-            self.source,
-            "NA",
-            "NA",
-            False,
-            category,
-        )
+        return Article(published_at, title, link, content, self.source, category=category)
@@ -1,25 +1,42 @@
+from database.article import Article
 from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
+from scrapers.extract import ArticleSpec
+from typing import List, Optional
+from utils.html_parser import make_soup
 from datetime import datetime
 
+ARTICLE_SPEC = ArticleSpec(
+    title='h1',
+    # Ngày nằm trong một thẻ span không có class riêng (DD/MM/YYYY)
+    date='span',
+    date_pattern=r'^\d{2}/\d{2}/\d{4}$',
+    # Breadcrumb chứa link /article/ là category
+    category='.MuiBreadcrumbs-li a[href*="/article/"] span',
+    body='div#content',
+    # Bỏ các đoạn ngắn và chú thích "Ảnh:", "Nguồn:", "tổng hợp"
+    min_paragraph_length=31,
+    skip_phrases=('Ảnh:', 'Nguồn:', 'tổng hợp'),
+    separator='\n\n',
+)
+
 
 class Coin68Scraper(NewsScraperBase):
     def __init__(self):
         super().__init__()
         self.source = "coin68.com"
         self.base_url = "https://coin68.com"
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self, max_articles: int = 10) -> List[Tuple]:
+    def fetch_news(self, max_articles: int = 10) -> List[Article]:
         all_articles = []
         url = self.base_url
 
         print(f"\n📡 Đang quét cấu trúc Hot News Coin68...")
-        html = self.fetch_html(url)
+        html = self.fetch_listing(url)
         if not html:
             return []
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
 
         # 1. Tìm tất cả các khối tin dựa trên class 'css-19idom' bạn cung cấp
         items = soup.find_all('div', class_='css-19idom')
@@ -30,75 +47,39 @@ class Coin68Scraper(NewsScraperBase):
             link_el = item.select_one('div.css-112x203 a')
             if link_el and link_el.get('href'):
                 href = link_el.get('href')
-                full_url = f"{self.base_url}{href}" if href.startswith('/') else href
+                full_url = self.canonical_url(href)
 
                 if full_url not in article_urls:
                     article_urls.append(full_url)
 
-            if len(article_urls) >= max_articles:
-                break
-
         print(f"✓ Tìm thấy {len(article_urls)} bài viết từ giao diện Hot News.")
+        article_urls = self.filter_new(article_urls, limit=max_articles)
 
         # 3. Lấy chi tiết từng bài
-        for i, article_url in enumerate(article_urls, 1):
-            print(f"[{i}/{len(article_urls)}] Đang cào: {article_url}", flush=True)
-            self.sleep()
-            data = self._fetch_article_detail(article_url)
-            if data:
-                all_articles.append(data)
+        all_articles.extend(self.fetch_articles(article_urls))
 
         return all_articles
 
-    def _fetch_article_detail(self, link: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str) -> Optional[Article]:
         html_text = self.fetch_html(link)
         if not html_text: return None
-        soup = BeautifulSoup(html_text, 'html.parser')
-
-        # 1. Lấy Title - Dùng selector ổn định (h1 hoặc MuiTypography-h2)
-        title = ""
-        title_el = soup.find('h1')
-        if title_el:
-            title = title_el.get_text(strip=True)
-
-        # 2. Lấy Category (Dựa trên breadcrumbs)
-        category = "CRYPTO"
-        # Tìm breadcrumb chứa link /article/ (đó là category)
-        category_link = soup.select_one('.MuiBreadcrumbs-li a[href*="/article/"]')
-        if category_link:
-            span = category_link.find('span')
-            if span:
-                category = span.get_text(strip=True).upper()
-
-        # 3. Lấy Published At - Tìm thẻ span chứa ngày
-        published_at = int(datetime.now().timestamp())
-        # Thử tìm span chứa pattern ngày DD/MM/YYYY
-        for span in soup.find_all('span'):
-            text = span.get_text(strip=True)
-            if '/' in text and len(text) == 10:  # Format: DD/MM/YYYY
-                try:
-                    dt = datetime.strptime(text, "%d/%m/%Y")
-                    published_at = int(dt.timestamp())
-                    break
-                except:
-                    continue
-
-        # 4. Lấy Content - Dùng div#content (không cần class cụ thể)
-        paragraphs = []
-        content_div = soup.find('div', id='content')
-
-        if content_div:
-            # Chỉ lấy text từ các thẻ p, bỏ qua các thẻ script/iframe/ads
-            for p in content_div.find_all('p', recursive=True):
-                # Loại bỏ các đoạn text chứa "Ảnh:", "Nguồn:", "Có thể bạn quan tâm"
-                txt = p.get_text(strip=True)
-                if len(txt) > 30 and not any(x in txt for x in ["Ảnh:", "Nguồn:", "tổng hợp"]):
-                    paragraphs.append(txt)
-
-        content = "\n\n".join(paragraphs)
+
+        article = self.extract_article(html_text)
+
+        # 1. Title
+        title = article.title
+
+        # 2. Category (Dựa trên breadcrumbs)
+        category = (article.category or "CRYPTO").upper()
+
+        # 3. Published At
+        published_at = self.parse_published(article.date, int(datetime.now().timestamp()))
+
+        # 4. Content - div#content
+        content = article.content
 
         # Kiểm tra điều kiện cuối cùng để tránh lưu bài rỗng
         if not title or not content:
             return None
 
-        return (published_at, title, link, content, self.source, "NA", "NA", False, category)
+        return Article(published_at, title, link, content, self.source, category=category)
@@ -1,32 +1,47 @@
+from database.article import Article
 from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
+from scrapers.extract import ArticleSpec
+from typing import List, Optional
+from utils.html_parser import make_soup
 from datetime import datetime
-import re
+
+ARTICLE_SPEC = ArticleSpec(
+    title='h1',
+    date=['.detail-date', '.post-date', '.time'],
+    category='a[itemprop="item"]',
+    category_index=1,
+    category_attr='title',
+    body='.article-content',
+    # Lấy cả <p> và các ô <td> (chú thích ảnh), bỏ các đoạn quá ngắn
+    paragraphs=('p', 'td'),
+    min_paragraph_length=6,
+)
 
 
 class KinhTeNgoaiThuongScraper(NewsScraperBase):
     def __init__(self):
         super().__init__()
         self.source = "kinhtengoaithuong.vn"
+        self.base_url = "https://kinhtengoaithuong.vn"
         # Thêm header để giả lập trình duyệt xem tin tức
         self.headers.update({
             'Referer': 'https://www.google.com/',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
         })
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self, max_articles: int = 15) -> List[Tuple]:
+    def fetch_news(self, max_articles: int = 15) -> List[Article]:
         all_articles = []
         url = "https://kinhtengoaithuong.vn/"
 
         print(f"\n📡 Đang quét trang chủ: {url}")
-        html = self.fetch_html(url)
+        html = self.fetch_listing(url)
 
         if not html:
             print("⚠ Không thể truy cập trang chủ kinhtengoaithuong.vn")
             return []
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         potential_links = soup.select('h2 a, h3 a, .post-title a, .entry-title a')
 
         article_urls = []
@@ -37,8 +52,7 @@ class KinhTeNgoaiThuongScraper(NewsScraperBase):
             if not href: continue
 
             # Chuẩn hóa link tuyệt đối
-            if href.startswith('/'):
-                href = f"https://kinhtengoaithuong.vn{href}"
+            href = self.canonical_url(href)
 
             # Lọc: Phải thuộc domain, không phải trang chủ, không phải link rác
             if "kinhtengoaithuong.vn" in href and href != "https://kinhtengoaithuong.vn/":
@@ -55,77 +69,32 @@ class KinhTeNgoaiThuongScraper(NewsScraperBase):
                 href = a['href']
                 # Link bài viết thường có độ sâu path > 3 (ví dụ domain.vn/ten-bai-viet/)
                 if "kinhtengoaithuong.vn" in href and len(href.strip('/').split('/')) >= 3:
+                     href = self.canonical_url(href)
                      if href not in seen_urls and not any(x in href for x in ['/category/', '/tag/', '/c/']):
                         seen_urls.add(href)
                         article_urls.append(href)
 
-        article_urls = article_urls[:max_articles]
         print(f"✓ Tìm thấy {len(article_urls)} bài viết từ trang chủ.")
+        article_urls = self.filter_new(article_urls, limit=max_articles)
 
-        for i, article_url in enumerate(article_urls, 1):
-            print(f"[{i}/{len(article_urls)}] Fetching: {article_url[:50]}...", flush=True)
-            self.sleep()
-            article_data = self._fetch_article_detail(article_url)
-            if article_data:
-                all_articles.append(article_data)
+        all_articles.extend(self.fetch_articles(article_urls))
 
         return all_articles
 
-    def _fetch_article_detail(self, link: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str) -> Optional[Article]:
         html = self.fetch_html(link)
         if not html: return None
-        soup = BeautifulSoup(html, 'html.parser')
+
+        article = self.extract_article(html)
 
         # 1. Tiêu đề
-        title_el = soup.find('h1')
-        title = title_el.get_text(strip=True) if title_el else ''
+        title = article.title
         if not title: return None
 
         # 2. Ngày xuất bản
-        published_at = int(datetime.now().timestamp())
-        # Tìm trong các thẻ meta hoặc class date phổ biến của trang
-        date_el = soup.select_one('.detail-date, .post-date, .time')
-        if date_el:
-            date_match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{4})', date_el.get_text())
-            if date_match:
-                d, m, y = date_match.groups()
-                try: published_at = int(datetime(int(y), int(m), int(d)).timestamp())
-                except: pass
-
-        # 3. Nội dung (Sử dụng Selector: .article-content)
-        content_el = soup.select_one('.article-content')
-        content = ""
-        if content_el:
-            # Thu thập dữ liệu từ cả thẻ <p> và các dòng trong <table> (chú thích ảnh)
-            # để đảm bảo không sót thông tin quan trọng
-            parts = []
-
-            # Lấy các đoạn văn bản
-            for p in content_el.find_all(['p', 'td']):
-                # Loại bỏ khoảng trắng thừa và các ký tự đặc biệt
-                txt = p.get_text(strip=True)
-                if txt and len(txt) > 5: # Chỉ lấy các đoạn có nghĩa
-                    parts.append(txt)
-
-            content = ' '.join(parts)
-
-        # 4. Chuyên mục (Category)
-        category = "TÀI CHÍNH" 
-        bread_items = soup.select('a[itemprop="item"]')
-        if len(bread_items) >= 2:
-            # Lấy text từ thuộc tính title hoặc từ thẻ span bên trong
-            category = bread_items[1].get('title') or bread_items[1].get_text(strip=True)
-
-        category = category.upper().strip()
-
-        return (
-            published_at,
-            title,
-            link,
-            content,
-            self.source,
-            "NA",
-            "NA", 
-            False,
-            category
-        )
+        published_at = self.parse_published(article.date, int(datetime.now().timestamp()))
+
+        # 3. Chuyên mục: item thứ 2 của breadcrumb
+        category = (article.category or "TÀI CHÍNH").upper().strip()
+
+        return Article(published_at, title, link, article.content, self.source, category=category)
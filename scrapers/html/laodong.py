@@ -1,8 +1,16 @@
-from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
-from datetime import datetime
-import re
+from database.article import Article
+from scrapers.base import ListingItem, NewsScraperBase
+from scrapers.extract import ArticleSpec
+from scrapers.http_client import http_client
+from typing import List, Optional
+from utils.html_parser import make_soup
+
+ARTICLE_SPEC = ArticleSpec(
+    title=['h1', '.article-title'],
+    date='span.time',
+    category='a.main-cat-lnk',
+    body=['.detail-content', '.article-content', '[itemprop="articleBody"]'],
+)
 
 
 class LaoDongScraper(NewsScraperBase):
@@ -13,9 +21,11 @@ class LaoDongScraper(NewsScraperBase):
     def __init__(self):
         super().__init__()
         self.source = "laodong.vn"
+        self.base_url = "https://laodong.vn"
         self.headers['Referer'] = 'https://laodong.vn/'
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self, max_articles: int = 20) -> List[Tuple]:
+    def fetch_news(self, max_articles: int = 20) -> List[Article]:
         """
         Fetch tin tức từ LaoDong trang "Tin mới"
 
@@ -28,8 +38,8 @@ class LaoDongScraper(NewsScraperBase):
         print(f"\n📰 Crawling LaoDong.vn  Tin mới - multi_source_scraper.py")
         print(f"\n📄 Fetching: {url}")
 
-        self.sleep()
-        html = self.fetch_html(url)
+        # Không dùng fetch_listing (conditional GET) vì lần đầu có thể nhận trang anti-bot
+        html = self.fetch_html(url, listing=True)
         if not html:
             print(f"⚠ Failed to fetch page, stopping")
             return all_articles
@@ -51,12 +61,11 @@ class LaoDongScraper(NewsScraperBase):
                     cookie_name = cookie_parts[0]
                     cookie_value = cookie_parts[1].split(';')[0]  # Get value before options
 
-                    # Set cookie in session
-                    self.session.cookies.set(cookie_name, cookie_value, domain='laodong.vn', path='/')
+                    # Set cookie vào HTTP client dùng chung
+                    http_client.set_cookie(cookie_name, cookie_value, domain='laodong.vn', path='/')
 
                     # Retry request with cookie
-                    self.sleep()
-                    html = self.fetch_html(url)
+                    html = self.fetch_html(url, listing=True)
                     if not html:
                         print(f"⚠ Failed to fetch page after cookie, stopping")
                         return all_articles
@@ -66,7 +75,7 @@ class LaoDongScraper(NewsScraperBase):
                 return all_articles
 
         # Parse listing page
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
 
         # Find all article tags - LaoDong uses <article> tags for news items
         articles = soup.find_all('article')
@@ -79,104 +88,59 @@ class LaoDongScraper(NewsScraperBase):
 
         # Extract links from articles
         article_links = []
+        seen_links = set()
         for article in articles:
             # Find the main link in the article (usually first link or link in title)
             link_el = article.find('a')
             if link_el:
                 href = link_el.get('href', '')
                 if href:
-                    # Make sure link is absolute
-                    if not href.startswith('http'):
-                        href = f"https://laodong.vn{href}"
+                    href = self.canonical_url(href)
 
                     # Filter out non-article links
                     # Valid article URLs: /xa-hoi/..., /the-thao/..., /suc-khoe/...
-                    if (href not in article_links and
+                    if (href not in seen_links and
                         '/tin-moi' not in href and
                         '/thong-tin-doanh-nghiep' not in href and
                         not href.endswith('laodong.vn/') and
                         href.count('/') >= 4): 
-                        article_links.append(href)
+                        seen_links.add(href)
+                        # Giữ title của trang danh sách (bài video chỉ lưu metadata cần title, xem media_policy)
+                        title = link_el.get('title') or link_el.get_text(strip=True)
+                        article_links.append(ListingItem(href, title))
 
         if not article_links:
             print(f"⚠ No valid article links found")
             return all_articles
 
-        # Limit to requested number of articles
-        article_links = article_links[:max_articles]
         print(f"Found {len(article_links)} article URLs")
+        # Giới hạn số bài sau khi lọc (link bị loại không tính vào max_articles)
+        items = self.filter_new(article_links, limit=max_articles)
 
         # Fetch article details
-        for i, article_url in enumerate(article_links, 1):
-            print(f"[{i}/{len(article_links)}] Fetching: {article_url[:60]}...", flush=True)
-            self.sleep()
-
-            article_data = self._fetch_article_detail(article_url)
-            if article_data:
-                all_articles.append(article_data)
+        all_articles.extend(self.fetch_articles([item.link for item in items]))
 
         print(f"\n✓ Total articles collected: {len(all_articles)}")
         return all_articles
 
-    def _fetch_article_detail(self, link: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str) -> Optional[Article]:
         """Fetch chi tiết một bài báo LaoDong"""
         html = self.fetch_html(link)
         if not html:
             return None
 
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Extract title
-        title_el = soup.select_one('h1') or soup.select_one('.article-title')
-        title = title_el.get_text(strip=True) if title_el else ''
+        article = self.extract_article(html)
 
+        title = article.title
         if not title:
             print(f"✗ No title found for: {link[:60]}...")
             return None
 
         # Extract date from span.time
         # Format: "Thứ năm, 01/01/2026 21:59 (GMT+7)"
-        published_at = 0
-        date_el = soup.select_one('span.time')
-
-        if date_el:
-            date_text = date_el.get_text(strip=True)
-            # Remove day of week and GMT info
-            # "Thứ năm, 01/01/2026 21:59 (GMT+7)" -> "01/01/2026 21:59"
-            date_match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{2})', date_text)
-            if date_match:
-                day, month, year, hour, minute = date_match.groups()
-                try:
-                    dt = datetime(int(year), int(month), int(day), int(hour), int(minute))
-                    published_at = int(dt.timestamp())
-                except Exception as e:
-                    print(f"⚠ Could not parse date '{date_text}': {e}")
-
-        # Extract content
-        content_el = soup.select_one('.detail-content') or soup.select_one('.article-content') or soup.select_one('[itemprop="articleBody"]')
-        content = ""
-
-        if content_el:
-            paragraphs = content_el.select('p')
-            content = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-
-        # Extract category from a.main-cat-lnk
-        category = "TIN MỚI" 
-
-        category_el = soup.select_one('a.main-cat-lnk')
-        if category_el:
-            category_text = category_el.get_text(strip=True)
-            if category_text:
-                category = category_text.upper() 
-
-        return (
-            published_at,
-            title,
-            link,
-            content,
-            self.source,
-            "NA",
-            "NA",
-            False,
-            category,
-        )
+        published_at = self.parse_published(article.date)
+
+        # Category from a.main-cat-lnk
+        category = (article.category or "TIN MỚI").upper()
+
+        return Article(published_at, title, link, article.content, self.source, category=category)
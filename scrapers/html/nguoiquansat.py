@@ -1,8 +1,24 @@
+from database.article import Article
 from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
+from scrapers.extract import ArticleSpec
+from typing import List, Optional
+from utils.html_parser import make_soup
 from datetime import datetime
 
+ARTICLE_SPEC = ArticleSpec(
+    title='h1.sc-longform-header-title',
+    date='span.sc-longform-header-date',
+    category='li.breadcrumb-item.active a',
+    sapo='article.entry p.sc-longform-header-sapo',
+    body='article.entry',
+    noise=(
+        'div.c-box', 'div.oneads', 'div.ads_viewport',
+        'figure.c-box', 'figure.oneads', 'figure.ads_viewport',
+    ),
+    unique=True,
+    separator='\n\n',
+)
+
 
 class NguoiQuanSatScraper(NewsScraperBase):
     """
@@ -12,17 +28,19 @@ class NguoiQuanSatScraper(NewsScraperBase):
     def __init__(self):
         super().__init__()
         self.source = "nguoiquansat.vn"
+        self.base_url = "https://nguoiquansat.vn"
         self.headers["Referer"] = "https://nguoiquansat.vn/"
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self, max_articles: int = 20) -> List[Tuple]:
+    def fetch_news(self, max_articles: int = 20) -> List[Article]:
         url = "https://nguoiquansat.vn/tin-moi-nhat"
         print(f"\n📡 Crawling: {url}")
 
-        html = self.fetch_html(url)
+        html = self.fetch_listing(url)
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
 
         article_urls = []
         seen = set()
@@ -38,91 +56,38 @@ class NguoiQuanSatScraper(NewsScraperBase):
             if any(x in href for x in ["/video", "/media", "/tag", "/author"]):
                 continue
 
-            full_url = (
-                href if href.startswith("http")
-                else f"https://nguoiquansat.vn{href}"
-            )
+            full_url = self.canonical_url(href)
 
             if full_url not in seen:
                 seen.add(full_url)
                 article_urls.append(full_url)
 
-            if len(article_urls) >= max_articles:
-                break
-
         print(f"✓ Found {len(article_urls)} article URLs")
+        article_urls = self.filter_new(article_urls, limit=max_articles)
 
-        results = []
-        for i, link in enumerate(article_urls, 1):
-            print(f"[{i}/{len(article_urls)}] Fetching: {link}", flush=True)
-            self.sleep()
-            data = self._fetch_article_detail(link)
-            if data:
-                results.append(data)
-
-        return results
+        return self.fetch_articles(article_urls)
 
-    def _fetch_article_detail(self, link: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str) -> Optional[Article]:
         html = self.fetch_html(link)
         if not html:
             return None
 
-        soup = BeautifulSoup(html, "html.parser")
+        article = self.extract_article(html)
 
         # -------- TITLE --------
-        title_el = soup.select_one("h1.sc-longform-header-title")
-        title = title_el.get_text(strip=True) if title_el else ""
+        title = article.title
         if not title:
             return None
 
         # -------- PUBLISHED AT --------
-        published_at = int(datetime.now().timestamp())
-        date_el = soup.select_one("span.sc-longform-header-date")
-        if date_el:
-            date_str = date_el.get_text(strip=True).replace(" - ", " ")
-            ts = self.parse_date_to_timestamp(date_str, "%d/%m/%Y %H:%M")
-            if ts > 0:
-                published_at = ts
-        # -------- CATEGORY --------
-        category_el = soup.select_one("li.breadcrumb-item.active a")
-        category = category_el.get_text(strip=True).upper() if category_el else "TIN TỨC"
-
-
-        # -------- CONTENT --------
-        article = soup.select_one("article.entry")
-        if not article:
-            return None
-
-        paragraphs = []
-
-        # sapo
-        sapo_el = article.select_one("p.sc-longform-header-sapo")
-        if sapo_el:
-            paragraphs.append(sapo_el.get_text(strip=True))
+        published_at = self.parse_published(article.date, int(datetime.now().timestamp()))
 
-        for p in article.find_all("p", recursive=True):
-            if p.find_parent(
-                ["div", "figure"],
-                class_=["c-box", "oneads", "ads_viewport"]
-            ):
-                continue
-
-            txt = p.get_text(strip=True)
-            if txt and txt not in paragraphs:
-                paragraphs.append(txt)
+        # -------- CATEGORY --------
+        category = article.category.upper() if article.category else "TIN TỨC"
 
-        content = "\n\n".join(paragraphs)
+        # -------- CONTENT (sapo + các đoạn, bỏ box quảng cáo) --------
+        content = article.content
         if not content:
             return None
 
-        return (
-            published_at,
-            title,
-            link,
-            content,
-            self.source,
-            "NA",    
-            "NA",
-            False,
-            category,
-        )
+        return Article(published_at, title, link, content, self.source, category=category)
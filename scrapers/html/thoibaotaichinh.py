@@ -1,25 +1,40 @@
+from database.article import Article
 from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
+from scrapers.extract import ArticleSpec
+from typing import List, Optional
+from utils.html_parser import make_soup
 from datetime import datetime
 
+ARTICLE_SPEC = ArticleSpec(
+    title='h1.post-title',
+    date='span.format_date',
+    category='a.article-catname',
+    sapo='div.post-desc',
+    body='div.post-content.__MASTERCMS_CONTENT',
+    unique=True,
+    separator='\n\n',
+    extra={'time': 'span.format_time'},
+)
+
 
 class ThoiBaoTaiChinhScraper(NewsScraperBase):
     """Scraper cho thoibaotaichinhvietnam.vn"""
     def __init__(self):
         super().__init__()
         self.source = "thoibaotaichinhvietnam.vn"
+        self.base_url = "https://thoibaotaichinhvietnam.vn"
         self.headers["Referer"] = "https://thoibaotaichinhvietnam.vn/"
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self, max_articles: int = 10) -> List[Tuple]:
+    def fetch_news(self, max_articles: int = 10) -> List[Article]:
         url = "https://thoibaotaichinhvietnam.vn/"
         print(f"\n📡 Crawling: {url}")
 
-        html = self.fetch_html(url)
+        html = self.fetch_listing(url)
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         article_urls = []
         seen = set()
 
@@ -34,82 +49,49 @@ class ThoiBaoTaiChinhScraper(NewsScraperBase):
                 continue
 
             # Build full URL an toàn (fix lỗi domain)
-            full_url = href if href.startswith("http") else f"https://thoibaotaichinhvietnam.vn/{href.lstrip('/')}"
+            full_url = self.canonical_url(href)
 
             if full_url not in seen:
                 seen.add(full_url)
                 article_urls.append(full_url)
 
-            if len(article_urls) >= max_articles:
-                break
-
         print(f"✓ Found {len(article_urls)} article URLs")
+        article_urls = self.filter_new(article_urls, limit=max_articles)
 
         # Crawl chi tiết từng bài
         results = []
-        for i, link in enumerate(article_urls, 1):
-            print(f"[{i}/{len(article_urls)}] Fetching: {link}", flush=True)
-            self.sleep()
-            data = self._fetch_article_detail(link)
-            if data:
-                results.append(data)
+        results.extend(self.fetch_articles(article_urls))
 
         return results
 
-    def _fetch_article_detail(self, link: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str) -> Optional[Article]:
         html = self.fetch_html(link)
         if not html:
             return None
 
-        soup = BeautifulSoup(html, "html.parser")
+        article = self.extract_article(html)
 
         # -------- TITLE --------
-        title_el = soup.select_one("h1.post-title")
-        title = title_el.get_text(strip=True) if title_el else ""
+        title = article.title
         if not title:
             return None
 
         # -------- PUBLISHED AT --------
         published_at = int(datetime.now().timestamp())
-        date_el = soup.select_one("span.format_date")
-        time_el = soup.select_one("span.format_time")
-        if date_el and time_el:
+        date_el = article.date
+        time_el = article.extra.get('time')
+        if isinstance(date_el, str):  # article:published_time trong <head>
+            published_at = self.parse_published(date_el, published_at)
+        elif date_el and time_el:
             datetime_str = f"{date_el.get_text(strip=True)} {time_el.get_text(strip=True)}"
-            try:
-                dt = datetime.strptime(datetime_str, "%d/%m/%Y %H:%M")
-                published_at = int(dt.timestamp())
-            except Exception as e:
-                print(f"⚠ Could not parse date '{datetime_str}': {e}")
+            published_at = self.parse_published(datetime_str, published_at)
 
         # -------- CATEGORY --------
-        cate_el = soup.select_one("a.article-catname")
-        category = cate_el.get_text(strip=True).upper() if cate_el else "TIN TỨC"
+        category = article.category.upper() if article.category else "TIN TỨC"
 
         # -------- CONTENT --------
-        paragraphs = []
-        desc_el = soup.select_one("div.post-desc")
-        if desc_el:
-            paragraphs.append(desc_el.get_text(strip=True))
-
-        content_el = soup.select_one("div.post-content.__MASTERCMS_CONTENT")
-        if content_el:
-            for p in content_el.find_all("p", recursive=True):
-                txt = p.get_text(strip=True)
-                if txt and txt not in paragraphs:
-                    paragraphs.append(txt)
-
-        content = "\n\n".join(paragraphs)
+        content = article.content
         if not content:
             return None
 
-        return (
-            published_at,
-            title,
-            link,
-            content,
-            self.source,
-            "NA",  
-            "NA",
-            False,
-            category,
-        )
+        return Article(published_at, title, link, content, self.source, category=category)
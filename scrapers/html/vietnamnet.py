@@ -1,6 +1,8 @@
-from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
+from database.article import Article
+from scrapers.base import ListingItem, NewsScraperBase
+from scrapers.media import classify_element
+from typing import List, Optional
+from utils.html_parser import make_soup
 from datetime import datetime
 
 
@@ -13,9 +15,16 @@ class VietnametScraper(NewsScraperBase):
     def __init__(self):
         super().__init__()
         self.source = "vietnamnet.vn"
+        self.base_url = "https://vietnamnet.vn"
         self.headers['Referer'] = 'https://vietnamnet.vn/'
-
-    def fetch_news(self, max_pages: int = 1, target_date: str = None) -> List[Tuple]:
+        self.stream_end_marker = 'div.maincontent'  # Dừng đọc trang chi tiết sau container nội dung
+        # bread-crumb-detail chứa cả ngày đăng và link chuyên mục cạnh đó (fallback category)
+        self.detail_regions = [
+            'div.bread-crumb-detail', 'div.bread-crumb-detail__time', 'span.time',
+            'ul.breadcrumb', '.breadcrumb', '.bread-crumb', 'div.maincontent', 'div.article-content',
+        ]
+
+    def fetch_news(self, max_pages: int = 1, target_date: str = None) -> List[Article]:
         """
         Fetch tin tức từ Vietnamnet (tin tức 24h by date)
 
@@ -42,14 +51,13 @@ class VietnametScraper(NewsScraperBase):
             url = f"https://vietnamnet.vn/tin-tuc-24h-p{page}?bydate={date_str}-{date_str}&cate="
 
             print(f"\n  📄 Page {page}: {url} - multi_source_scraper.py:569")
-            self.sleep()
 
-            html = self.fetch_html(url)
+            html = self.fetch_listing(url)
             if not html:
                 print(f"⚠ Failed to fetch page {page}, stopping - multi_source_scraper.py:574")
                 break
 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
 
             # Select posts
             posts = soup.select('div.horizontalPost.version-news')
@@ -60,6 +68,7 @@ class VietnametScraper(NewsScraperBase):
 
             print(f"Found {len(posts)} articles on page {page} - multi_source_scraper.py:586")
 
+            candidates = []
             for post in posts:
                 try:
                     # Extract title and link
@@ -69,21 +78,21 @@ class VietnametScraper(NewsScraperBase):
 
                     title = title_el.get_text(strip=True)
                     href = title_el.get('href', '')
-                    link = href if href.startswith('http') else f"https://vietnamnet.vn{href}"
+                    link = self.canonical_url(href)
 
                     if not title or not link:
                         continue
 
-                    # Fetch article detail
-                    self.sleep()
-                    article_data = self._fetch_article_detail(link, title)
-                    if article_data:
-                        all_articles.append(article_data)
+                    candidates.append(ListingItem(link, title, kind=classify_element(post)))
 
                 except Exception as e:
                     print(f"✗ Error parsing article: {e} - multi_source_scraper.py:609")
                     continue
 
+            # Fetch article detail (bỏ qua bài đã có trong DB)
+            items = self.filter_new(candidates)
+            all_articles.extend(self.fetch_articles([(item.link, item.title) for item in items]))
+
             # Check if we should continue to next page
             if max_pages is not None and page >= max_pages - 1:
                 print(f"Reached max_pages limit ({max_pages}) - multi_source_scraper.py:614")
@@ -123,38 +132,18 @@ class VietnametScraper(NewsScraperBase):
         print(f"\n  ✓ Total articles collected: {len(all_articles)} from {page + 1} page(s) - multi_source_scraper.py:648")
         return all_articles
 
-    def _fetch_article_detail(self, link: str, title: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str, title: str) -> Optional[Article]:
         """Fetch chi tiết một bài báo"""
         html = self.fetch_html(link)
         if not html:
             return None
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html, self.detail_regions)
 
         # Extract date
+        # Format: "Thứ Sáu, 26/12/2025 - 22:10"
         date_el = soup.select_one('div.bread-crumb-detail__time') or soup.select_one('span.time')
-        published_at = 0
-
-        if date_el:
-            date_text = date_el.get_text(strip=True)
-
-            # Clean date string
-            # Format: "Thứ Sáu, 26/12/2025 - 22:10" → "26/12/2025 22:10"
-            # Remove "Thứ X, " ở đầu
-            if date_text.startswith('Thứ'):
-                parts = date_text.split(',', 1)
-                if len(parts) > 1:
-                    date_text = parts[1].strip()
-
-            # Remove dấu " - " giữa date và time
-            date_text = date_text.replace(' - ', ' ')
-
-            # Try various formats
-            for fmt in ["%d/%m/%Y %H:%M", "%d-%m-%Y %H:%M", "%d/%m/%Y"]:
-                parsed_ts = self.parse_date_to_timestamp(date_text, fmt)
-                if parsed_ts > 0:
-                    published_at = parsed_ts
-                    break
+        published_at = self.parse_published(date_el)
 
         # Extract content
         content_el = soup.select_one('div.maincontent') or soup.select_one('div.article-content')
@@ -163,6 +152,8 @@ class VietnametScraper(NewsScraperBase):
         if content_el:
             paragraphs = content_el.select('p')
             content = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
+        if not content:
+            content = self.fallback_content(html)
 
         # Extract category từ breadcrumb
         category = "Tin tức"  # Default
@@ -194,14 +185,4 @@ class VietnametScraper(NewsScraperBase):
         # 👉 In hoa category
         category = category.upper()
 
-        return (
-            published_at,
-            title,
-            link,
-            content,
-            self.source,
-            "NA",
-            "NA",
-            False,
-            category,
-        )
+        return Article(published_at, title, link, content, self.source, category=category)
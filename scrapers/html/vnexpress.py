@@ -1,6 +1,17 @@
-from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
+from database.article import Article
+from scrapers.base import ListingItem, NewsScraperBase
+from scrapers.extract import ArticleSpec
+from scrapers.media import classify_element
+from typing import List, Optional
+from utils.html_parser import make_soup
+
+ARTICLE_SPEC = ArticleSpec(
+    date='span.date',
+    # VD: <ul.breadcrumb><li><a href="/suc-khoe">Sức khỏe</a></li>...
+    category=['ul.breadcrumb li a', '.breadcrumb a'],
+    body='article.fck_detail',
+    paragraphs=('p.Normal',),
+)
 
 
 class VnExpressScraper(NewsScraperBase):
@@ -11,9 +22,12 @@ class VnExpressScraper(NewsScraperBase):
     def __init__(self):
         super().__init__()
         self.source = "vnexpress.net"
+        self.base_url = "https://vnexpress.net"
         self.headers['Referer'] = 'https://vnexpress.net/'
+        self.stream_end_marker = 'article.fck_detail'  # Dừng đọc trang chi tiết sau container nội dung
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self, max_pages: int = 1) -> List[Tuple]:
+    def fetch_news(self, max_pages: int = 1) -> List[Article]:
         """
         Fetch tin tức từ VnExpress trang "Tin tức 24h"
 
@@ -25,7 +39,6 @@ class VnExpressScraper(NewsScraperBase):
         print(f"\n📰 Crawling VnExpress.net  Tin tức 24h - multi_source_scraper.py:90")
 
         for page in range(1, max_pages + 1):
-            self.sleep()
 
             # Build URL
             if page == 1:
@@ -35,13 +48,13 @@ class VnExpressScraper(NewsScraperBase):
 
             print(f"\n📄 Page {page}/{max_pages}: {url} - multi_source_scraper.py:101")
 
-            html = self.fetch_html(url)
+            html = self.fetch_listing(url)
             if not html:
                 print(f"⚠ Failed to fetch page {page}, skipping - multi_source_scraper.py:105")
                 continue
 
             # Parse listing page
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
             articles = soup.select('article.item-news')
 
             if not articles:
@@ -50,6 +63,7 @@ class VnExpressScraper(NewsScraperBase):
 
             print(f"Found {len(articles)} articles on page {page} - multi_source_scraper.py:116")
 
+            candidates = []
             for article in articles:
                 try:
                     # Extract title and link
@@ -67,68 +81,34 @@ class VnExpressScraper(NewsScraperBase):
                     desc_el = article.select_one('p.description a')
                     description = desc_el.get_text(strip=True) if desc_el else ""
 
-                    # Fetch article detail
-                    self.sleep()
-                    article_data = self._fetch_article_detail(link, title, description)
-                    if article_data:
-                        all_articles.append(article_data)
+                    candidates.append(ListingItem(self.canonical_url(link), title, description, classify_element(article)))
 
                 except Exception as e:
                     print(f"✗ Error parsing article: {e} - multi_source_scraper.py:142")
                     continue
 
+            # Fetch article detail (bỏ qua bài đã có trong DB)
+            items = self.filter_new(candidates)
+            all_articles.extend(self.fetch_articles([(item.link, item.title, item.description) for item in items]))
+
         print(f"\n✓ Total articles collected: {len(all_articles)} - multi_source_scraper.py:145")
         return all_articles
 
-    def _fetch_article_detail(self, link: str, title: str, description: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str, title: str, description: str) -> Optional[Article]:
         """Fetch chi tiết một bài báo"""
         html = self.fetch_html(link)
         if not html:
             return None
 
-        soup = BeautifulSoup(html, 'html.parser')
+        article = self.extract_article(html)
 
         # Extract date
         # Format: "Thứ hai, 29/12/2025, 15:50 (GMT+7)"
-        date_el = soup.select_one('span.date')
-        published_at = 0
-
-        if date_el:
-            date_text = date_el.get_text(strip=True)
-            parts = date_text.split(',')
-            if len(parts) >= 3:
-                date_part = parts[1].strip()  # "29/12/2025"
-                time_part = parts[2].strip().split(' ')[0]  # "15:50"
-                datetime_str = f"{date_part} {time_part}"
-                published_at = self.parse_date_to_timestamp(datetime_str, "%d/%m/%Y %H:%M")
-
-        # Extract content
-        content_els = soup.select('article.fck_detail p.Normal')
-        content = ' '.join([p.get_text(strip=True) for p in content_els if p.get_text(strip=True)])
-
-        if not content:
-            content = description
-
-        # Extract category từ breadcrumb
-        # VD: <ul.breadcrumb><li><a href="/suc-khoe">Sức khỏe</a></li>...
-        category = "Tin tức 24h"  # Default
-
-        breadcrumb_links = soup.select('ul.breadcrumb li a, .breadcrumb a')
-        if breadcrumb_links:
-            # Lấy item đầu tiên làm category chính
-            category_el = breadcrumb_links[0]
-            category_text = category_el.get_text(strip=True)
-            if category_text:
-                category = category_text.upper()
-
-        return (
-            published_at,
-            title,
-            link,
-            content,
-            self.source,
-            "NA",
-            "NA",
-            False,
-            category,
-        )
+        published_at = self.parse_published(article.date)
+
+        content = article.content or description
+
+        # Category: item đầu tiên của breadcrumb
+        category = article.category.upper() if article.category else "Tin tức 24h"
+
+        return Article(published_at, title, link, content, self.source, category=category)
@@ -1,8 +1,24 @@
-from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
+from database.article import Article
+from scrapers.base import ListingItem, NewsScraperBase
+from scrapers.extract import ArticleSpec
+from scrapers.media import classify_element
+from typing import List, Optional
+from utils.html_parser import make_soup
 from datetime import datetime
 
+ARTICLE_SPEC = ArticleSpec(
+    # Format mới: "Thứ Hai, 16:54, 29/12/2025" trong div.col-md-4.mb-2
+    # Format cũ: "Thứ Ba, 22:35, 26/08/2025" trong .article-date .col-md-4
+    date=['div.col-md-4.mb-2', '.article-date .col-md-4'],
+    # Ưu tiên navbar chuyên mục (<a class="navbar-brand special-header-title">), sau đó breadcrumb
+    category=['a.special-header-title', 'li.breadcrumb-item-first a', '.breadcrumb-item a'],
+    sapo='div.row.article-summary div.col-lg-8 > div',
+    # Cấu trúc HTML có thể khác nhau giữa các loại bài
+    body=['div.row.article-content div.text-long', 'div.article-content div.text-long', 'div.text-long'],
+    # Bài multimedia/gallery không có <p>, lấy từ <figcaption>
+    fallback_paragraphs=('figcaption',),
+)
+
 
 class VOVScraper(NewsScraperBase):
     """
@@ -12,10 +28,14 @@ class VOVScraper(NewsScraperBase):
     def __init__(self):
         super().__init__()
         self.source = "vov.vn"
+        self.base_url = "https://vov.vn"
         self.headers['Referer'] = 'https://vov.vn/'
-        self.delay = 7  # Tăng delay từ 3 lên 5 giây để tránh rate limit  
+        self.rate = 1 / 7  # VOV hay chặn rate limit: tối đa 1 request / 7 giây
+        self.cache_ttl = 0  # Không cache: trang anti-bot của VOV cũng trả 200
+        self.stream_end_marker = 'div.text-long'  # Dừng đọc trang chi tiết sau container nội dung
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self, max_pages: int = 1) -> List[Tuple]:
+    def fetch_news(self, max_pages: int = 1) -> List[Article]:
         """
         Fetch tin tức từ VOV trang "Tin mới cập nhật"
 
@@ -34,9 +54,9 @@ class VOVScraper(NewsScraperBase):
                 url = f"https://vov.vn/tin-moi-cap-nhat?page={page}"
 
             print(f"\n  📄 Page {page + 1}/{max_pages}: {url} - multi_source_scraper.py:373")
-            self.sleep()
 
-            html = self.fetch_html(url)
+            # Không dùng fetch_listing (conditional GET) vì VOV có thể trả trang anti-bot
+            html = self.fetch_html(url, listing=True)
             if not html:
                 print(f"⚠ Failed to fetch page {page}, stopping - multi_source_scraper.py:378")
                 break
@@ -59,8 +79,7 @@ class VOVScraper(NewsScraperBase):
                     print(f"→ Redirecting to: {redirect_url[:80]}... - multi_source_scraper.py:396")
 
                     # Fetch the redirect URL
-                    self.sleep()
-                    html = self.fetch_html(redirect_url)
+                    html = self.fetch_html(redirect_url, listing=True)
                     if not html:
                         print(f"⚠ Failed to fetch redirect URL, stopping - multi_source_scraper.py:402")
                         break
@@ -74,7 +93,7 @@ class VOVScraper(NewsScraperBase):
                 print(f"⚠ Max redirects ({max_redirects}) reached, still getting antibot page. Stopping. - multi_source_scraper.py:411")
                 break
 
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = make_soup(html)
 
             # Select taxonomy-content divs
             content_divs = soup.select('div.taxonomy-content')
@@ -91,6 +110,7 @@ class VOVScraper(NewsScraperBase):
 
             print(f"Found {len(content_divs)} articles on page {page} - multi_source_scraper.py:429")
 
+            candidates = []
             for div in content_divs:
                 try:
                     # Extract title
@@ -100,7 +120,7 @@ class VOVScraper(NewsScraperBase):
                     # Extract link
                     link_el = div.select_one('a.vovvn-title')
                     href = link_el.get('href', '') if link_el else ''
-                    link = href if href.startswith('http') else f"https://vov.vn{href}"
+                    link = self.canonical_url(href)
 
                     # Extract description
                     desc_el = div.select_one('p.mt-2')
@@ -109,23 +129,16 @@ class VOVScraper(NewsScraperBase):
                     if not title or not link:
                         continue
 
-                    # Fetch article detail with retry if content is empty
-                    self.sleep()
-                    article_data = self._fetch_article_detail(link, title, description)
-
-                    # Retry once if content is empty
-                    if article_data and not article_data[3]:  # article_data[3] is content
-                        print(f"⚠ Empty content, retrying: {title[:50]}...")
-                        self.sleep()
-                        article_data = self._fetch_article_detail(link, title, description)
-
-                    if article_data:
-                        all_articles.append(article_data)
+                    candidates.append(ListingItem(link, title, description, classify_element(div)))
 
                 except Exception as e:
                     print(f"✗ Error parsing article: {e} - multi_source_scraper.py:456")
                     continue
 
+            # Content rỗng (bài video...) đã được extractor dự phòng xử lý trên HTML đã tải, không fetch lại
+            items = self.filter_new(candidates)
+            all_articles.extend(self.fetch_articles([(item.link, item.title, item.description) for item in items]))
+
             # Check pagination để xem có trang tiếp theo không
             pagination = soup.select_one('ul.pagination')
             if not pagination:
@@ -135,85 +148,23 @@ class VOVScraper(NewsScraperBase):
         print(f"\n  ✓ Total articles collected: {len(all_articles)} - multi_source_scraper.py:465")
         return all_articles
 
-    def _fetch_article_detail(self, link: str, title: str, description: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str, title: str, description: str) -> Optional[Article]:
         """Fetch chi tiết một bài báo"""
         html = self.fetch_html(link)
         if not html:
             print(f"✗ Failed to fetch HTML for: {link}")
             return None
 
-        soup = BeautifulSoup(html, 'html.parser')
+        article = self.extract_article(html)
 
         # Extract date
-        # Format mới: "Thứ Hai, 16:54, 29/12/2025" trong div.col-md-4.mb-2
-        # Format cũ: "Thứ Ba, 22:35, 26/08/2025" trong .article-date .col-md-4
-        published_at = int(datetime.now().timestamp())  # Default to now
-
-        # Thử selector mới trước
-        date_el = soup.select_one('div.col-md-4.mb-2') or soup.select_one('.article-date .col-md-4')
-
-        if date_el:
-            date_text = date_el.get_text(strip=True)
-            # Format: "Thứ Hai, 16:54, 29/12/2025"
-            parts = [p.strip() for p in date_text.split(',')]
-            if len(parts) >= 3:
-                time_part = parts[1]  # "16:54"
-                date_part = parts[2]  # "29/12/2025"
-                datetime_str = f"{date_part} {time_part}"
-                parsed_ts = self.parse_date_to_timestamp(datetime_str, "%d/%m/%Y %H:%M")
-                if parsed_ts > 0:
-                    published_at = parsed_ts
-
-        # Extract content
-        content_parts = []
-
-        # 1. Lấy summary/lead từ div.article-summary
-        summary_el = soup.select_one('div.row.article-summary div.col-lg-8 > div')
-        if summary_el:
-            summary_text = summary_el.get_text(strip=True)
-            if summary_text:
-                content_parts.append(summary_text)
-
-        # 2. Lấy content từ div.article-content
-        # Thử nhiều selector khác nhau vì cấu trúc HTML có thể khác nhau
-        content_el = (
-            soup.select_one('div.row.article-content div.text-long') or
-            soup.select_one('div.article-content div.text-long') or
-            soup.select_one('div.text-long')
-        )
-
-        if content_el:
-            # Thử lấy từ thẻ <p> trước (cho bài báo thường)
-            paragraphs = content_el.select('p')
-            p_text = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-
-            if p_text and p_text.strip():
-                content_parts.append(p_text)
-            else:
-                # Nếu không có <p>, lấy từ <figcaption> (cho bài multimedia/gallery)
-                figcaptions = content_el.select('figure figcaption')
-                fig_text = ' '.join([fig.get_text(strip=True) for fig in figcaptions if fig.get_text(strip=True)])
-                if fig_text:
-                    content_parts.append(fig_text)
+        published_at = self.parse_published(article.date, int(datetime.now().timestamp()))
 
-        # Kết hợp tất cả phần content
-        content = ' '.join(content_parts) if content_parts else description
+        # Content: summary + nội dung bài
+        content = article.content or description
 
         # Extract category
-        category = "Tin tức"  # Giá trị mặc định
-
-        # Ưu tiên 1: Lấy từ navbar chuyên mục
-        # Cấu trúc: <a class="navbar-brand special-header-title" ...>
-        nav_category = soup.select_one('a.special-header-title')
-
-        # Ưu tiên 2: Lấy từ breadcrumb
-        # Cấu trúc: li.breadcrumb-item-first a
-        breadcrumb_category = soup.select_one('li.breadcrumb-item-first a, .breadcrumb-item a')
-
-        if nav_category:
-            category = nav_category.get_text(strip=True)
-        elif breadcrumb_category:
-            category = breadcrumb_category.get_text(strip=True)
+        category = article.category or "Tin tức"
 
         # Chuẩn hóa: Nếu lấy trúng chữ "Trang chủ" thì đặt lại mặc định
         if category.lower() in ['trang chủ', 'home', 'vov.vn', 'vov']:
@@ -222,14 +173,4 @@ class VOVScraper(NewsScraperBase):
         # Chuyển thành chữ hoa để đồng bộ dữ liệu
         category = category.upper()
 
-        return (
-            published_at,
-            title,
-            link,
-            content,
-            self.source,
-            "NA",
-            "NA",
-            False,
-            category,
-        )
+        return Article(published_at, title, link, content, self.source, category=category)
@@ -1,23 +1,39 @@
+from database.article import Article
 from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
+from scrapers.extract import ArticleSpec
+from typing import List, Optional
+from utils.html_parser import make_soup
 from datetime import datetime
 import re
 
+ARTICLE_SPEC = ArticleSpec(
+    title=['h1[data-role="title"]', 'h1.title', 'h1'],
+    date=['p[data-role="publishdate"]', 'p.days'],
+    category=['.list-cate a[data-role="cate-name"]', '.list-cate a.item-cate'],
+    sapo=['h2[data-role="sapo"]', '.detail-sapo'],
+    body=['div[data-role="content"]', '.detail-content.afcbc-body'],
+    paragraphs=('p', 'h2', 'h3', 'h4'),
+    # Bỏ các đoạn quá ngắn, chú thích ảnh, link download
+    min_paragraph_length=31,
+    skip_phrases=('nguồn:', 'tham khảo thêm', 'toàn văn:', '---'),
+    separator='\n\n',
+)
+
 
 class XaydungChinhsachScraper(NewsScraperBase):
     def __init__(self):
         super().__init__()
         self.source = "xaydungchinhsach.chinhphu.vn"
         self.base_url = "https://xaydungchinhsach.chinhphu.vn"
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self, max_articles: int = 10) -> List[Tuple]:
+    def fetch_news(self, max_articles: int = 10) -> List[Article]:
         all_articles = []
         # Trang chủ của site này chính là danh sách tin nổi bật/mới nhất
-        html = self.fetch_html(self.base_url)
+        html = self.fetch_listing(self.base_url)
         if not html: return []
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         article_links = []
 
         # Tìm tất cả các link bài viết (thường nằm trong các khối tin)
@@ -33,76 +49,35 @@ class XaydungChinhsachScraper(NewsScraperBase):
                 # Kiểm tra href có chứa chuỗi số dài (article ID)
                 # Article URLs thường có format: /abc-xyz-119260101192109677.htm
                 if re.search(r'\d{10,}', href):  # Có ít nhất 10 chữ số liên tiếp = article ID
-                    full_url = href if href.startswith('http') else self.base_url + href
+                    full_url = self.canonical_url(href)
                     if full_url not in article_links:
                         article_links.append(full_url)
 
-            if len(article_links) >= max_articles:
-                break
-
         print(f"✓ Tìm thấy {len(article_links)} bài viết từ Xây dựng chính sách.")
+        article_links = self.filter_new(article_links, limit=max_articles)
 
-        for i, link in enumerate(article_links, 1):
-            print(f"[{i}/{len(article_links)}] Đang cào: {link}", flush=True)
-            self.sleep()
-            data = self._fetch_article_detail(link)
-            if data:
-                all_articles.append(data)
+        all_articles.extend(self.fetch_articles(article_links))
 
         return all_articles
 
-    def _fetch_article_detail(self, link: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str) -> Optional[Article]:
         html = self.fetch_html(link)
         if not html: return None
-        soup = BeautifulSoup(html, 'html.parser')
+
+        article = self.extract_article(html)
 
         # 1. Title - Dùng data-role hoặc class chính xác
-        title = ""
-        title_el = soup.select_one('h1[data-role="title"]') or soup.select_one('h1.title') or soup.find('h1')
-        if title_el:
-            title = title_el.get_text(strip=True)
+        title = article.title
 
         # 2. Category - Từ breadcrumbs
-        category = "POLICY"
-        cat_el = soup.select_one('.list-cate a[data-role="cate-name"]') or soup.select_one('.list-cate a.item-cate')
-        if cat_el:
-            category = cat_el.get_text(strip=True).upper()
+        category = (article.category or "POLICY").upper()
 
         # 3. Published At - Dùng data-role="publishdate"
-        published_at = int(datetime.now().timestamp())
-        date_el = soup.select_one('p[data-role="publishdate"]') or soup.select_one('p.days')
-        if date_el:
-            date_text = date_el.get_text(strip=True)
-            # Format: "03/01/2026 08:56" hoặc "03/01/2026"
-            match = re.search(r'(\d{2}/\d{2}/\d{4})', date_text)
-            if match:
-                try:
-                    dt = datetime.strptime(match.group(1), "%d/%m/%Y")
-                    published_at = int(dt.timestamp())
-                except: pass
+        published_at = self.parse_published(article.date, int(datetime.now().timestamp()))
 
         # 4. Content - Lấy từ sapo + detail-content
-        paragraphs = []
-
-        # Lấy sapo (lead/summary)
-        sapo_el = soup.select_one('h2[data-role="sapo"]') or soup.select_one('.detail-sapo')
-        if sapo_el:
-            sapo_text = sapo_el.get_text(strip=True)
-            if len(sapo_text) > 20:
-                paragraphs.append(sapo_text)
-
-        # Lấy content chính
-        content_area = soup.select_one('div[data-role="content"]') or soup.select_one('.detail-content.afcbc-body')
-        if content_area:
-            # Lấy các thẻ p, h2, h3, h4 (bỏ qua figure, script, style)
-            for elem in content_area.find_all(['p', 'h2', 'h3', 'h4']):
-                txt = elem.get_text(strip=True)
-                # Bỏ qua các đoạn quá ngắn, chú thích ảnh, link download
-                if len(txt) > 30 and not any(skip in txt.lower() for skip in ['nguồn:', 'tham khảo thêm', 'toàn văn:', '---']):
-                    paragraphs.append(txt)
-
-        content = "\n\n".join(paragraphs)
+        content = article.content
 
         if not title or not content: return None
 
-        return (published_at, title, link, content, self.source, "NA", "NA", False, category)
+        return Article(published_at, title, link, content, self.source, category=category)
@@ -0,0 +1,161 @@
+"""
+HTTP client dùng chung cho toàn bộ scrapers trong process
+
+- Một connection pool cho mỗi host, giữ keep-alive giữa các lần chạy (scheduler chạy nhiều job trong cùng process)
+- HTTP/2 (tùy chọn): bật HTTP2=true và cài `httpx[http2]`, nếu không có sẽ dùng requests
+- stats(): số connection đã mở, số request và số lần tái sử dụng connection theo host
+"""
+
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import config
+from scrapers.hostlimit import host_of
+
+try:
+    import httpx
+except ImportError:  # httpx là optional dependency (chỉ cần cho HTTP/2)
+    httpx = None
+
+# Lỗi mạng tạm thời (nên retry), khác với lỗi HTTP status
+TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout)
+if httpx is not None:
+    TRANSIENT_ERRORS += (httpx.TransportError,)
+
+
+class HTTPClient:
+    """Client dùng chung: requests.Session với pool theo host, hoặc httpx.Client khi bật HTTP/2"""
+
+    def __init__(self, pool_connections: int, pool_maxsize: int, http2: bool = False):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.http2 = http2 and httpx is not None
+        self._lock = threading.Lock()
+        self._session = None
+        self._httpx_client = None
+        self._requests = Counter()        # Số request theo host
+        self._http_versions = Counter()   # HTTP/1.1 vs HTTP/2 (chỉ có khi dùng httpx)
+
+        if http2 and httpx is None:
+            print("⚠ HTTP2=true nhưng chưa cài httpx[http2], dùng requests (HTTP/1.1)")
+
+    @property
+    def session(self) -> requests.Session:
+        """requests.Session dùng chung (tạo lazy)"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                    )
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+    @property
+    def httpx_client(self):
+        """httpx.Client dùng chung khi bật HTTP/2 (tạo lazy)"""
+        if self._httpx_client is None:
+            with self._lock:
+                if self._httpx_client is None:
+                    self._httpx_client = httpx.Client(
+                        http2=True,
+                        follow_redirects=True,
+                        limits=httpx.Limits(
+                            max_connections=self.pool_connections * self.pool_maxsize,
+                            max_keepalive_connections=self.pool_connections * self.pool_maxsize,
+                        ),
+                    )
+        return self._httpx_client
+
+    def get(self, url: str, headers: Optional[dict] = None, timeout: float = 30, stream: bool = False):
+        """
+        GET qua pool dùng chung. Response có status_code, headers, content, text, url, raise_for_status()
+
+        stream=True: chưa đọc body, đọc bằng iter_bytes() và phải gọi resp.close()
+        """
+        with self._lock:
+            self._requests[host_of(url)] += 1
+
+        if self.http2:
+            client = self.httpx_client
+            request = client.build_request('GET', url, headers=headers, timeout=timeout)
+            resp = client.send(request, stream=stream)
+            with self._lock:
+                self._http_versions[resp.http_version] += 1
+            return resp
+
+        return self.session.get(url, headers=headers, timeout=timeout, stream=stream)
+
+    def iter_bytes(self, resp, chunk_size: int):
+        """Đọc body (đã giải nén) của response stream theo chunk"""
+        if self.http2:
+            return resp.iter_bytes(chunk_size)
+        return resp.iter_content(chunk_size)
+
+    def set_cookie(self, name: str, value: str, domain: str, path: str = '/'):
+        """Set cookie cho một domain (dùng cho các trang anti-bot kiểu LaoDong)"""
+        if self.http2:
+            self.httpx_client.cookies.set(name, value, domain=domain, path=path)
+        else:
+            self.session.cookies.set(name, value, domain=domain, path=path)
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Thống kê connection pool theo host.
+
+        Returns:
+            {host: {'requests', 'connections', 'reused', 'idle'}}
+            connections/reused/idle chỉ có khi dùng requests (urllib3 pool)
+        """
+        with self._lock:
+            result = {host: {'requests': count} for host, count in self._requests.items()}
+
+        if self._session is not None:
+            for adapter in set(self._session.adapters.values()):
+                for key in list(adapter.poolmanager.pools.keys()):
+                    pool = adapter.poolmanager.pools.get(key)
+                    if pool is None:
+                        continue
+                    netloc = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+                    entry = result.setdefault(host_of(f"//{netloc}"), {'requests': 0})
+                    entry['connections'] = entry.get('connections', 0) + pool.num_connections
+                    entry['reused'] = entry.get('reused', 0) + max(0, pool.num_requests - pool.num_connections)
+                    # Queue của urllib3 chứa None cho các slot chưa mở connection
+                    idle = sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0
+                    entry['idle'] = entry.get('idle', 0) + idle
+
+        return result
+
+    def print_stats(self):
+        """In thống kê connection pool"""
+        stats = self.stats()
+        if not stats:
+            return
+
+        mode = "HTTP/2 (httpx)" if self.http2 else "HTTP/1.1 keep-alive (requests)"
+        print(f"\n🔌 HTTP pool: {mode} | pool_connections={self.pool_connections}, pool_maxsize={self.pool_maxsize}")
+        for host, entry in sorted(stats.items()):
+            print(
+                f"  {host:35} requests={entry.get('requests', 0):4} "
+                f"connections={entry.get('connections', '-'):>4} "
+                f"reused={entry.get('reused', '-'):>4} "
+                f"idle={entry.get('idle', '-'):>3}"
+            )
+        if self._http_versions:
+            print(f"  HTTP versions: {dict(self._http_versions)}")
+
+
+# Singleton dùng chung cho toàn bộ scrapers trong process
+http_client = HTTPClient(
+    pool_connections=config.HTTP_POOL_CONNECTIONS,
+    pool_maxsize=config.HTTP_POOL_MAXSIZE,
+    http2=config.HTTP2,
+)
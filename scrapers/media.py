@@ -0,0 +1,138 @@
+"""
+Phân loại bài trên trang danh sách / RSS: bài chữ, video, ảnh (gallery, emagazine), tường thuật trực tiếp, podcast
+
+Dựa trên URL (/video/, /emagazine/, /truc-tiep/, /podcast/...), badge trong markup của item
+(icon-video, ic-photo, data-type="video"...) và enclosure của RSS. Mỗi nguồn có media_policy
+quyết định với từng loại: fetch trang chi tiết như bài chữ, chỉ lưu metadata từ trang danh sách
+(không fetch), hoặc bỏ hẳn - tránh các request trang chi tiết không ra nội dung.
+"""
+
+import re
+from typing import Dict, Optional
+
+from bs4 import Tag
+
+from config import config
+from scrapers.stats import scrape_stats
+
+TEXT = 'text'
+VIDEO = 'video'
+GALLERY = 'gallery'
+LIVE = 'live'
+PODCAST = 'podcast'
+KINDS = (TEXT, VIDEO, GALLERY, LIVE, PODCAST)
+
+# Hành động của media_policy
+FETCH = 'fetch'        # Fetch trang chi tiết như bài chữ
+METADATA = 'metadata'  # Lưu title / mô tả / link từ trang danh sách, không fetch
+SKIP = 'skip'          # Bỏ qua
+ACTIONS = (FETCH, METADATA, SKIP)
+
+# Đoạn path (hoặc subdomain) đánh dấu loại bài, vd /video/..., video.vnexpress.net, /emagazine/..., /truc-tiep-...
+_SEGMENT_END = r'(?:/|$|\.html?$|\.chn$)'
+_URL_PATTERNS = [
+    (VIDEO, re.compile(rf'://(?:video|tv)\.|/(?:video|videos|clip|truyen-hinh){_SEGMENT_END}|-video\.html?$', re.I)),
+    (PODCAST, re.compile(rf'://podcast\.|/(?:podcast|podcasts|audio|radio|sach-noi){_SEGMENT_END}', re.I)),
+    (LIVE, re.compile(rf'/(?:truc-tiep|live|tuong-thuat){_SEGMENT_END}|/truc-tiep-', re.I)),
+    (GALLERY, re.compile(
+        r'/(?:emagazine|e-magazine|magazine|longform|photo|photos|album|gallery|infographic|infographics|multimedia)'
+        rf'{_SEGMENT_END}', re.I)),
+]
+
+# Badge trong markup: class của icon (icon-video, ic-photo, ico_camera...) hoặc data-type / data-media
+_BADGE_RE = re.compile(
+    r'(?:^|[-_])(?:icon|ico|ic|badge|type|label)[-_]?'
+    r'(video|play|clip|camera|photo|gallery|album|emagazine|magazine|podcast|audio|live)(?:$|[-_])',
+    re.I,
+)
+_BADGE_KINDS = {
+    'video': VIDEO, 'play': VIDEO, 'clip': VIDEO,
+    'camera': GALLERY, 'photo': GALLERY, 'gallery': GALLERY, 'album': GALLERY,
+    'emagazine': GALLERY, 'magazine': GALLERY,
+    'podcast': PODCAST, 'audio': PODCAST,
+    'live': LIVE,
+}
+_DATA_ATTRS = ('data-type', 'data-media', 'data-content-type')
+
+
+def parse_policy(value: str) -> Dict[str, str]:
+    """'video=metadata,live=skip' -> {loại: hành động} (bỏ qua phần không hợp lệ)"""
+    policy = {}
+    for part in value.split(','):
+        kind, _, action = part.partition('=')
+        kind, action = kind.strip().lower(), action.strip().lower()
+        if kind in KINDS and action in ACTIONS:
+            policy[kind] = action
+    return policy
+
+
+# Policy mặc định của mọi nguồn (nguồn có thể ghi đè self.media_policy trong __init__)
+DEFAULT_POLICY = parse_policy(config.MEDIA_POLICY)
+
+
+def classify_url(url: str) -> str:
+    for kind, pattern in _URL_PATTERNS:
+        if pattern.search(url or ''):
+            return kind
+    return TEXT
+
+
+def classify_element(el: Optional[Tag]) -> str:
+    """Loại bài theo badge trong markup của item trên trang danh sách"""
+    if el is None:
+        return TEXT
+    for tag in [el] + el.find_all(True):
+        for attr in _DATA_ATTRS:
+            value = (tag.get(attr) or '').lower()
+            if value in _BADGE_KINDS:
+                return _BADGE_KINDS[value]
+        for cls in tag.get('class') or ():
+            match = _BADGE_RE.search(cls)
+            if match:
+                return _BADGE_KINDS[match.group(1).lower()]
+    return TEXT
+
+
+def classify_entry(entry) -> str:
+    """Loại bài của entry RSS theo enclosure (video/*, audio/*)"""
+    for enclosure in entry.get('enclosures') or ():
+        media_type = (enclosure.get('type') or '').lower()
+        if media_type.startswith('video/'):
+            return VIDEO
+        if media_type.startswith('audio/'):
+            return PODCAST
+    return TEXT
+
+
+def classify(item, link: str) -> str:
+    """
+    Loại của một item trong filter_new
+
+    Args:
+        item: str, ListingItem (có .kind từ markup) hoặc entry RSS
+        link: URL của item
+    """
+    kind = getattr(item, 'kind', TEXT) or TEXT
+    if kind == TEXT and hasattr(item, 'get'):
+        kind = classify_entry(item)
+    if kind == TEXT:
+        kind = classify_url(link)
+    return kind
+
+
+def print_media_stats():
+    """
+    In số bài không phải bài chữ được bỏ qua / chỉ lưu metadata theo nguồn.
+    untitled: bài theo policy chỉ lưu metadata nhưng trang danh sách không cho title nên bị bỏ
+    """
+    sources = scrape_stats.sources('media_skip', 'media_metadata', 'media_untitled')
+    if not sources:
+        return
+
+    print("\n🎬 Media items (không fetch trang chi tiết):")
+    for source in sources:
+        print(
+            f"  {source:35} skipped={scrape_stats.count(source, 'media_skip'):4} "
+            f"metadata_only={scrape_stats.count(source, 'media_metadata'):4} "
+            f"untitled={scrape_stats.count(source, 'media_untitled'):4}"
+        )
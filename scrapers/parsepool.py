@@ -0,0 +1,108 @@
+"""
+Parse trang chi tiết trong process pool (PARSE_PROCESSES=true)
+
+Khi fetch chạy song song (fetch_articles, scrape_all nhiều worker), phần dựng DOM BeautifulSoup và trích
+nội dung trong _fetch_article_detail tốn CPU và giữ GIL, làm chậm các thread đang chờ mạng. Với tùy chọn
+này thread chỉ fetch HTML, còn _fetch_article_detail chạy trong process pool (mặc định một worker / core)
+trên HTML đã tải và trả về Article.
+
+Mỗi worker tạo một instance scraper theo class (cấu hình trong __init__ của scraper được giữ nguyên),
+HTML được đưa vào _prefetched nên fetch_html trong _fetch_article_detail không gọi mạng. Thống kê parse
+(scrape_stats) của worker được gửi về và cộng vào process chính.
+
+Pool được tạo lazy từ thread fetch trong lúc các thread khác đang chạy, nên worker dùng start method
+'spawn' chứ không fork: fork lúc thread khác đang giữ lock (stdout, scrape_stats, rate limiter...) làm lock
+đó bị giữ mãi trong process con và worker treo. Mỗi trang chờ tối đa PARSE_TIMEOUT giây, quá thì parse
+trên thread.
+"""
+
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional
+
+from config import config
+from database.article import Article
+from scrapers.stats import scrape_stats
+
+# Instance scraper trong mỗi worker process, theo class
+_worker_scrapers: Dict[type, object] = {}
+
+
+def _parse_in_worker(cls: type, link: str, html: str, args: tuple, kwargs: dict):
+    """Chạy trong worker process: (Article hoặc None, snapshot scrape_stats)"""
+    scraper = _worker_scrapers.get(cls)
+    if scraper is None:
+        scraper = _worker_scrapers[cls] = cls()
+    scrape_stats.reset()
+    scraper._prefetched[link] = html
+    try:
+        article = scraper._fetch_article_detail(link, *args, **kwargs)
+    finally:
+        scraper._prefetched.pop(link, None)
+    return article, scrape_stats.snapshot()
+
+
+class ParsePool:
+    """ProcessPoolExecutor tạo khi cần, dùng chung cho toàn bộ scrapers trong process"""
+
+    def __init__(self, workers: int, enabled: bool = True, timeout: float = 60):
+        self.workers = workers or os.cpu_count() or 1
+        self.enabled = enabled
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+            return self._executor
+
+    def parse(self, scraper, link: str, args: tuple, kwargs: dict) -> Optional[Article]:
+        """
+        Fetch HTML trên thread hiện tại rồi chạy _fetch_article_detail của scraper trong process pool.
+        Pool lỗi (worker chết, tham số không pickle được) hoặc quá self.timeout giây thì parse ngay trên
+        thread hiện tại; lỗi của chính _fetch_article_detail được raise lại như khi parse trên thread.
+        """
+        html = scraper.fetch_html(link)
+        if html is None:
+            return None
+
+        try:
+            future = self._pool().submit(_parse_in_worker, type(scraper), link, html, args, kwargs)
+            try:
+                article, stats = future.result(timeout=self.timeout)
+            except FutureTimeout:
+                future.cancel()
+                raise
+        except (BrokenProcessPool, pickle.PicklingError, FutureTimeout) as e:
+            reason = f"quá {self.timeout}s" if isinstance(e, FutureTimeout) else f"{type(e).__name__}: {e}"
+            print(f"⚠ Parse process lỗi ({reason}), parse trên thread: {link}")
+            with self._lock:
+                if isinstance(e, BrokenProcessPool):
+                    self._executor = None
+            scraper._prefetched[link] = html
+            try:
+                return scraper._fetch_article_detail(link, *args, **kwargs)
+            finally:
+                scraper._prefetched.pop(link, None)
+
+        scrape_stats.merge(stats)
+        return article
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+# Singleton dùng chung cho toàn bộ scrapers trong process
+parse_pool = ParsePool(config.PARSE_WORKERS, enabled=config.PARSE_PROCESSES, timeout=config.PARSE_TIMEOUT)
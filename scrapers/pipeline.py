@@ -0,0 +1,242 @@
+"""
+Pipeline theo stage: listing -> fetch trang chi tiết -> extract -> dedup -> persist
+
+Chế độ thường (main.scrape_*) chạy fetch_news của một nguồn tới hết, giữ toàn bộ bài trong list rồi
+mới ghi DB từng bài, nên chờ mạng, parse và ghi DB không bao giờ chạy chồng lên nhau. Ở đây mỗi stage
+có worker riêng, nối với stage sau bằng queue có giới hạn:
+- discover: chạy fetch_news ở chế độ chỉ lấy danh sách (NewsScraperBase.discover)
+- fetch: tải HTML trang chi tiết (NewsScraperBase.prefetch), vẫn đi qua rate limit / host limit
+- extract: fetch_article của scraper, đọc lại HTML đã tải nên chỉ tốn CPU
+- dedup: bỏ bài trùng link / title giữa các nguồn trong lần chạy
+- persist: ghi DB + seen-set
+
+Queue đầy thì stage trước phải chờ (backpressure): DB ghi chậm làm fetch chậm lại thay vì dồn bài
+trong bộ nhớ.
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from config import config
+from database.article import Article
+from database.models import db
+from scrapers.redirects import redirect_store
+from scrapers.seen import seen_store
+from scrapers.urlmodel import url_model
+
+# Đánh dấu hết input của một stage
+_DONE = object()
+
+
+class DetailJob(NamedTuple):
+    """Một bài cần fetch trang chi tiết: tham số của lời gọi fetch_article trong fetch_news"""
+    scraper: object
+    link: str
+    args: tuple
+    kwargs: dict
+
+
+class Stage:
+    """Một stage của pipeline: `workers` thread lấy item từ queue, gọi fn(item, emit)"""
+
+    def __init__(self, name: str, fn: Callable, workers: int, queue_size: int):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self.next: Optional['Stage'] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()  # Thời gian chờ stage sau trong lần gọi fn hiện tại của thread
+        self._running = 0
+        # Thống kê
+        self.processed = 0
+        self.emitted = 0
+        self.errors = 0
+        self.busy = 0.0      # Tổng thời gian worker chạy fn (không tính lúc chờ stage sau)
+        self.blocked = 0.0   # Tổng thời gian chờ queue của stage sau còn chỗ (backpressure)
+        self.max_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+
+    def put(self, item):
+        """Đưa item vào queue (chờ nếu queue đầy), ghi nhận độ sâu queue"""
+        self.queue.put(item)
+        depth = self.queue.qsize()
+        with self._lock:
+            self.max_depth = max(self.max_depth, depth)
+            self._depth_total += depth
+            self._depth_samples += 1
+
+    @property
+    def avg_depth(self) -> float:
+        return self._depth_total / self._depth_samples if self._depth_samples else 0.0
+
+    def _emit(self, item):
+        if self.next is None:
+            return
+        start = time.perf_counter()
+        self.next.put(item)
+        waited = time.perf_counter() - start
+        self._local.blocked += waited
+        with self._lock:
+            self.emitted += 1
+            self.blocked += waited
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            if item is _DONE:
+                break
+            start = time.perf_counter()
+            self._local.blocked = 0.0
+            try:
+                self.fn(item, self._emit)
+            except Exception as e:
+                with self._lock:
+                    self.errors += 1
+                print(f"✗ Pipeline [{self.name}] lỗi: {e}")
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.processed += 1
+                self.busy += elapsed - self._local.blocked
+
+        with self._lock:
+            self._running -= 1
+            last = self._running == 0
+        if last and self.next is not None:
+            for _ in range(self.next.workers):
+                self.next.put(_DONE)
+
+    def start(self) -> List[threading.Thread]:
+        self._running = self.workers
+        threads = [
+            threading.Thread(target=self._work, name=f"pipeline-{self.name}-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+
+class ScrapePipeline:
+    """
+    Chạy nhiều nguồn qua các stage discover -> fetch -> extract -> dedup -> persist.
+
+    Args:
+        save_to_db: Ghi DB ở stage persist
+        collect: Giữ lại các bài đã qua dedup để trả về (vd để export CSV); False thì không giữ bài nào
+    """
+
+    def __init__(self, save_to_db: bool = True, collect: bool = False):
+        self.save_to_db = save_to_db
+        self.collect = collect
+        self.articles: List[Article] = []
+        self.saved = 0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+        self._seen_links = set()
+        self._seen_titles = set()
+        self._failed_sources = set()  # id() của scraper có trang chi tiết lỗi (không lưu validator danh sách)
+
+        size = config.PIPELINE_QUEUE_SIZE
+        self.stages = [
+            Stage('discover', self._discover, config.PIPELINE_DISCOVER_WORKERS, size),
+            Stage('fetch', self._fetch, config.PIPELINE_FETCH_WORKERS, size),
+            Stage('extract', self._extract, config.PIPELINE_EXTRACT_WORKERS, size),
+            Stage('dedup', self._dedup, 1, size),
+            Stage('persist', self._persist, config.PIPELINE_PERSIST_WORKERS, size),
+        ]
+        for stage, next_stage in zip(self.stages, self.stages[1:]):
+            stage.next = next_stage
+
+    # --- Stage functions: fn(item, emit) ---
+
+    @staticmethod
+    def _discover(job: Tuple[object, dict], emit):
+        scraper, kwargs = job
+        sink = lambda link, args, kw: emit(DetailJob(scraper, link, args, kw))
+        for article in scraper.discover(sink, **kwargs):
+            emit(article)
+
+    def _fetch(self, item, emit):
+        if isinstance(item, Article) or item.scraper.prefetch(item.link):
+            emit(item)
+        else:
+            self._failed_sources.add(id(item.scraper))
+
+    def _extract(self, item, emit):
+        if isinstance(item, DetailJob):
+            try:
+                item = item.scraper.fetch_article(item.link, *item.args, **item.kwargs)
+            except Exception:
+                self._failed_sources.add(id(item.scraper))
+                raise
+        if item is not None:
+            emit(item)
+
+    def _dedup(self, article: Article, emit):
+        # Một worker duy nhất nên không cần lock
+        if article.link in self._seen_links or article.title in self._seen_titles:
+            return
+        self._seen_links.add(article.link)
+        self._seen_titles.add(article.title)
+        emit(article)
+
+    def _persist(self, article: Article, emit):
+        saved = self.save_to_db and db.insert_article(article)
+        # Ghi nhận URL đã lấy (kể cả khi DB lỗi) để lần chạy sau không fetch lại
+        seen_store.add(article.source, [article.link])
+        with self._lock:
+            self.saved += int(bool(saved))
+            if self.collect:
+                self.articles.append(article)
+
+    # --- Runtime ---
+
+    def run(self, jobs: Iterable[Tuple[object, dict]]) -> List[Article]:
+        """
+        Args:
+            jobs: (scraper, kwargs của fetch_news) cho từng nguồn
+
+        Returns:
+            Các bài đã qua dedup (chỉ khi collect=True)
+        """
+        start = time.perf_counter()
+        threads = []
+        for stage in self.stages:
+            threads.extend(stage.start())
+
+        first = self.stages[0]
+        scrapers = []
+        for job in jobs:
+            scrapers.append(job[0])
+            first.put(job)
+        for _ in range(first.workers):
+            first.put(_DONE)
+
+        for thread in threads:
+            thread.join()
+        # Validator trang danh sách chỉ được lưu khi mọi trang chi tiết của nguồn đã lấy xong
+        for scraper in scrapers:
+            if id(scraper) in self._failed_sources:
+                scraper.discard_validators()
+            else:
+                scraper.commit_validators()
+        seen_store.flush()
+        redirect_store.flush()
+        url_model.flush()
+        self.elapsed = time.perf_counter() - start
+        return self.articles
+
+    def print_stats(self):
+        """In throughput, thời gian bận / chờ và độ sâu queue của từng stage"""
+        print(f"\n🏭 Pipeline stages ({self.elapsed:.1f}s, saved={self.saved}):")
+        for stage in self.stages:
+            rate = stage.processed / self.elapsed if self.elapsed else 0.0
+            print(
+                f"  {stage.name:10} workers={stage.workers:3} in={stage.processed:5} out={stage.emitted:5} "
+                f"errors={stage.errors:3} rate={rate:7.1f}/s busy={stage.busy:7.1f}s "
+                f"blocked={stage.blocked:7.1f}s queue_max={stage.max_depth:3} queue_avg={stage.avg_depth:5.1f}"
+            )
@@ -0,0 +1,81 @@
+"""
+Rate limiter dùng chung toàn process, key theo domain (token bucket)
+
+Mỗi domain có một bucket với:
+- rate: số token nạp lại mỗi giây (request/giây)
+- burst: số token tối đa tích lũy được
+
+Chỉ phải chờ khi domain đã dùng hết token, thay vì sleep cố định trước mỗi request.
+"""
+
+import threading
+import time
+from typing import Dict
+
+from scrapers.hostlimit import host_of
+
+
+class TokenBucket:
+    """Token bucket thread-safe, cho phép token âm để xếp hàng các request đang chờ"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Lấy 1 token, trả về số giây cần chờ trước khi được gửi request"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def update(self, rate: float, burst: int):
+        """Giữ cấu hình chặt nhất khi nhiều scraper dùng chung một domain"""
+        with self._lock:
+            self.rate = min(self.rate, rate)
+            self.burst = min(self.burst, max(1, burst))
+            self.tokens = min(self.tokens, self.burst)
+
+
+class DomainRateLimiter:
+    """Registry các token bucket theo domain"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str, rate: float, burst: int) -> TokenBucket:
+        domain = host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(domain)
+            if bucket is None:
+                bucket = TokenBucket(rate, burst)
+                self._buckets[domain] = bucket
+            elif rate < bucket.rate or burst < bucket.burst:
+                bucket.update(rate, burst)
+            return bucket
+
+    def acquire(self, url: str, rate: float, burst: int = 1) -> float:
+        """
+        Chờ cho đến khi domain của URL còn token.
+
+        Returns:
+            Số giây đã chờ (0 nếu còn token hoặc rate <= 0, tức không giới hạn)
+        """
+        if rate <= 0:
+            return 0.0
+        wait = self.bucket(url, rate, burst).reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+# Singleton dùng chung cho toàn bộ scrapers trong process
+rate_limiter = DomainRateLimiter()
@@ -0,0 +1,122 @@
+"""
+Trích nội dung chính của trang theo heuristic (kiểu Readability), không cần selector riêng của nguồn
+
+Dùng khi selector của nguồn không lấy được nội dung (bài video / ảnh, layout mới...), chạy trên HTML
+đã tải về nên không tốn thêm request:
+- Bỏ script, style, nav, header, footer, aside, form...
+- Mỗi khối văn bản (p, figcaption, div chỉ chứa text) cộng điểm cho phần tử cha (và nửa điểm cho
+  ông) theo độ dài và số dấu phẩy (mật độ chữ)
+- Điểm nhân (1 - link density): khối toàn link (menu, tin liên quan) bị loại
+- Lấy các đoạn văn của container điểm cao nhất
+"""
+
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, Tag
+
+from scrapers.stats import scrape_stats
+
+REMOVE_TAGS = ('script', 'style', 'noscript', 'iframe', 'nav', 'header', 'footer', 'aside', 'form', 'svg', 'button')
+CANDIDATE_TAGS = {'div', 'article', 'section', 'main', 'td'}
+BLOCK_TAGS = {'p', 'figcaption', 'blockquote', 'pre', 'h2', 'h3', 'li', 'td'}
+TEXT_BLOCK_CHILDREN = {'div', 'p', 'table', 'ul', 'ol', 'section', 'article', 'figure', 'blockquote'}
+
+# Đoạn ngắn hơn không được tính điểm / không lấy vào nội dung
+MIN_BLOCK_LENGTH = 25
+# Nội dung trích ra ngắn hơn thì coi như không có
+MIN_CONTENT_LENGTH = 80
+# Đoạn có tỷ lệ chữ nằm trong link cao hơn thì bỏ
+MAX_LINK_DENSITY = 0.5
+
+
+def _text_length(el: Tag) -> int:
+    return len(el.get_text(strip=True))
+
+
+def _link_density(el: Tag) -> float:
+    total = _text_length(el)
+    if not total:
+        return 1.0
+    links = sum(_text_length(a) for a in el.find_all('a'))
+    return links / total
+
+
+def _is_text_block(el: Tag) -> bool:
+    if el.name in ('p', 'figcaption', 'blockquote', 'pre'):
+        return True
+    # <div> chỉ chứa text / inline (nhiều trang viết đoạn văn bằng div)
+    return el.name == 'div' and el.find(TEXT_BLOCK_CHILDREN) is None
+
+
+def _best_candidate(root: Tag) -> Optional[Tag]:
+    scores: Dict[int, float] = {}
+    nodes: Dict[int, Tag] = {}
+
+    for block in root.find_all(['p', 'figcaption', 'blockquote', 'pre', 'div']):
+        if not _is_text_block(block):
+            continue
+        text = block.get_text(' ', strip=True)
+        if len(text) < MIN_BLOCK_LENGTH:
+            continue
+        score = 1 + text.count(',') + min(len(text) // 100, 3)
+
+        parent = block.parent
+        for weight in (1.0, 0.5):
+            if parent is None or not isinstance(parent, Tag) or parent.name in ('body', '[document]', 'html'):
+                break
+            if parent.name in CANDIDATE_TAGS:
+                key = id(parent)
+                nodes[key] = parent
+                scores[key] = scores.get(key, 0.0) + score * weight
+            parent = parent.parent
+
+    best, best_score = None, 0.0
+    for key, score in scores.items():
+        score *= 1 - _link_density(nodes[key])
+        if score > best_score:
+            best, best_score = nodes[key], score
+    return best
+
+
+def extract_main_text(soup: BeautifulSoup, separator: str = ' ') -> str:
+    """
+    Nội dung chính của trang (chuỗi rỗng nếu không tìm được)
+
+    Args:
+        soup: Soup của cả trang (không dùng soup targeted parse); soup bị sửa (xóa script, nav...)
+        separator: Chuỗi nối các đoạn
+    """
+    for el in soup.find_all(REMOVE_TAGS):
+        el.decompose()
+
+    candidate = _best_candidate(soup.body or soup)
+    if candidate is None:
+        return ''
+
+    texts: List[str] = []
+    stack = [child for child in reversed(candidate.contents) if isinstance(child, Tag)]
+    while stack:
+        el = stack.pop()
+        if el.name in BLOCK_TAGS or _is_text_block(el):
+            # Lấy cả khối, không xét lại các khối lồng bên trong (vd <p> trong <blockquote>)
+            text = el.get_text(' ', strip=True)
+            if len(text) >= MIN_BLOCK_LENGTH and _link_density(el) <= MAX_LINK_DENSITY:
+                texts.append(text)
+            continue
+        stack.extend(child for child in reversed(el.contents) if isinstance(child, Tag))
+
+    content = separator.join(texts).strip()
+    return content if len(content) >= MIN_CONTENT_LENGTH else ''
+
+
+def print_readability_stats():
+    """In số bài phải dùng extractor dự phòng theo nguồn"""
+    sources = scrape_stats.sources('readability', 'readability_empty')
+    if not sources:
+        return
+
+    print("\n📰 Fallback content extractor:")
+    for source in sources:
+        filled = scrape_stats.count(source, 'readability')
+        empty = scrape_stats.count(source, 'readability_empty')
+        print(f"  {source:35} filled={filled:4} still_empty={empty:4}")
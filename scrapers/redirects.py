@@ -0,0 +1,121 @@
+"""
+Lưu các redirect đã gặp (URL gốc -> URL cuối) vào file JSON, dùng chung giữa các lần chạy
+
+Nhiều nguồn trả 301/308 cho link trong RSS / trang danh sách (URL cũ, http -> https, link rút gọn).
+Lần sau gặp lại URL gốc thì đi thẳng tới URL cuối: không tốn request cho các bước redirect, và link lưu DB,
+cache key, seen-set đều dùng URL cuối nên cùng một bài chỉ có một key.
+
+Chỉ lưu chuỗi redirect mà mọi bước đều vĩnh viễn (301 / 308). Redirect tạm (302 / 303 / 307) có thể là
+soft-404 về trang chủ, trang đăng nhập / anti-bot hay A/B test, lưu lại thì mất URL bài viết vĩnh viễn.
+Redirect mới được giữ trong bộ nhớ và ghi xuống file một lần cuối lần chạy (flush), gộp với file hiện có.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from config import config
+from scrapers.stats import scrape_stats
+from utils.urls import normalize_url
+
+# Giới hạn số bước khi đi theo chuỗi redirect đã lưu (phòng vòng lặp)
+MAX_HOPS = 5
+# Status redirect vĩnh viễn
+PERMANENT_STATUS = (301, 308)
+
+
+def is_permanent(history) -> bool:
+    """Mọi bước trong resp.history đều là redirect vĩnh viễn"""
+    return bool(history) and all(resp.status_code in PERMANENT_STATUS for resp in history)
+
+
+class RedirectStore:
+    """Store {URL gốc đã chuẩn hóa: URL cuối} ghi xuống file JSON"""
+
+    def __init__(self, path: str, enabled: bool = True):
+        self.path = Path(path)
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, str]] = None
+        self._pending: Dict[str, str] = {}  # Redirect mới chưa ghi xuống file
+
+    def _read(self) -> Dict[str, str]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _load(self) -> Dict[str, str]:
+        if self._data is None:
+            self._data = self._read()
+        return self._data
+
+    def flush(self):
+        """Ghi các redirect mới xuống file, gộp với nội dung file hiện tại (process khác có thể đã ghi thêm)"""
+        with self._lock:
+            if not self._pending:
+                return
+            data = self._read()
+            data.update(self._pending)
+            # Ghi ra file tạm rồi replace để không hỏng file khi nhiều job ghi cùng lúc
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+            self._data = data
+            self._pending = {}
+
+    def resolve(self, url: str) -> str:
+        """URL cuối đã biết của `url` (chính nó nếu chưa gặp redirect nào)"""
+        if not self.enabled or not url:
+            return url
+        with self._lock:
+            data = self._load()
+            for _ in range(MAX_HOPS):
+                target = data.get(normalize_url(url))
+                if not target or target == url:
+                    break
+                url = target
+        return url
+
+    def record(self, url: str, final_url: str):
+        """
+        Ghi nhận redirect vĩnh viễn `url` -> `final_url` (bỏ qua nếu hai URL cùng dạng chuẩn).
+        Chỉ cập nhật bộ nhớ, ghi xuống file ở flush().
+        """
+        if not self.enabled or not final_url:
+            return
+        key, final_url = normalize_url(url), normalize_url(final_url)
+        if key == final_url:
+            return
+        with self._lock:
+            data = self._load()
+            if data.get(key) == final_url:
+                return
+            data[key] = final_url
+            self._pending[key] = final_url
+
+
+def print_redirect_stats():
+    """In số redirect gặp mới / số lần đi thẳng tới URL cuối đã biết theo nguồn"""
+    sources = scrape_stats.sources('redirect', 'redirect_skip')
+    if not sources:
+        return
+
+    print("\n↪ Redirects:")
+    for source in sources:
+        print(
+            f"  {source:35} followed={scrape_stats.count(source, 'redirect'):4} "
+            f"skipped={scrape_stats.count(source, 'redirect_skip'):4}"
+        )
+
+
+# Singleton dùng chung cho toàn bộ scrapers trong process
+redirect_store = RedirectStore(
+    os.path.join(config.CACHE_DIR, 'redirects.json'),
+    enabled=config.REDIRECT_CACHE,
+)
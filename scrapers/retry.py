@@ -0,0 +1,128 @@
+"""
+Retry và circuit breaker cho các request HTTP
+
+- backoff_delay: exponential backoff có jitter (full jitter)
+- retry_after_seconds: đọc header Retry-After (số giây hoặc HTTP-date) của response 429/503
+- CircuitBreaker: theo domain, mở sau N lần lỗi liên tiếp và bỏ qua domain đó trong thời gian cooldown,
+  hết cooldown thì chỉ cho một request thử (half-open): thành công thì đóng, lỗi thì mở lại ngay
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from config import config
+from scrapers.hostlimit import host_of
+from scrapers.stats import scrape_stats
+
+# Status code nên thử lại (lỗi tạm thời phía server / bị giới hạn)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Domain đang bị ngắt (circuit open), không gửi request"""
+
+
+def backoff_delay(attempt: int, base: float = None, cap: float = None) -> float:
+    """Số giây chờ trước lần thử thứ `attempt` (bắt đầu từ 1), random trong [0, min(cap, base * 2^(attempt-1))]"""
+    base = config.RETRY_BACKOFF_BASE if base is None else base
+    cap = config.RETRY_BACKOFF_MAX if cap is None else cap
+    return random.uniform(0, min(cap, base * (2 ** (attempt - 1))))
+
+
+def retry_after_seconds(resp) -> Optional[float]:
+    """Giá trị Retry-After (giây) của response, None nếu không có / không đọc được"""
+    value = resp.headers.get('Retry-After')
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """Đếm lỗi liên tiếp theo domain, mở circuit khi đạt ngưỡng"""
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._probing: Dict[str, float] = {}  # domain -> lúc bắt đầu request thử (half-open)
+
+    def allow(self, url: str) -> bool:
+        """
+        False nếu domain đang trong thời gian cooldown. Hết cooldown thì chỉ một caller được thử (half-open),
+        các caller khác nhận False tới khi request thử có kết quả (record_success / record_failure).
+        Request thử không báo kết quả trong một cooldown thì cho caller khác thử.
+        """
+        domain = host_of(url)
+        with self._lock:
+            opened_at = self._opened_at.get(domain)
+            if opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - opened_at < self.cooldown:
+                return False
+            probe_started = self._probing.get(domain)
+            if probe_started is not None and now - probe_started < self.cooldown:
+                return False
+            self._probing[domain] = now
+            return True
+
+    def record_success(self, url: str):
+        domain = host_of(url)
+        with self._lock:
+            self._failures.pop(domain, None)
+            self._opened_at.pop(domain, None)
+            self._probing.pop(domain, None)
+
+    def record_failure(self, url: str) -> bool:
+        """Ghi nhận một lần lỗi. Trả về True nếu circuit vừa mở (hoặc mở lại sau lần thử half-open)"""
+        domain = host_of(url)
+        with self._lock:
+            failures = self._failures.get(domain, 0) + 1
+            self._failures[domain] = failures
+            probe = self._probing.pop(domain, None) is not None
+            if failures < self.threshold and not probe:
+                return False
+            self._opened_at[domain] = time.monotonic()
+            return True
+
+    def open_domains(self) -> Dict[str, int]:
+        """{domain: số lỗi liên tiếp} của các domain đang mở circuit"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                domain: self._failures.get(domain, 0)
+                for domain, opened_at in self._opened_at.items()
+                if now - opened_at < self.cooldown
+            }
+
+
+# Singleton dùng chung cho toàn bộ scrapers trong process
+circuit_breaker = CircuitBreaker(config.CIRCUIT_FAILURE_THRESHOLD, config.CIRCUIT_COOLDOWN)
+
+
+def print_retry_stats():
+    """In số lần retry / số request bị bỏ qua theo nguồn và các domain đang mở circuit"""
+    sources = scrape_stats.sources('retry', 'circuit_skip')
+    open_domains = circuit_breaker.open_domains()
+    if not sources and not open_domains:
+        return
+
+    print("\n🔁 Retry / circuit breaker:")
+    for source in sources:
+        print(
+            f"  {source:35} retries={scrape_stats.count(source, 'retry'):4} "
+            f"skipped={scrape_stats.count(source, 'circuit_skip'):4}"
+        )
+    for domain, failures in sorted(open_domains.items()):
+        print(f"  ⚠ Circuit open: {domain} ({failures} lỗi liên tiếp)")
@@ -1,9 +1,20 @@
+from database.article import Article
 from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
+from scrapers.extract import ArticleSpec
+from typing import List, Optional
 from datetime import datetime
-import feedparser
-import re
+
+ARTICLE_SPEC = ArticleSpec(
+    title='h1.post-title',
+    date='.post-date',
+    # Link đầu tiên trong breadcrumb
+    category='a[rel="v:url"][property="v:title"]',
+    sapo='.post-summary',
+    body='.post-content',
+    noise=('.related-post', '.video-wrapper', '.author-info'),
+    min_paragraph_length=31,
+    separator='\n\n',
+)
 
 
 class QDNDRSSScraper(NewsScraperBase):
@@ -11,23 +22,15 @@ class QDNDRSSScraper(NewsScraperBase):
         super().__init__()
         self.source = "qdnd.vn"
         self.rss_url = "https://www.qdnd.vn/rss/cate/tin-tuc-moi-nhat.rss"
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self, max_articles: int = 10) -> List[Tuple]:
+    def fetch_news(self, max_articles: int = 10) -> List[Article]:
         all_articles = []
 
         print(f"\n📡 Đang đọc RSS từ: {self.rss_url}")
 
-        # 1. Fetch RSS với requests (vì feedparser trực tiếp bị chặn bởi redirect)
-        try:
-            import requests
-            response = requests.get(self.rss_url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-
-            # Parse RSS content bằng feedparser
-            feed = feedparser.parse(response.text)
-        except Exception as e:
-            print(f"⚠ Lỗi khi fetch RSS: {e}")
-            return []
+        # 1. Fetch RSS qua fetch_feed (requests xử lý được redirect mà feedparser trực tiếp bị chặn)
+        feed = self.fetch_feed(self.rss_url)
 
         if not feed.entries:
             print("⚠ Không thể lấy dữ liệu từ RSS.")
@@ -39,70 +42,34 @@ class QDNDRSSScraper(NewsScraperBase):
             link = entry.link
             if link not in article_links:
                 article_links.append(link)
-            if len(article_links) >= max_articles:
-                break
 
         print(f"✓ Tìm thấy {len(article_links)} bài viết mới từ RSS.")
+        article_links = self.filter_new(article_links, limit=max_articles)
 
         # 3. Duyệt từng bài để cào nội dung chi tiết
-        for i, link in enumerate(article_links, 1):
-            print(f"[{i}/{len(article_links)}] Đang cào: {link}", flush=True)
-            self.sleep()
-            data = self._fetch_article_detail(link)
-            if data:
-                all_articles.append(data)
+        all_articles.extend(self.fetch_articles(article_links))
 
         return all_articles
 
-    def _fetch_article_detail(self, link: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str) -> Optional[Article]:
         html = self.fetch_html(link)
         if not html: return None
-        soup = BeautifulSoup(html, 'html.parser')
+
+        article = self.extract_article(html)
 
         # 1. Title: Báo QDND dùng class post-title
-        title_el = soup.select_one('h1.post-title')
-        title = title_el.get_text(strip=True) if title_el else ""
+        title = article.title
 
         # 2. Category: Lấy từ breadcrumb (link đầu tiên)
-        category = "MILITARY"
-        # Tìm link đầu tiên trong breadcrumb với rel="v:url" và property="v:title"
-        cate_el = soup.find('a', rel='v:url', property='v:title')
-        if cate_el:
-            category = cate_el.get_text(strip=True).upper()
+        category = (article.category or "MILITARY").upper()
 
         # 3. Published At: Lấy từ class post-date (Ví dụ: Chủ nhật, 04/01/2026)
-        published_at = int(datetime.now().timestamp())
-        date_el = soup.select_one('.post-date')
-        if date_el:
-            date_match = re.search(r'(\d{2}/\d{2}/\d{4})', date_el.get_text())
-            if date_match:
-                try:
-                    dt = datetime.strptime(date_match.group(1), "%d/%m/%Y")
-                    published_at = int(dt.timestamp())
-                except: pass
-
-        # 4. Content: Báo QDND dùng class post-content
-        paragraphs = []
-        # Lấy Sapo (Tóm tắt)
-        sapo_el = soup.select_one('.post-summary')
-        if sapo_el:
-            paragraphs.append(sapo_el.get_text(strip=True))
-
-        # Lấy nội dung chính
-        content_area = soup.select_one('.post-content')
-        if content_area:
-            # Loại bỏ các div quảng cáo, video, ảnh liên quan nếu có
-            for r in content_area.select('.related-post, .video-wrapper, .author-info'):
-                r.decompose()
-
-            for p in content_area.find_all('p'):
-                txt = p.get_text(strip=True)
-                if len(txt) > 30:
-                    paragraphs.append(txt)
-
-        content = "\n\n".join(paragraphs)
+        published_at = self.parse_published(article.date, int(datetime.now().timestamp()))
+
+        # 4. Content: sapo + các đoạn trong post-content
+        content = article.content
 
         if not title or len(content) < 100:
             return None
 
-        return (published_at, title, link, content, self.source, "NA", "NA", False, category)
+        return Article(published_at, title, link, content, self.source, category=category)
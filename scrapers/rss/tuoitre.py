@@ -1,9 +1,18 @@
+from database.article import Article
 from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
-from datetime import datetime
-import feedparser
-import re
+from scrapers.extract import ArticleSpec
+from typing import List, Optional
+
+ARTICLE_SPEC = ArticleSpec(
+    title=['.detail-title', 'h1'],
+    date=['.detail-time', 'meta[property="article:published_time"]'],
+    category='meta[property="article:section"]',
+    category_attr='content',
+    meta={'category': 'article:section'},
+    body=['.fck', '.detail-content'],
+    # Video, tin liên quan, quảng cáo
+    noise=('.vnn-title', '.box-tin-lien-quan', '.ad-container'),
+)
 
 
 class TuoiTreRSSScraper(NewsScraperBase):
@@ -15,65 +24,36 @@ class TuoiTreRSSScraper(NewsScraperBase):
         super().__init__()
         self.source = "tuoitre.vn"
         self.rss_url = "https://tuoitre.vn/rss/tin-moi-nhat.rss"
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self) -> List[Tuple]:
+    def fetch_news(self) -> List[Article]:
         """Lấy 20 tin mới nhất từ Tuổi Trẻ"""
         all_articles = []
         print(f"\n📡 Đang đọc RSS từ: {self.rss_url}")
 
-        feed = feedparser.parse(self.rss_url)
+        feed = self.fetch_feed(self.rss_url)
         if not feed.entries:
             return []
 
         entries_to_process = feed.entries[:20]
-        for entry in entries_to_process:
-            link = entry.link
-            self.sleep()
-            article_data = self._fetch_article_detail(link)
-            if article_data:
-                all_articles.append(article_data)
+        entries_to_process = self.filter_new(entries_to_process)
+        all_articles.extend(self.fetch_articles([entry.link for entry in entries_to_process]))
 
         return all_articles
 
-    def _fetch_article_detail(self, link: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str) -> Optional[Article]:
         html = self.fetch_html(link)
         if not html:
             return None
 
-        soup = BeautifulSoup(html, 'html.parser')
+        article = self.extract_article(html)
 
-        title_el = soup.select_one('.detail-title') or soup.select_one('h1')
-        title = title_el.get_text(strip=True) if title_el else ''
+        title = article.title
         if not title: return None
 
         # Format: dd/mm/yyyy HH:mm GMT+7
-        published_at = 0
-        date_el = soup.select_one('.detail-time') or soup.find('meta', property='article:published_time')
-        if date_el:
-            date_text = date_el.get_text(strip=True) if not date_el.get('content') else date_el.get('content')
-            date_match = re.search(r'(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{2})', date_text)
-            if date_match:
-                day, month, year, hour, minute = date_match.groups()
-                try:
-                    dt = datetime(int(year), int(month), int(day), int(hour), int(minute))
-                    published_at = int(dt.timestamp())
-                except: pass
-
-        content = ""
-        content_el = soup.select_one('.fck') or soup.select_one('.detail-content')
-        if content_el:
-            # Remove video, related news, ads
-            for unwanted in content_el.select('.vnn-title, .box-tin-lien-quan, .ad-container'):
-                unwanted.decompose()
-            paragraphs = content_el.select('p')
-            content = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
+        published_at = self.parse_published(article.date)
 
-        category = "TIN MỚI"
-        meta_cate = soup.find('meta', property='article:section')
-        if meta_cate:
-            category = meta_cate.get('content').upper().strip()
+        category = (article.category or "TIN MỚI").upper().strip()
 
-        return (
-            published_at, title, link, content, self.source,
-            "NA", "NA", False, category,
-        )
+        return Article(published_at, title, link, article.content, self.source, category=category)
@@ -1,9 +1,10 @@
+from database.article import Article
 from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-import feedparser
+from scrapers.dates import from_struct_time
+from typing import List, Optional
 from datetime import datetime
 import html
-from bs4 import BeautifulSoup
+from utils.html_parser import make_soup
 
 
 class VnEconomyScraper(NewsScraperBase):
@@ -14,20 +15,20 @@ class VnEconomyScraper(NewsScraperBase):
         self.source = "vneconomy.vn"
         self.rss_url = "https://vneconomy.vn/tin-moi.rss"
 
-    def fetch_news(self, max_articles: int = 20) -> List[Tuple]:
+    def fetch_news(self, max_articles: int = 20) -> List[Article]:
         """Fetch tin tức từ VnEconomy qua RSS"""
         all_articles = []
 
         print(f"\n📰 Fetching VnEconomy RSS: {self.rss_url}")
 
-        feed = feedparser.parse(self.rss_url)
+        feed = self.fetch_feed(self.rss_url)
 
         if not feed.entries:
             print("⚠ Không tìm thấy bài viết nào trong RSS feed.")
             return []
 
-        entries = feed.entries[:max_articles]
-        print(f"✓ Tìm thấy {len(entries)} bài viết từ RSS.")
+        print(f"✓ Tìm thấy {len(feed.entries)} bài viết từ RSS.")
+        entries = self.filter_new(feed.entries, limit=max_articles)
 
         for entry in entries:
             try:
@@ -35,9 +36,7 @@ class VnEconomyScraper(NewsScraperBase):
                 link = entry.link
 
                 # pubDate format: Fri, 02 Jan 2026 09:06:03 GMT
-                published_at = int(datetime.now().timestamp())
-                if hasattr(entry, 'published_parsed'):
-                    published_at = int(datetime(*entry.published_parsed[:6]).timestamp())
+                published_at = from_struct_time(entry.get('published_parsed'), int(datetime.now().timestamp()))
 
                 # Ưu tiên content:encoded vì nó đầy đủ nhất
                 content = ""
@@ -51,21 +50,9 @@ class VnEconomyScraper(NewsScraperBase):
                 if hasattr(entry, 'category'):
                     category = entry.category.upper()
 
-                author = "NA"
-                if hasattr(entry, 'author'):
-                    author = entry.author
-
-                article_data = (
-                    published_at,
-                    title,
-                    link,
-                    content,
-                    self.source,
-                    author,
-                    "NA",
-                    False,
-                    category,
-                )
+                # Tác giả (entry.author) không có cột riêng trong bảng news nên không lưu,
+                # stock_related để "NA" cho bước phân tích mã cổ phiếu điền sau
+                article_data = Article(published_at, title, link, content, self.source, category=category)
                 all_articles.append(article_data)
 
             except Exception as e:
@@ -73,6 +60,8 @@ class VnEconomyScraper(NewsScraperBase):
                 continue
 
         print(f"✓ Đã xử lý xong {len(all_articles)} bài viết.")
+        # Nội dung lấy từ RSS, không qua fetch_articles: lưu ETag / Last-Modified của feed tại đây
+        self.commit_validators()
         return all_articles
 
     def _clean_rss_content(self, raw_html: str) -> str:
@@ -83,7 +72,7 @@ class VnEconomyScraper(NewsScraperBase):
         # Decode HTML entities: &#237; -> í
         decoded_html = html.unescape(raw_html)
 
-        soup = BeautifulSoup(decoded_html, 'html.parser')
+        soup = make_soup(decoded_html)
 
         # VnEconomy thường để tóm tắt trong thẻ <h2>, lấy cả <h2> và <p>
         text_parts = []
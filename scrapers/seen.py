@@ -0,0 +1,109 @@
+"""
+Tập URL đã thấy (Bloom filter) lưu trên đĩa, mỗi nguồn một file, dùng chung giữa các lần chạy và các process
+
+- File CACHE_DIR/seen/<source>.bloom được mmap, nhiều process (scheduler jobs) cùng đọc/ghi
+- Key là URL bài viết đã chuẩn hóa (normalize_url)
+- Kiểm tra không cần round trip tới DB, vẫn dedup được khi Postgres không kết nối được
+
+Bloom filter có thể báo nhầm "đã thấy" với xác suất rất nhỏ (xem SEEN_FILTER_BITS),
+không bao giờ báo nhầm "chưa thấy".
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable
+
+from config import config
+from utils.urls import normalize_url
+
+NUM_HASHES = 7
+
+
+class BloomFilter:
+    """Bloom filter trên file mmap (m bit, k hash dạng double hashing)"""
+
+    def __init__(self, path: str, num_bits: int, num_hashes: int = NUM_HASHES):
+        self.path = Path(path)
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        size = (num_bits + 7) // 8
+        with open(self.path, 'a+b') as f:
+            if os.fstat(f.fileno()).st_size < size:
+                f.truncate(size)
+            self._mm = mmap.mmap(f.fileno(), size)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, key: str) -> bool:
+        mm = self._mm
+        return all(mm[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key: str):
+        positions = self._positions(key)
+        with self._lock:
+            mm = self._mm
+            for pos in positions:
+                mm[pos >> 3] |= 1 << (pos & 7)
+
+    def flush(self):
+        self._mm.flush()
+
+
+class SeenStore:
+    """Registry các Bloom filter theo nguồn (mở lazy, một lần mỗi process)"""
+
+    def __init__(self, directory: str, num_bits: int, enabled: bool = True):
+        self.directory = Path(directory)
+        self.num_bits = num_bits
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._filters: Dict[str, BloomFilter] = {}
+
+    def _filter(self, source: str) -> BloomFilter:
+        with self._lock:
+            bloom = self._filters.get(source)
+            if bloom is None:
+                name = re.sub(r'[^\w.-]', '_', source) or 'default'
+                bloom = BloomFilter(self.directory / f"{name}.bloom", self.num_bits)
+                self._filters[source] = bloom
+            return bloom
+
+    def seen(self, source: str, url: str) -> bool:
+        """URL đã được ghi nhận cho nguồn này chưa"""
+        if not self.enabled or not url:
+            return False
+        return normalize_url(url) in self._filter(source)
+
+    def add(self, source: str, urls: Iterable[str]):
+        """Ghi nhận các URL đã lấy xong"""
+        if not self.enabled:
+            return
+        bloom = self._filter(source)
+        for url in urls:
+            if url:
+                bloom.add(normalize_url(url))
+
+    def flush(self):
+        with self._lock:
+            filters = list(self._filters.values())
+        for bloom in filters:
+            bloom.flush()
+
+
+# Singleton dùng chung cho toàn bộ scrapers trong process
+seen_store = SeenStore(
+    os.path.join(config.CACHE_DIR, 'seen'),
+    num_bits=config.SEEN_FILTER_BITS,
+    enabled=config.SEEN_FILTER,
+)
@@ -1,8 +1,20 @@
-from scrapers.base import NewsScraperBase
-from typing import List, Tuple, Optional
-from bs4 import BeautifulSoup
-from datetime import datetime
-import re
+from database.article import Article
+from scrapers.base import ListingItem, NewsScraperBase
+from scrapers.extract import ArticleSpec
+from typing import List, Optional
+from utils.html_parser import make_soup
+
+ARTICLE_SPEC = ArticleSpec(
+    title=['h1', '.article-title'],
+    # Priority 1: Meta tag article:published_time (ISO format), priority 2: span.datenew
+    date='meta[property="article:published_time"]',
+    # <a href="/kinh-te.htm" itemprop="item" title="Kinh tế" class="bcrumbs-item"><span itemprop="name">Kinh tế</span></a>
+    # Bỏ item đầu (thường là Trang chủ), lấy item thứ 2
+    category='a.bcrumbs-item[itemprop="item"] span[itemprop="name"]',
+    category_index=1,
+    body=['.detail-content', '.article-content', '[itemprop="articleBody"]'],
+    extra={'datenew': 'span.datenew'},
+)
 
 
 class VietStockScraper(NewsScraperBase):
@@ -11,9 +23,11 @@ class VietStockScraper(NewsScraperBase):
     def __init__(self):
         super().__init__()
         self.source = "vietstock.vn"
+        self.base_url = "https://vietstock.vn"
         self.headers['Referer'] = 'https://vietstock.vn/'
+        self.article_spec = ARTICLE_SPEC
 
-    def fetch_news(self, max_articles: int = 15) -> List[Tuple]:
+    def fetch_news(self, max_articles: int = 15) -> List[Article]:
         """
         Fetch tin tức từ VietStock trang Mới cập nhật bằng Selenium
 
@@ -79,11 +93,12 @@ class VietStockScraper(NewsScraperBase):
                 driver.quit()
                 print("→ Browser closed")
 
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
 
         # Find all article links
         # URL pattern: /YYYY/MM/article-slug-###-XXXXXXX.htm
         article_links = []
+        seen_links = set()
 
         titled_links = soup.find_all('a', title=True, href=lambda x: x and '.htm' in x)
 
@@ -97,116 +112,48 @@ class VietStockScraper(NewsScraperBase):
             if '/chu-de/' in href:
                 continue
 
-            if not href.startswith('http'):
-                if href.startswith('//'):
-                    href = 'https:' + href
-                else:
-                    href = f"https://vietstock.vn{href}"
+            href = self.canonical_url(href)
 
             # Article filter: must have title, proper URL depth, and year in path
             if (len(title) > 10 and
                 href.count('/') >= 5 and
-                href not in article_links and
+                href not in seen_links and
                 '/20' in href):
 
-                article_links.append(href)
+                seen_links.add(href)
+                # Giữ title của trang danh sách (bài video chỉ lưu metadata cần title, xem media_policy)
+                article_links.append(ListingItem(href, title))
 
         if not article_links:
             print(f"⚠ No articles found")
             return all_articles
 
-        article_links = article_links[:max_articles]
         print(f"Found {len(article_links)} article URLs")
+        items = self.filter_new(article_links, limit=max_articles)
 
-        for i, article_url in enumerate(article_links, 1):
-            print(f"[{i}/{len(article_links)}] Fetching: {article_url[:60]}...", flush=True)
-            self.sleep()
-
-            article_data = self._fetch_article_detail(article_url)
-            if article_data:
-                all_articles.append(article_data)
+        all_articles.extend(self.fetch_articles([item.link for item in items]))
 
         print(f"\n✓ Total articles collected: {len(all_articles)}")
         return all_articles
 
-    def _fetch_article_detail(self, link: str) -> Optional[Tuple]:
+    def _fetch_article_detail(self, link: str) -> Optional[Article]:
         """Fetch chi tiết một bài báo VietStock"""
         html = self.fetch_html(link)
         if not html:
             return None
 
-        soup = BeautifulSoup(html, 'html.parser')
-
-        title_el = soup.select_one('h1') or soup.select_one('.article-title')
-        title = title_el.get_text(strip=True) if title_el else ''
+        article = self.extract_article(html)
 
+        title = article.title
         if not title:
             print(f"✗ No title found for: {link[:60]}...")
             return None
 
         # Extract date
-        # Priority 1: Meta tag article:published_time (ISO format)
-        # Priority 2: span.datenew
-        published_at = 0
-
-        # Try meta tag first (ISO format: 2026-01-01T21:11:44+07:00)
-        meta_date = soup.find('meta', property='article:published_time')
-        if meta_date and meta_date.get('content'):
-            try:
-                from dateutil import parser
-                dt = parser.parse(meta_date.get('content'))
-                published_at = int(dt.timestamp())
-            except Exception as e:
-                print(f"⚠ Could not parse meta date: {e}")
-
-        # Fallback to span.datenew (format: 01-01-2026 21:11:44+07:00)
-        if published_at == 0:
-            date_el = soup.select_one('span.datenew')
-            if date_el:
-                date_text = date_el.get_text(strip=True)
-                try:
-                    from dateutil import parser
-                    dt = parser.parse(date_text)
-                    published_at = int(dt.timestamp())
-                except Exception:
-                    # Fallback to regex
-                    date_match = re.search(r'(\d{1,2})[-/](\d{1,2})[-/](\d{4})\s+(\d{1,2}):(\d{2}):(\d{2})', date_text)
-                    if date_match:
-                        day, month, year, hour, minute, second = date_match.groups()
-                        try:
-                            dt = datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
-                            published_at = int(dt.timestamp())
-                        except Exception as e:
-                            print(f"⚠ Could not parse date '{date_text}': {e}")
-
-        content_el = soup.select_one('.detail-content') or soup.select_one('.article-content') or soup.select_one('[itemprop="articleBody"]')
-        content = ""
-
-        if content_el:
-            paragraphs = content_el.select('p')
-            content = ' '.join([p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)])
-
-        # Extract category from breadcrumb: <a href="/kinh-te.htm" itemprop="item" title="Kinh tế" class="bcrumbs-item"><span itemprop="name">Kinh tế</span></a>
-        category = "MỚI CẬP NHẬT"
-
-        breadcrumb_links = soup.select('a.bcrumbs-item[itemprop="item"]')
-        if len(breadcrumb_links) >= 2:
-            # Skip first (usually Trang chủ), take second as category
-            category_el = breadcrumb_links[1]
-            category_span = category_el.select_one('span[itemprop="name"]')
-            if category_span:
-                category_text = category_span.get_text(strip=True)
-                if category_text:
-                    category = category_text.upper()
-
-        return (
-            published_at,
-            title,
-            link,
-            content,
-            self.source,
-            "NA",
-            "NA",
-            False,
-            category,
-        )
+        # Priority 1: meta article:published_time (ISO: 2026-01-01T21:11:44+07:00)
+        # Priority 2: span.datenew (01-01-2026 21:11:44+07:00)
+        published_at = self.parse_published(article.date or article.extra.get('datenew'))
+
+        category = (article.category or "MỚI CẬP NHẬT").upper()
+
+        return Article(published_at, title, link, article.content, self.source, category=category)
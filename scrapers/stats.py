@@ -0,0 +1,80 @@
+"""
+Thống kê theo nguồn trong một lần chạy (đếm số lần, cộng dồn thời gian)
+
+Dùng chung cho các tầng fetch/parse để in báo cáo ở cuối scrape_all.
+"""
+
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Dict, List
+
+
+class ScrapeStats:
+    """Counter + timer thread-safe, key theo (source, tên chỉ số)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Counter] = defaultdict(Counter)
+        self._times: Dict[str, Counter] = defaultdict(Counter)
+
+    def incr(self, source: str, name: str, n: int = 1):
+        with self._lock:
+            self._counts[source][name] += n
+
+    def add_time(self, source: str, name: str, seconds: float):
+        with self._lock:
+            self._times[source][name] += seconds
+
+    @contextmanager
+    def timer(self, source: str, name: str):
+        """Đo thời gian chạy của block và cộng vào chỉ số `name`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(source, name, time.perf_counter() - start)
+
+    def count(self, source: str, name: str) -> int:
+        with self._lock:
+            return self._counts[source][name] if source in self._counts else 0
+
+    def seconds(self, source: str, name: str) -> float:
+        with self._lock:
+            return self._times[source][name] if source in self._times else 0.0
+
+    def sources(self, *names: str) -> List[str]:
+        """Các nguồn có ít nhất một trong các chỉ số `names` (không truyền thì lấy tất cả)"""
+        with self._lock:
+            result = set()
+            for table in (self._counts, self._times):
+                for source, values in table.items():
+                    if not names or any(values[name] for name in names):
+                        result.add(source)
+        return sorted(result)
+
+    def snapshot(self) -> tuple:
+        """Bản sao (counts, times) dạng dict thường, gửi được qua process khác"""
+        with self._lock:
+            counts = {source: dict(values) for source, values in self._counts.items()}
+            times = {source: dict(values) for source, values in self._times.items()}
+        return counts, times
+
+    def merge(self, snapshot: tuple):
+        """Cộng dồn snapshot() của process khác (vd worker parse) vào thống kê hiện tại"""
+        counts, times = snapshot
+        with self._lock:
+            for source, values in counts.items():
+                self._counts[source].update(values)
+            for source, values in times.items():
+                self._times[source].update(values)
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self._times.clear()
+
+
+# Singleton dùng chung cho toàn bộ scrapers trong process
+scrape_stats = ScrapeStats()
@@ -0,0 +1,100 @@
+"""
+Đọc body response theo từng chunk, dừng sớm khi đã có đủ nội dung bài viết
+
+- EndMarker: nhận selector dạng 'tag.class' (vd 'div.text-long', 'article.fck_detail'),
+  theo dõi độ sâu của tag đó trên bytes thô và báo khi container đóng lại
+- read_body: đọc chunk cho tới khi gặp end marker, hết body, hoặc vượt max_bytes
+
+Dừng sớm thì connection không được trả về pool (phần body còn lại chưa đọc),
+nên chỉ nên khai báo end marker cho các nguồn có trang chi tiết lớn.
+"""
+
+import re
+from typing import Optional, Tuple
+
+from scrapers.http_client import http_client
+
+CHUNK_SIZE = 16 * 1024
+# Phần cuối buffer được quét lại ở chunk sau (thẻ mở có thể bị cắt giữa 2 chunk)
+OPEN_TAG_OVERLAP = 1024
+
+
+class EndMarker:
+    """Tìm vị trí đóng của container `tag.class` trong HTML đang stream"""
+
+    def __init__(self, selector: str):
+        tag, _, css_class = selector.partition('.')
+        tag_name = re.escape(tag.strip().lower()).encode()
+        class_name = re.escape(css_class.strip()).encode()
+        self.selector = selector
+        self._open_re = re.compile(
+            rb'<' + tag_name + rb'\b[^>]*\bclass\s*=\s*["\'][^"\']*(?<![\w-])' + class_name + rb'(?![\w-])',
+            re.I,
+        )
+        self._tag_re = re.compile(rb'<(/?)' + tag_name + rb'\b', re.I)
+        self._pos = 0
+        self._depth = 0
+
+    def feed(self, buf: bytearray) -> Optional[int]:
+        """
+        Quét buffer đã tích lũy (chỉ phần mới).
+
+        Returns:
+            Vị trí ngay sau thẻ đóng của container, hoặc None nếu chưa gặp
+        """
+        if self._depth == 0:
+            match = self._open_re.search(buf, self._pos)
+            if not match:
+                self._pos = max(self._pos, len(buf) - OPEN_TAG_OVERLAP)
+                return None
+            self._depth = 1
+            self._pos = match.end()
+
+        for match in self._tag_re.finditer(buf, self._pos):
+            if match.end() >= len(buf):
+                break  # Chưa chắc đã hết tên tag, đợi chunk sau
+            self._pos = match.end()
+            self._depth += -1 if match.group(1) else 1
+            if self._depth == 0:
+                close = buf.find(b'>', match.end())
+                if close == -1:
+                    self._depth = 1  # Thẻ đóng bị cắt giữa chừng, quét lại ở chunk sau
+                    self._pos = match.start()
+                    return None
+                return close + 1
+        return None
+
+
+def read_body(resp, end_marker: Optional[str], max_bytes: int) -> Tuple[bytes, Optional[str]]:
+    """
+    Đọc body của response stream.
+
+    Args:
+        resp: Response mở với stream=True (requests hoặc httpx)
+        end_marker: Selector 'tag.class' của container nội dung, None = đọc hết
+        max_bytes: Giới hạn cứng kích thước body (sau giải nén)
+
+    Returns:
+        (body, lý do dừng sớm: 'end_marker' / 'max_bytes' / None)
+    """
+    marker = EndMarker(end_marker) if end_marker else None
+    buf = bytearray()
+    reason = None
+
+    try:
+        for chunk in http_client.iter_bytes(resp, CHUNK_SIZE):
+            buf += chunk
+            if marker:
+                end = marker.feed(buf)
+                if end is not None:
+                    del buf[end:]
+                    reason = 'end_marker'
+                    break
+            if len(buf) > max_bytes:
+                del buf[max_bytes:]
+                reason = 'max_bytes'
+                break
+    finally:
+        resp.close()
+
+    return bytes(buf), reason
@@ -0,0 +1,177 @@
+"""
+Model URL bài viết theo nguồn, học từ các lần fetch trang chi tiết (file JSON, dùng chung giữa các lần chạy)
+
+Link trên trang danh sách lẫn cả trang chuyên mục, sự kiện, video... Các trang này bị fetch đầy đủ rồi bỏ vì
+không có title / nội dung. Model ghi nhận "hình dạng" URL (regex) nào đã ra bài và hình dạng nào chỉ toàn
+fetch hụt, rồi lọc link trước khi fetch trang chi tiết.
+
+Hình dạng URL: mỗi đoạn path được tổng quát hóa (số -> \\d{n}, đoạn chứa ID dài -> [^/]*\\d{5,}[^/]*,
+đoạn khác -> [^/]+, giữ đuôi .html / .htm / .chn). Mỗi URL có hai key:
+- general: tất cả các đoạn đều tổng quát hóa, vd ^/[^/]+/[^/]*\\d{5,}[^/]*\\.html$
+- specific: giữ nguyên đoạn đầu, vd ^/video/[^/]*\\d{5,}[^/]*\\.html$ (tách được /video/... khỏi bài thường)
+
+Quyết định (chỉ khi nguồn đã có đủ URL_FILTER_MIN_ARTICLES bài, trước đó cho qua hết):
+- key specific đã ra bài -> fetch; đã hụt >= URL_FILTER_MAX_MISSES lần và chưa ra bài nào -> bỏ
+- còn lại xét key general theo cùng quy tắc; hình dạng mới chưa có dữ liệu vẫn được fetch để học
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from config import config
+from scrapers.stats import scrape_stats
+
+_ID_RE = re.compile(r'\d{5,}')
+_EXT_RE = re.compile(r'\.(?:html?|chn|aspx?|php)$', re.I)
+
+ID_TOKEN = r'[^/]*\d{5,}[^/]*'
+WORD_TOKEN = r'[^/]+'
+
+
+def _segment_shape(segment: str) -> str:
+    if segment.isdigit():
+        return rf'\d{{{len(segment)}}}'
+    ext = _EXT_RE.search(segment)
+    body = segment[:ext.start()] if ext else segment
+    token = ID_TOKEN if _ID_RE.search(body) else WORD_TOKEN
+    return token + (re.escape(ext.group(0).lower()) if ext else '')
+
+
+def url_patterns(url: str) -> Tuple[str, str]:
+    """(specific, general): regex hình dạng path của URL"""
+    segments = [s for s in urlsplit(url).path.split('/') if s]
+    if not segments:
+        return '^/$', '^/$'
+    shapes = [_segment_shape(s) for s in segments]
+    general = '^/' + '/'.join(shapes) + '$'
+    if len(segments) == 1 or segments[0].isdigit():
+        return general, general
+    specific = '^/' + '/'.join([re.escape(segments[0].lower())] + shapes[1:]) + '$'
+    return specific, general
+
+
+class UrlModel:
+    """Store {source: {'articles': n, 'patterns': {regex: [số lần ra bài, số lần fetch hụt]}}} ghi xuống file JSON"""
+
+    def __init__(self, path: str, min_articles: int, max_misses: int, enabled: bool = True):
+        self.path = Path(path)
+        self.min_articles = min_articles
+        self.max_misses = max_misses
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, dict]] = None
+        self._pending: Dict[str, dict] = {}  # Số đếm của lần chạy này chưa ghi xuống file, cùng cấu trúc
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _load(self) -> Dict[str, dict]:
+        if self._data is None:
+            self._data = self._read()
+        return self._data
+
+    @staticmethod
+    def _add(data: Dict[str, dict], source: str, patterns: Tuple[str, ...], is_article: bool):
+        model = data.setdefault(source, {'articles': 0, 'patterns': {}})
+        model['articles'] += int(is_article)
+        for key in patterns:
+            stats = model['patterns'].setdefault(key, [0, 0])
+            stats[0 if is_article else 1] += 1
+
+    def flush(self):
+        """
+        Ghi các kết quả mới xuống file: đọc lại file rồi cộng thêm số đếm của lần chạy này, để các process
+        khác (scheduler jobs, parse pool, node khác) ghi cùng file không làm mất số đếm của nhau
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            data = self._read()
+            for source, model in self._pending.items():
+                merged = data.setdefault(source, {'articles': 0, 'patterns': {}})
+                merged['articles'] += model['articles']
+                for key, (articles, misses) in model['patterns'].items():
+                    stats = merged['patterns'].setdefault(key, [0, 0])
+                    stats[0] += articles
+                    stats[1] += misses
+            # Ghi ra file tạm rồi replace để không hỏng file khi nhiều job ghi cùng lúc
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._data = data
+            self._pending = {}
+
+    def _verdict(self, stats: Optional[List[int]]) -> Optional[bool]:
+        """True = đã ra bài, False = chỉ toàn hụt, None = chưa đủ dữ liệu"""
+        if not stats:
+            return None
+        articles, misses = stats
+        if articles:
+            return True
+        if misses >= self.max_misses:
+            return False
+        return None
+
+    def allow(self, source: str, url: str) -> bool:
+        """Có nên fetch trang chi tiết của URL không"""
+        if not self.enabled or not url:
+            return True
+        with self._lock:
+            model = self._load().get(source)
+            if not model or model['articles'] < self.min_articles:
+                return True
+            for key in url_patterns(url):
+                verdict = self._verdict(model['patterns'].get(key))
+                if verdict is not None:
+                    return verdict
+        return True
+
+    def record(self, source: str, url: str, is_article: bool):
+        """Ghi nhận kết quả fetch trang chi tiết của URL (trong bộ nhớ, ghi xuống file ở flush())"""
+        if not self.enabled or not url:
+            return
+        patterns = tuple(set(url_patterns(url)))
+        with self._lock:
+            self._add(self._load(), source, patterns, is_article)
+            self._add(self._pending, source, patterns, is_article)
+
+    def pattern_count(self, source: str) -> int:
+        """Số hình dạng URL đã ra bài của nguồn"""
+        with self._lock:
+            model = self._load().get(source)
+            return sum(1 for stats in model['patterns'].values() if stats[0]) if model else 0
+
+
+def print_url_filter_stats():
+    """In số link bị lọc trước khi fetch và số lần fetch trang chi tiết không ra bài theo nguồn"""
+    sources = scrape_stats.sources('url_filtered', 'wasted_fetch')
+    if not sources:
+        return
+
+    print("\n🔗 Article URL filter:")
+    for source in sources:
+        print(
+            f"  {source:35} filtered={scrape_stats.count(source, 'url_filtered'):4} "
+            f"wasted_fetches={scrape_stats.count(source, 'wasted_fetch'):4} "
+            f"patterns={url_model.pattern_count(source):3}"
+        )
+
+
+# Singleton dùng chung cho toàn bộ scrapers trong process
+url_model = UrlModel(
+    os.path.join(config.CACHE_DIR, 'url_patterns.json'),
+    min_articles=config.URL_FILTER_MIN_ARTICLES,
+    max_misses=config.URL_FILTER_MAX_MISSES,
+    enabled=config.URL_FILTER,
+)
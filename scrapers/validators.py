@@ -0,0 +1,73 @@
+"""
+Lưu ETag / Last-Modified của các trang danh sách và RSS feed (persistent, file JSON)
+
+Lần chạy sau gửi If-None-Match / If-Modified-Since; server trả 304 nghĩa là
+danh sách chưa đổi và có thể bỏ qua toàn bộ nguồn đó.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict
+
+from config import config
+
+
+class ValidatorStore:
+    """Store {url: {'etag': ..., 'last_modified': ...}} ghi xuống file JSON"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._data = None
+
+    def _load(self) -> Dict[str, dict]:
+        if self._data is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._data = {}
+        return self._data
+
+    def _flush(self):
+        # Ghi ra file tạm rồi replace để không hỏng file khi nhiều job ghi cùng lúc
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Header If-None-Match / If-Modified-Since cho URL (rỗng nếu chưa có validator)"""
+        with self._lock:
+            entry = self._load().get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def save(self, url: str, response_headers) -> None:
+        """Lưu validator từ response 200 (bỏ qua nếu server không gửi ETag / Last-Modified)"""
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        entry = {'etag': etag, 'last_modified': last_modified}
+        with self._lock:
+            data = self._load()
+            if data.get(url) == entry:
+                return
+            data[url] = entry
+            self._flush()
+
+
+# Singleton dùng chung cho toàn bộ scrapers trong process
+validator_store = ValidatorStore(os.path.join(config.CACHE_DIR, 'validators.json'))
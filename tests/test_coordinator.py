@@ -0,0 +1,191 @@
+"""
+Coordinator với Postgres thật: hai node cùng chạy trên một hàng đợi crawl_jobs.
+
+Cần một database Postgres dùng riêng cho test (các bảng news / crawl_jobs bị xóa trắng):
+    TEST_DATABASE_URL=postgresql+psycopg2://postgres@127.0.0.1:5432/news_test python -m pytest tests/test_coordinator.py
+"""
+
+import os
+import threading
+import time
+from collections import Counter
+from typing import List
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from config import config
+from database.article import Article
+from database.models import Base, Database
+from scrapers import coordinator as coordinator_module
+from scrapers.base import NewsScraperBase
+from scrapers.coordinator import Coordinator
+from scrapers.parsepool import parse_pool
+from scrapers.redirects import redirect_store
+from scrapers.seen import seen_store
+from scrapers.urlmodel import url_model
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL chưa đặt")
+
+LINKS_PER_SOURCE = 30
+
+_fetched = Counter()
+_fetched_lock = threading.Lock()
+
+
+class _FakeScraper(NewsScraperBase):
+    """Trang danh sách cố định, trang chi tiết không gọi mạng, đếm số lần fetch từng link"""
+
+    prefix = ''
+
+    def fetch_news(self, **kwargs):
+        links = [f"https://{self.prefix}.test/bai-{i}.html" for i in range(LINKS_PER_SOURCE)]
+        return self.fetch_articles(links)
+
+    def _fetch_article_detail(self, link):
+        with _fetched_lock:
+            _fetched[link] += 1
+        time.sleep(0.005)  # Để hai node chạy xen kẽ
+        return Article(0, f"title {link}", link, "content", self.prefix)
+
+
+class AlphaScraper(_FakeScraper):
+    prefix = 'alpha'
+
+
+class BetaScraper(_FakeScraper):
+    prefix = 'beta'
+
+
+@pytest.fixture
+def test_db(monkeypatch):
+    engine = create_engine(TEST_DATABASE_URL)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("TRUNCATE crawl_jobs, news"))
+
+    database = Database.__new__(Database)
+    database.engine = engine
+    database.Session = sessionmaker(bind=engine)
+    monkeypatch.setattr(coordinator_module, 'db', database)
+
+    # Không đụng tới các store trên đĩa của CACHE_DIR
+    monkeypatch.setattr(seen_store, 'enabled', False)
+    monkeypatch.setattr(url_model, 'enabled', False)
+    monkeypatch.setattr(redirect_store, 'enabled', False)
+    monkeypatch.setattr(parse_pool, 'enabled', False)
+    monkeypatch.setattr(config, 'COORDINATOR_BATCH', 4)
+    monkeypatch.setattr(config, 'COORDINATOR_POLL', 0)
+    _fetched.clear()
+
+    yield engine
+    engine.dispose()
+
+
+def test_two_nodes_fetch_each_link_once(test_db):
+    sources = [(AlphaScraper, {}), (BetaScraper, {})]
+    nodes = [Coordinator(sources, node=f"node-{i}") for i in range(2)]
+    errors = []
+
+    def run(node):
+        try:
+            node.run()
+        except Exception as e:  # pragma: no cover - in ra khi test lỗi
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(node,)) for node in nodes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=120)
+
+    assert not errors
+    assert len(_fetched) == 2 * LINKS_PER_SOURCE
+    assert set(_fetched.values()) == {1}
+    # Mỗi nguồn chỉ được quét danh sách một lần, mỗi link chỉ vào hàng đợi một lần
+    assert sum(node.stats['sources'] for node in nodes) == 2
+    assert sum(node.stats['done'] for node in nodes) == 2 * LINKS_PER_SOURCE
+    assert sum(node.stats['saved'] for node in nodes) == 2 * LINKS_PER_SOURCE
+
+    with test_db.connect() as conn:
+        statuses = dict(conn.execute(
+            text("SELECT status, count(*) FROM crawl_jobs WHERE kind = 'article' GROUP BY status")
+        ).fetchall())
+        saved = conn.execute(text("SELECT count(*) FROM news")).scalar()
+    assert statuses == {'done': 2 * LINKS_PER_SOURCE}
+    assert saved == 2 * LINKS_PER_SOURCE
+
+
+def test_expired_lease_on_last_attempt_is_failed(test_db):
+    node = Coordinator([(AlphaScraper, {})], node='node-0')
+    with test_db.begin() as conn:
+        conn.execute(
+            text("""
+                INSERT INTO crawl_jobs (key, kind, scraper, link, args, status, attempts, lease_owner, lease_until)
+                VALUES ('https://alpha.test/dead.html', 'article', 'AlphaScraper', 'https://alpha.test/dead.html',
+                        '[]', 'leased', :attempts, 'dead-node', now() - interval '1 minute')
+            """),
+            {'attempts': config.COORDINATOR_MAX_ATTEMPTS},
+        )
+
+    assert node._claim_articles() == []
+    assert node.stats['failed'] == 1
+    with test_db.connect() as conn:
+        row = conn.execute(text("SELECT status, finished_at FROM crawl_jobs")).first()
+    assert row.status == 'failed'
+    assert row.finished_at is not None
+
+
+class ProbeScraper(_FakeScraper):
+    """Trong lúc quét danh sách, đọc trạng thái các kết nối khác của node trong pg_stat_activity"""
+
+    prefix = 'probe'
+    states: List[str] = []
+
+    def fetch_news(self, **kwargs):
+        engine = create_engine(TEST_DATABASE_URL)
+        with engine.connect() as conn:
+            ProbeScraper.states = list(conn.execute(text(
+                "SELECT state FROM pg_stat_activity WHERE datname = current_database() AND pid <> pg_backend_pid()"
+            )).scalars())
+        engine.dispose()
+        return super().fetch_news(**kwargs)
+
+
+def test_source_lock_connection_is_not_idle_in_transaction(test_db):
+    node = Coordinator([(ProbeScraper, {})], node='node-0')
+    node.run()
+
+    assert ProbeScraper.states  # Kết nối giữ advisory lock đang mở
+    assert 'idle in transaction' not in ProbeScraper.states
+    assert node.stats['sources'] == 1
+
+
+def test_scraper_instance_is_shared_between_threads(test_db):
+    created = []
+
+    class SlowInit(AlphaScraper):
+        def __init__(self):
+            time.sleep(0.05)
+            super().__init__()
+            created.append(self)
+
+    node = Coordinator([(SlowInit, {})], node='node-0')
+    barrier = threading.Barrier(4)
+    results = []
+
+    def get():
+        barrier.wait()
+        results.append(node._scraper('SlowInit'))
+
+    threads = [threading.Thread(target=get) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(scraper is created[0] for scraper in results)
@@ -0,0 +1,71 @@
+from datetime import datetime
+
+import pytest
+
+from scrapers.dates import DATE_SAMPLES, VN_TZ, from_struct_time, parse_first, parse_timestamp
+from scrapers.stats import scrape_stats
+
+
+def vn(*args) -> int:
+    """Timestamp của thời điểm theo giờ Việt Nam"""
+    return int(datetime(*args, tzinfo=VN_TZ).timestamp())
+
+
+EXPECTED = {
+    "2026-01-01T21:35:00+07:00": vn(2026, 1, 1, 21, 35),
+    "2026-01-02T08:00:11+0700": vn(2026, 1, 2, 8, 0, 11),
+    "1767315611": 1767315611,
+    "Thứ hai, 29/12/2025, 15:50 (GMT+7)": vn(2025, 12, 29, 15, 50),
+    "Thứ Hai, 16:54, 29/12/2025": vn(2025, 12, 29, 16, 54),
+    "29-12-2025 - 16:16 PM": vn(2025, 12, 29, 16, 16),
+    "31/12/2025 9:05 PM": vn(2025, 12, 31, 21, 5),
+    "Thứ Sáu, 26/12/2025 - 22:10": vn(2025, 12, 26, 22, 10),
+    "02/01/2026 11:02:40": vn(2026, 1, 2, 11, 2, 40),
+    "01-01-2026 21:11:44+07:00": vn(2026, 1, 1, 21, 11, 44),
+    "Chủ nhật, 04/01/2026": vn(2026, 1, 4),
+    "01/01/2026, 10:52": vn(2026, 1, 1, 10, 52),
+}
+
+
+def test_expected_covers_all_samples():
+    assert set(DATE_SAMPLES) == set(EXPECTED)
+
+
+@pytest.mark.parametrize('text', DATE_SAMPLES)
+def test_date_samples(text):
+    assert parse_timestamp(text, -1) == EXPECTED[text]
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("2026-01-01T14:35:00Z", vn(2026, 1, 1, 21, 35)),
+    ("2026-01-01", vn(2026, 1, 1)),
+    ("1767315611000", 1767315611),
+    ("  1767315611  ", 1767315611),
+    ("31/12/2025 12:05 AM", vn(2025, 12, 31, 0, 5)),
+])
+def test_other_formats(text, expected):
+    assert parse_timestamp(text, -1) == expected
+
+
+@pytest.mark.parametrize('text', [
+    None, "", "hôm qua", "17673156110", "12345678", "32/13/2025 10:00", "01/01/2026 25:00",
+])
+def test_invalid_returns_default(text):
+    assert parse_timestamp(text, -1) == -1
+
+
+def test_failures_counted_per_source():
+    scrape_stats.reset()
+    parse_timestamp("không phải ngày", 0, 'test-source')
+    parse_timestamp(DATE_SAMPLES[0], 0, 'test-source')
+    assert scrape_stats.count('test-source', 'date_fail') == 1
+
+
+def test_parse_first_uses_first_valid_value():
+    assert parse_first([None, "", "xx", "02/01/2026 11:02:40"], -1) == vn(2026, 1, 2, 11, 2, 40)
+    assert parse_first([None, "xx"], -1) == -1
+
+
+def test_from_struct_time():
+    assert from_struct_time(datetime(2026, 1, 2, 9, 6, 3).timetuple()) == vn(2026, 1, 2, 16, 6, 3)
+    assert from_struct_time(None, 7) == 7
@@ -0,0 +1,55 @@
+import gzip
+
+from scrapers.decoding import decode_body, header_charset, meta_charset
+
+TEXT = "Chứng khoán tăng điểm"
+META_CP1258 = b'<html><head><meta charset="windows-1258"></head><body>'
+
+
+def test_defaults_to_utf8():
+    assert decode_body(TEXT.encode('utf-8'), {}) == TEXT
+
+
+def test_header_charset():
+    assert header_charset('text/html; charset="UTF-16"') == 'utf-16'
+    assert header_charset('text/html') is None
+    assert header_charset('text/html; charset=khong-co') is None
+
+
+def test_meta_charset():
+    assert meta_charset(META_CP1258) == 'cp1258'
+    assert meta_charset(b'<meta http-equiv="Content-Type" content="text/html; charset=iso-8859-1">') == 'iso8859-1'
+    # Chỉ quét phần đầu document
+    assert meta_charset(b' ' * 5000 + META_CP1258) is None
+
+
+def test_header_wins_over_meta():
+    body = META_CP1258 + "Việt".encode('utf-8')
+    assert decode_body(body, {'Content-Type': 'text/html; charset=utf-8'}).endswith("Việt")
+
+
+def test_meta_used_without_header_charset():
+    body = META_CP1258 + "Giá".encode('cp1258')
+    assert decode_body(body, {'Content-Type': 'text/html'}).endswith("Giá")
+
+
+def test_source_override_wins_over_header_and_meta():
+    body = META_CP1258 + "Giá".encode('latin-1')
+    headers = {'Content-Type': 'text/html; charset=utf-8'}
+    assert decode_body(body, headers, charset='latin-1').endswith("Giá")
+
+
+def test_invalid_override_falls_back():
+    assert decode_body(TEXT.encode('utf-8'), {}, charset='khong-co') == TEXT
+
+
+def test_double_gzip_body_is_decompressed():
+    assert decode_body(gzip.compress(TEXT.encode('utf-8')), {}) == TEXT
+
+
+def test_broken_gzip_is_decoded_as_is():
+    assert decode_body(b'\x1f\x8b' + b'abc', {}) == '\x1f�abc'
+
+
+def test_undecodable_bytes_replaced():
+    assert decode_body(b'abc\xff', {'Content-Type': 'text/html; charset=utf-8'}) == 'abc�'
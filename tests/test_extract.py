@@ -0,0 +1,174 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from config import config
+from scrapers.dates import VN_TZ
+from scrapers.extract import ArticleSpec
+from scrapers.html.cafeland import CafelandScraper
+from scrapers.html.vietnamnet import VietnametScraper
+from scrapers.html.vnexpress import ARTICLE_SPEC, VnExpressScraper
+from utils.html_parser import make_soup
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+LINK = 'https://vnexpress.net/gia-vang-mieng-lap-dinh-moi-4990001.html'
+CONTENT = (
+    "Sáng 29/12, các doanh nghiệp kinh doanh vàng đồng loạt nâng giá vàng miếng. "
+    "Mức tăng này đưa giá vàng miếng lên vùng cao nhất từ trước tới nay. "
+    "Tin liên quan: Giá vàng nhẫn tăng mạnh "
+    "Minh Sơn"
+)
+
+
+@pytest.fixture(scope='module')
+def page() -> str:
+    return (FIXTURES / 'vnexpress_article.html').read_text(encoding='utf-8')
+
+
+def test_spec_on_full_page(page):
+    article = ARTICLE_SPEC.extract(make_soup(page))
+    assert article.category == 'Kinh doanh'
+    assert article.date.get_text(strip=True) == 'Thứ hai, 29/12/2025, 15:50 (GMT+7)'
+    assert article.content == CONTENT
+    assert article.title == ''  # Spec VnExpress không khai báo title (lấy từ trang danh sách)
+
+
+def test_targeted_parse_gives_same_result(page):
+    full = ARTICLE_SPEC.extract(make_soup(page))
+    targeted = ARTICLE_SPEC.extract(make_soup(page, ARTICLE_SPEC.regions))
+    assert ARTICLE_SPEC.regions is not None
+    assert targeted._replace(date=str(targeted.date)) == full._replace(date=str(full.date))
+
+
+@pytest.mark.parametrize('head_meta', [True, False])
+def test_scraper_detail_on_saved_page(page, monkeypatch, head_meta):
+    monkeypatch.setattr(config, 'HEAD_META', head_meta)
+    scraper = VnExpressScraper()
+    scraper._prefetched[LINK] = page  # fetch_html đọc lại trang đã lưu, không gọi mạng
+
+    article = scraper._fetch_article_detail(LINK, 'Giá vàng miếng lập đỉnh mới', 'mô tả')
+    assert article.title == 'Giá vàng miếng lập đỉnh mới'
+    assert article.link == LINK
+    assert article.published_at == int(datetime(2025, 12, 29, 15, 50, tzinfo=VN_TZ).timestamp())
+    assert article.category == 'KINH DOANH'
+    assert article.content == CONTENT
+    assert article.source == 'vnexpress.net'
+
+
+SPEC_PAGE = """
+<html><head>
+<meta property="article:published_time" content="2026-01-02T08:00:11+07:00">
+</head><body>
+<ul class="crumbs"><li><a>Trang chủ</a></li><li><a>Chứng khoán</a></li></ul>
+<h2 class="title">Tiêu đề phụ</h2>
+<h1>Tiêu đề chính</h1>
+<div class="sapo">Tóm tắt bài.</div>
+<div class="empty-body"></div>
+<div class="content">
+  <p>Đoạn một.</p>
+  <p>Đoạn một.</p>
+  <p>ok</p>
+  <div class="ads"><p>Quảng cáo trong bài</p></div>
+  <p>Xem thêm: bài khác</p>
+  <p>Đoạn hai.</p>
+</div>
+</body></html>
+"""
+
+
+def test_spec_fallbacks_noise_and_filters():
+    spec = ArticleSpec(
+        title=['h1', 'h2.title'],
+        date='span.date',
+        category='ul.crumbs a',
+        category_index=1,
+        sapo='div.sapo',
+        body=['div.empty-body', 'div.content'],
+        noise=('div.ads',),
+        min_paragraph_length=3,
+        skip_phrases=('xem thêm',),
+        unique=True,
+    )
+    article = spec.extract(make_soup(SPEC_PAGE))
+    assert article.title == 'Tiêu đề chính'  # Selector đầu tiên của chuỗi fallback được ưu tiên
+    assert article.category == 'Chứng khoán'
+    assert article.date is None
+    assert article.content == 'Tóm tắt bài. Đoạn một. Đoạn hai.'
+
+
+def test_spec_fields_known_from_head_are_skipped():
+    spec = ArticleSpec(title='h1', date='span.date', body='div.content')
+    known = spec.from_head({'article:published_time': '2026-01-02T08:00:11+07:00', 'ld:headline': 'Từ JSON-LD'})
+    assert known == {'date': '2026-01-02T08:00:11+07:00', 'title': 'Từ JSON-LD'}
+    assert spec.regions_without(frozenset(known)) == ['div.content']
+
+    article = spec.extract(make_soup(SPEC_PAGE), known)
+    assert article.title == 'Từ JSON-LD'
+    assert article.date == '2026-01-02T08:00:11+07:00'
+
+
+VIETNAMNET_PAGE = """
+<html><head><script>var ads = 1;</script></head><body>
+<div class="header"><a href="/thoi-su" title="Thời sự">Thời sự</a></div>
+<div class="bread-crumb-detail sm-show-time">
+  <ul><li><a href="/kinh-doanh" title="Kinh doanh">Kinh doanh</a></li></ul>
+  <div class="bread-crumb-detail__time">Thứ Sáu, 26/12/2025 - 22:10</div>
+</div>
+<h1 class="content-detail-title">Tiêu đề</h1>
+<div class="maincontent main-content">
+  <p>Đoạn một của bài.</p>
+  <div class="article-relate"><p>Tin liên quan</p></div>
+  <p>Đoạn hai của bài.</p>
+</div>
+<div class="comment"><p>Bình luận</p></div>
+</body></html>
+"""
+
+
+def test_vietnamnet_targeted_parse_matches_full_parse(monkeypatch):
+    link = 'https://vietnamnet.vn/bai-viet-2470001.html'
+    scraper = VietnametScraper()
+    scraper._prefetched[link] = VIETNAMNET_PAGE
+    targeted = scraper._fetch_article_detail(link, 'Tiêu đề')
+
+    monkeypatch.setattr(scraper, 'detail_regions', None)
+    scraper._prefetched[link] = VIETNAMNET_PAGE
+    full = scraper._fetch_article_detail(link, 'Tiêu đề')
+
+    assert targeted == full
+    assert targeted.category == 'KINH DOANH'  # Link chuyên mục cạnh ngày đăng
+    assert targeted.published_at == int(datetime(2025, 12, 26, 22, 10, tzinfo=VN_TZ).timestamp())
+    assert targeted.content == 'Đoạn một của bài. Tin liên quan Đoạn hai của bài.'
+
+
+CAFELAND_PAGE = """
+<html><body>
+<div class="info-date right">31/12/2025 9:05 PM</div>
+<div class="layout-body">
+  <h1>Tiêu đề</h1>
+  <div class="new-content">
+    <p>Thị trường bất động sản phía Nam ghi nhận nguồn cung căn hộ mới tăng mạnh trong quý cuối năm,
+    chủ yếu tập trung ở các dự án ven trung tâm với giá bán ổn định.</p>
+    <p>Nhiều chủ đầu tư tung chính sách thanh toán giãn tiến độ, hỗ trợ lãi suất để kích cầu
+    người mua ở thực trong bối cảnh thanh khoản đang dần hồi phục.</p>
+    <p>Giới phân tích dự báo xu hướng này tiếp tục kéo dài sang năm sau khi hạ tầng giao thông
+    kết nối khu vực được hoàn thiện.</p>
+  </div>
+</div>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize('readability, expected', [
+    (True, 'Thị trường bất động sản phía Nam'),
+    (False, 'Mô tả ở trang danh sách'),
+])
+def test_cafeland_falls_back_to_readability_before_description(monkeypatch, readability, expected):
+    monkeypatch.setattr(config, 'READABILITY_FALLBACK', readability)
+    link = 'https://cafeland.vn/tin-tuc/bai-viet-120001.html'
+    scraper = CafelandScraper()
+    scraper._prefetched[link] = CAFELAND_PAGE
+
+    article = scraper._fetch_article_detail(link, 'Tiêu đề', 'Mô tả ở trang danh sách')
+    assert article.content.startswith(expected)
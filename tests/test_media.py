@@ -0,0 +1,49 @@
+"""
+media_policy trong filter_new: bài video chỉ lưu metadata cần title từ trang danh sách
+"""
+
+import pytest
+
+from config import config
+from scrapers.base import ListingItem, NewsScraperBase
+from scrapers.media import METADATA, VIDEO, classify_url
+from scrapers.seen import seen_store
+from scrapers.stats import scrape_stats
+from scrapers.urlmodel import url_model
+
+VIDEO_LINK = 'https://media.test/video/ban-tin-sang-4990001.html'
+TEXT_LINK = 'https://media.test/kinh-te/bai-viet-4990002.html'
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    monkeypatch.setattr(seen_store, 'enabled', False)
+    monkeypatch.setattr(url_model, 'enabled', False)
+    monkeypatch.setattr(config, 'SKIP_EXISTING', False)
+    scrape_stats.reset()
+    scraper = NewsScraperBase()
+    scraper.source = 'media.test'
+    scraper.media_policy = {VIDEO: METADATA}
+    return scraper
+
+
+def test_video_link_is_classified_by_url():
+    assert classify_url(VIDEO_LINK) == VIDEO
+    assert classify_url(TEXT_LINK) != VIDEO
+
+
+def test_listing_item_video_is_kept_as_metadata(scraper):
+    items = scraper.filter_new([ListingItem(VIDEO_LINK, 'Bản tin sáng'), ListingItem(TEXT_LINK, 'Bài viết')])
+    assert [item.link for item in items] == [VIDEO_LINK, TEXT_LINK]
+
+    article = scraper.fetch_article(VIDEO_LINK)  # Không fetch trang chi tiết
+    assert article.title == 'Bản tin sáng'
+    assert article.category == 'VIDEO'
+    assert scrape_stats.count('media.test', 'media_metadata') == 1
+
+
+def test_bare_link_video_is_counted_as_untitled(scraper):
+    assert scraper.filter_new([VIDEO_LINK, TEXT_LINK]) == [TEXT_LINK]
+    assert scrape_stats.count('media.test', 'media_untitled') == 1
+    assert scrape_stats.count('media.test', 'media_skip') == 0
+    assert 'media.test' in scrape_stats.sources('media_untitled')
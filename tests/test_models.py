@@ -0,0 +1,66 @@
+"""
+Database với Postgres thật: index của bảng news và find_existing.
+
+Cần một database Postgres dùng riêng cho test (bảng news bị xóa trắng):
+    TEST_DATABASE_URL=postgresql+psycopg2://postgres@127.0.0.1:5432/news_test python -m pytest tests/test_models.py
+"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from database.article import Article
+from database.models import Database
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL chưa đặt")
+
+
+@pytest.fixture
+def database():
+    engine = create_engine(TEST_DATABASE_URL)
+    database = Database.__new__(Database)
+    database.engine = engine
+    database.Session = sessionmaker(bind=engine)
+    database.create_tables()
+    with engine.begin() as conn:
+        conn.execute(text("TRUNCATE news"))
+    yield database
+    engine.dispose()
+
+
+def _indexes(engine) -> set:
+    with engine.connect() as conn:
+        return set(conn.execute(text("SELECT indexname FROM pg_indexes WHERE tablename = 'news'")).scalars())
+
+
+def test_create_tables_adds_link_index_to_existing_table(database):
+    with database.engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_news_link"))
+    assert 'ix_news_link' not in _indexes(database.engine)
+
+    database.create_tables()
+    database.create_tables()  # Chạy lại không lỗi khi index đã có
+    assert 'ix_news_link' in _indexes(database.engine)
+
+
+def test_find_existing_uses_indexes(database):
+    database.insert_article(Article(0, 'Tiêu đề A', 'https://a.test/1.html', 'nội dung', 'a.test'))
+    database.insert_article(Article(0, 'Tiêu đề B', 'https://a.test/2.html', 'nội dung', 'a.test'))
+
+    links, titles = database.find_existing(
+        ['https://a.test/1.html', 'https://a.test/9.html'], ['Tiêu đề B', 'Tiêu đề mới'],
+    )
+    assert links == {'https://a.test/1.html'}
+    assert titles == {'Tiêu đề B'}
+
+    with database.engine.connect() as conn:
+        conn.execute(text("SET enable_seqscan = off"))
+        plan = "\n".join(conn.execute(text(
+            "EXPLAIN SELECT link, title FROM news WHERE link IN ('x', 'y') OR title IN ('z')"
+        )).scalars())
+    assert 'ix_news_link' in plan
+    assert 'news_title_key' in plan
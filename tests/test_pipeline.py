@@ -0,0 +1,168 @@
+"""
+ScrapePipeline với scraper giả (không gọi mạng, không ghi DB): _DONE phải đi qua đủ các stage để run() kết thúc
+"""
+
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from config import config
+from database.article import Article
+from scrapers import pipeline as pipeline_module
+from scrapers.base import NewsScraperBase
+from scrapers.parsepool import parse_pool
+from scrapers.pipeline import _DONE, ScrapePipeline, Stage
+from scrapers.redirects import redirect_store
+from scrapers.seen import seen_store
+from scrapers.urlmodel import url_model
+
+LINKS_PER_SOURCE = 20
+
+
+class FakeScraper(NewsScraperBase):
+    """fetch_news như các nguồn thật (gọi fetch_articles), trang chi tiết lấy từ dict thay vì mạng"""
+
+    def __init__(self, source: str, links, broken=()):
+        super().__init__()
+        self.source = source
+        self.links = list(links)
+        self.broken = set(broken)
+        self.fetched = Counter()
+        self._lock = threading.Lock()
+
+    def fetch_news(self, **kwargs):
+        return self.fetch_articles([(link, f"title {link}") for link in self.links])
+
+    def fetch_html(self, url, listing=False):
+        html = self._prefetched.pop(url, None)
+        if html is not None:
+            return html
+        with self._lock:
+            self.fetched[url] += 1
+        return None if url in self.broken else f"<html><body><p>{url}</p></body></html>"
+
+    def _fetch_article_detail(self, link, title):
+        html = self.fetch_html(link)
+        if html is None:
+            return None
+        return Article(0, title, link, html, self.source)
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    # Không đụng tới các store trên đĩa của CACHE_DIR
+    monkeypatch.setattr(seen_store, 'enabled', False)
+    monkeypatch.setattr(url_model, 'enabled', False)
+    monkeypatch.setattr(redirect_store, 'enabled', False)
+    monkeypatch.setattr(parse_pool, 'enabled', False)
+    monkeypatch.setattr(pipeline_module.db, 'insert_article', lambda article: True)
+    monkeypatch.setattr(config, 'PIPELINE_QUEUE_SIZE', 2)  # Queue nhỏ để các stage phải chờ nhau
+    monkeypatch.setattr(config, 'PIPELINE_DISCOVER_WORKERS', 2)
+    monkeypatch.setattr(config, 'PIPELINE_FETCH_WORKERS', 3)
+    monkeypatch.setattr(config, 'PIPELINE_EXTRACT_WORKERS', 2)
+    monkeypatch.setattr(config, 'PIPELINE_PERSIST_WORKERS', 2)
+
+
+def _run(pipeline: ScrapePipeline, jobs, timeout: float = 10):
+    """Chạy pipeline trên thread riêng, fail thay vì treo nếu _DONE không tới được stage cuối"""
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(articles=pipeline.run(jobs)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "pipeline không kết thúc"
+    return result['articles']
+
+
+def _links(prefix: str, count: int = LINKS_PER_SOURCE):
+    return [f"https://{prefix}.test/bai-{i}.html" for i in range(count)]
+
+
+def test_pipeline_finishes_and_passes_every_article():
+    scrapers = [FakeScraper(name, _links(name)) for name in ('alpha', 'beta', 'gamma')]
+    pipeline = ScrapePipeline(save_to_db=True, collect=True)
+
+    articles = _run(pipeline, [(scraper, {}) for scraper in scrapers])
+
+    assert sorted(a.link for a in articles) == sorted(link for s in scrapers for link in s.links)
+    assert pipeline.saved == len(articles)
+    for scraper in scrapers:
+        assert all(count == 1 for count in scraper.fetched.values())  # Mỗi trang chi tiết chỉ tải một lần
+        assert not scraper._prefetched
+    counts = {stage.name: (stage.processed, stage.errors) for stage in pipeline.stages}
+    total = 3 * LINKS_PER_SOURCE
+    assert counts == {
+        'discover': (3, 0),
+        'fetch': (total, 0),
+        'extract': (total, 0),
+        'dedup': (total, 0),
+        'persist': (total, 0),
+    }
+
+
+def test_pipeline_drops_duplicates_and_failed_pages():
+    shared = _links('shared', 5)
+    alpha = FakeScraper('alpha', shared + _links('alpha', 5))
+    beta = FakeScraper('beta', shared + _links('beta', 5), broken=_links('beta', 2))
+    pipeline = ScrapePipeline(save_to_db=False, collect=True)
+
+    articles = _run(pipeline, [(alpha, {}), (beta, {})])
+
+    links = [a.link for a in articles]
+    assert len(links) == len(set(links))
+    assert set(links) == set(shared + _links('alpha', 5) + _links('beta', 5)[2:])
+    assert pipeline.saved == 0
+    fetch = pipeline.stages[1]
+    assert fetch.processed == 20 and fetch.emitted == 18
+    assert pipeline._failed_sources == {id(beta)}
+
+
+def test_pipeline_with_no_jobs_finishes():
+    pipeline = ScrapePipeline(save_to_db=False, collect=True)
+    assert _run(pipeline, []) == []
+    assert all(stage.processed == 0 for stage in pipeline.stages)
+
+
+def test_pipeline_survives_stage_errors():
+    class Exploding(FakeScraper):
+        def fetch_news(self, **kwargs):
+            raise RuntimeError("listing lỗi")
+
+    good = FakeScraper('alpha', _links('alpha', 5))
+    pipeline = ScrapePipeline(save_to_db=False, collect=True)
+
+    articles = _run(pipeline, [(Exploding('boom', []), {}), (good, {})])
+
+    assert len(articles) == 5
+    assert pipeline.stages[0].errors == 1
+
+
+def test_done_reaches_every_worker_of_next_stage():
+    seen = []
+    lock = threading.Lock()
+
+    def slow_double(item, emit):
+        time.sleep(0.001)
+        emit(item * 2)
+
+    def collect(item, emit):
+        with lock:
+            seen.append(item)
+
+    first = Stage('first', slow_double, workers=4, queue_size=1)
+    second = Stage('second', collect, workers=3, queue_size=1)
+    first.next = second
+    threads = first.start() + second.start()
+
+    for i in range(50):
+        first.put(i)
+    for _ in range(first.workers):
+        first.put(_DONE)
+    for thread in threads:
+        thread.join(5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert sorted(seen) == [i * 2 for i in range(50)]
+    assert (first.processed, first.emitted, second.processed) == (50, 50, 50)
+    assert second.queue.empty()  # Không có _DONE thừa
@@ -0,0 +1,93 @@
+"""
+Rate limit theo domain khi nhiều thread dùng chung host: request chậm nhả slot thì các request
+đang chờ vẫn phải cách nhau theo rate, không được gửi dồn một lượt
+"""
+
+import threading
+import time
+
+import pytest
+
+from scrapers import base as base_module
+from scrapers.base import NewsScraperBase
+from scrapers.ratelimit import TokenBucket, rate_limiter
+
+INTERVAL = 0.2   # Giây giữa hai request của một domain
+SLOW = 0.6       # Thời gian request đầu tiên
+
+
+class _Response:
+    status_code = 200
+    headers = {}
+
+    def close(self):
+        pass
+
+
+class _SlowFirstClient:
+    """HTTP client giả: ghi lại thời điểm gửi từng request, request đầu tiên chậm"""
+
+    def __init__(self):
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.sent.append(time.monotonic())
+            first = len(self.sent) == 1
+        if first:
+            time.sleep(SLOW)
+        return _Response()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = _SlowFirstClient()
+    monkeypatch.setattr(base_module, 'http_client', fake)
+    return fake
+
+
+def _scraper() -> NewsScraperBase:
+    scraper = NewsScraperBase()
+    scraper.rate = 1 / INTERVAL
+    scraper.burst = 1
+    scraper.max_in_flight = 1
+    return scraper
+
+
+def test_waiting_requests_keep_spacing_after_slow_response(client):
+    scraper = _scraper()
+    url = 'https://slow-first.test/bai-{}.html'
+
+    first = threading.Thread(target=scraper._get, args=(url.format(0),))
+    first.start()
+    time.sleep(0.05)  # Các thread sau bắt đầu chờ khi request đầu còn đang chạy
+    others = [threading.Thread(target=scraper._get, args=(url.format(i),)) for i in range(1, 4)]
+    for thread in others:
+        thread.start()
+    for thread in [first] + others:
+        thread.join(10)
+
+    assert len(client.sent) == 4
+    start = client.sent[0]
+    offsets = [t - start for t in client.sent]
+    assert offsets[1] >= SLOW - 0.01
+    gaps = [b - a for a, b in zip(client.sent[1:], client.sent[2:])]
+    assert all(gap >= INTERVAL - 0.02 for gap in gaps), offsets
+
+
+def test_zero_request_delay_disables_rate_limit(client, monkeypatch):
+    monkeypatch.setattr(base_module.config, 'REQUEST_DELAY', 0)
+    scraper = NewsScraperBase()
+    assert scraper.rate == 0
+
+    assert rate_limiter.acquire('https://no-delay.test/', scraper.rate) == 0.0
+    assert rate_limiter.acquire('https://no-delay.test/', scraper.rate) == 0.0
+
+
+def test_token_bucket_queues_reservations():
+    bucket = TokenBucket(rate=1 / INTERVAL, burst=1)
+    waits = [bucket.reserve() for _ in range(3)]
+    assert waits[0] == 0.0
+    assert waits[1] == pytest.approx(INTERVAL, abs=0.01)
+    assert waits[2] == pytest.approx(2 * INTERVAL, abs=0.01)
@@ -0,0 +1,122 @@
+import pytest
+
+from scrapers import retry
+from scrapers.retry import CircuitBreaker, backoff_delay, retry_after_seconds
+
+URL = 'https://www.cafef.vn/bai-1.chn'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(retry.time, 'monotonic', clock)
+    return clock
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(threshold=3, cooldown=60)
+
+
+def open_circuit(breaker):
+    for _ in range(breaker.threshold - 1):
+        assert breaker.record_failure(URL) is False
+    assert breaker.record_failure(URL) is True
+
+
+def test_closed_until_threshold(breaker):
+    breaker.record_failure(URL)
+    breaker.record_failure(URL)
+    assert breaker.allow(URL)
+    assert breaker.record_failure(URL) is True
+    assert not breaker.allow(URL)
+    assert breaker.open_domains() == {'cafef.vn': 3}
+
+
+def test_success_resets_failure_count(breaker):
+    breaker.record_failure(URL)
+    breaker.record_failure(URL)
+    breaker.record_success(URL)
+    assert breaker.record_failure(URL) is False
+    assert breaker.allow(URL)
+
+
+def test_domains_are_independent(breaker):
+    open_circuit(breaker)
+    assert not breaker.allow('https://cafef.vn/khac.chn')  # www. bỏ qua khi so host
+    assert breaker.allow('https://vnexpress.net/bai.html')
+
+
+def test_single_half_open_probe(breaker, clock):
+    open_circuit(breaker)
+    clock.now += 59
+    assert not breaker.allow(URL)
+
+    clock.now += 1
+    assert breaker.allow(URL)        # Request thử duy nhất
+    assert not breaker.allow(URL)    # Các caller khác chờ kết quả
+    assert not breaker.allow(URL)
+
+    breaker.record_success(URL)
+    assert breaker.allow(URL) and breaker.allow(URL)
+    assert breaker.open_domains() == {}
+
+
+def test_failed_probe_reopens_immediately(breaker, clock):
+    open_circuit(breaker)
+    clock.now += 60
+    assert breaker.allow(URL)
+    assert breaker.record_failure(URL) is True
+    assert not breaker.allow(URL)
+
+    clock.now += 59
+    assert not breaker.allow(URL)
+    clock.now += 1
+    assert breaker.allow(URL)
+
+
+def test_failed_probe_reopens_below_threshold(breaker, clock):
+    # Lỗi của request thử luôn mở lại circuit, kể cả khi số lỗi đếm được chưa tới ngưỡng
+    open_circuit(breaker)
+    clock.now += 60
+    breaker._failures.clear()
+    assert breaker.allow(URL)
+    assert breaker.record_failure(URL) is True
+    assert not breaker.allow(URL)
+
+
+def test_lost_probe_expires_after_cooldown(breaker, clock):
+    open_circuit(breaker)
+    clock.now += 60
+    assert breaker.allow(URL)        # Request thử không báo kết quả (vd exception bất ngờ)
+    clock.now += 59
+    assert not breaker.allow(URL)
+    clock.now += 1
+    assert breaker.allow(URL)
+
+
+def test_backoff_delay_bounds(monkeypatch):
+    monkeypatch.setattr(retry.random, 'uniform', lambda low, high: high)
+    assert backoff_delay(1, base=1, cap=30) == 1
+    assert backoff_delay(3, base=1, cap=30) == 4
+    assert backoff_delay(10, base=1, cap=30) == 30
+
+
+class Resp:
+    def __init__(self, retry_after=None):
+        self.headers = {'Retry-After': retry_after} if retry_after is not None else {}
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds(Resp('120')) == 120
+    assert retry_after_seconds(Resp()) is None
+    assert retry_after_seconds(Resp('không rõ')) is None
+    assert retry_after_seconds(Resp('Wed, 21 Oct 2015 07:28:00 GMT')) == 0
@@ -0,0 +1,43 @@
+from scrapers.seen import BloomFilter, SeenStore
+
+
+def test_bloom_has_no_false_negatives(tmp_path):
+    bloom = BloomFilter(tmp_path / 'a.bloom', num_bits=1 << 16)
+    keys = [f"https://cafef.vn/bai-{i}.chn" for i in range(2000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+
+
+def test_bloom_false_positive_rate_is_small(tmp_path):
+    # 1000 key trên 2^16 bit, 7 hash: tỷ lệ báo nhầm lý thuyết ~0.01%
+    bloom = BloomFilter(tmp_path / 'a.bloom', num_bits=1 << 16)
+    for i in range(1000):
+        bloom.add(f"https://cafef.vn/bai-{i}.chn")
+    false_positives = sum(f"https://vnexpress.net/khac-{i}.html" in bloom for i in range(10000))
+    assert false_positives < 20
+
+
+def test_bloom_persists_across_instances(tmp_path):
+    path = tmp_path / 'a.bloom'
+    bloom = BloomFilter(path, num_bits=1 << 12)
+    bloom.add('https://cafef.vn/bai-1.chn')
+    bloom.flush()
+    assert 'https://cafef.vn/bai-1.chn' in BloomFilter(path, num_bits=1 << 12)
+
+
+def test_store_normalizes_urls_and_separates_sources(tmp_path):
+    store = SeenStore(tmp_path, num_bits=1 << 12)
+    store.add('CafeF', ['https://cafef.vn/bai-1.chn?utm_source=rss'])
+    assert store.seen('CafeF', 'https://cafef.vn/bai-1.chn')
+    assert not store.seen('VnExpress', 'https://cafef.vn/bai-1.chn')
+    assert not store.seen('CafeF', 'https://cafef.vn/bai-2.chn')
+    store.flush()
+    assert SeenStore(tmp_path, num_bits=1 << 12).seen('CafeF', 'https://cafef.vn/bai-1.chn')
+
+
+def test_disabled_store_sees_nothing(tmp_path):
+    store = SeenStore(tmp_path, num_bits=1 << 12, enabled=False)
+    store.add('CafeF', ['https://cafef.vn/bai-1.chn'])
+    assert not store.seen('CafeF', 'https://cafef.vn/bai-1.chn')
+    assert not list(tmp_path.iterdir())
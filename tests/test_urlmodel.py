@@ -0,0 +1,127 @@
+import json
+import re
+
+import pytest
+
+from config import config
+from scrapers import base as base_module
+from scrapers.base import NewsScraperBase
+from scrapers.seen import seen_store
+from scrapers.urlmodel import ID_TOKEN, WORD_TOKEN, UrlModel, url_patterns
+
+ARTICLE = 'https://cafef.vn/thi-truong/vn-index-tang-188251231.chn'
+
+
+@pytest.mark.parametrize('url, specific, general', [
+    (
+        ARTICLE,
+        rf'^/{re.escape("thi-truong")}/{ID_TOKEN}\.chn$',
+        rf'^/{WORD_TOKEN}/{ID_TOKEN}\.chn$',
+    ),
+    (
+        'https://vnexpress.net/video/tin-nong-4850123.html',
+        rf'^/video/{ID_TOKEN}\.html$',
+        rf'^/{WORD_TOKEN}/{ID_TOKEN}\.html$',
+    ),
+    (
+        'https://vov.vn/kinh-te/',
+        rf'^/{WORD_TOKEN}$',
+        rf'^/{WORD_TOKEN}$',
+    ),
+    (
+        'https://nld.com.vn/2026/01/02/bai-viet.htm',
+        r'^/\d{4}/\d{2}/\d{2}/' + WORD_TOKEN + r'\.htm$',
+        r'^/\d{4}/\d{2}/\d{2}/' + WORD_TOKEN + r'\.htm$',
+    ),
+    ('https://cafef.vn/', '^/$', '^/$'),
+])
+def test_url_patterns(url, specific, general):
+    assert url_patterns(url) == (specific, general)
+
+
+def test_patterns_match_same_shaped_urls():
+    specific, general = url_patterns(ARTICLE)
+    other = '/thi-truong/gia-vang-giam-188260102.chn'
+    assert re.match(specific, other)
+    assert re.match(general, '/doanh-nghiep/lai-quy-4-188260103.chn')
+    assert not re.match(general, '/thi-truong/')
+
+
+def make_model(tmp_path, **kwargs):
+    return UrlModel(tmp_path / 'url_patterns.json', min_articles=kwargs.get('min_articles', 2),
+                    max_misses=kwargs.get('max_misses', 2))
+
+
+def test_allows_everything_until_enough_articles(tmp_path):
+    model = make_model(tmp_path)
+    for _ in range(3):
+        model.record('CafeF', 'https://cafef.vn/su-kien/', False)
+    assert model.allow('CafeF', 'https://cafef.vn/su-kien/')
+
+
+def test_learns_article_and_miss_shapes(tmp_path):
+    model = make_model(tmp_path)
+    model.record('CafeF', ARTICLE, True)
+    model.record('CafeF', 'https://cafef.vn/doanh-nghiep/lai-quy-4-188260103.chn', True)
+    model.record('CafeF', 'https://cafef.vn/su-kien/', False)
+    model.record('CafeF', 'https://cafef.vn/chung-khoan/', False)
+
+    assert model.allow('CafeF', 'https://cafef.vn/vi-mo/lai-suat-188260104.chn')
+    assert not model.allow('CafeF', 'https://cafef.vn/bat-dong-san/')
+    assert model.allow('CafeF', 'https://cafef.vn/a/b/c/hinh-dang-moi')  # Chưa có dữ liệu: vẫn fetch
+    assert model.allow('VnExpress', 'https://vnexpress.net/kinh-doanh/')  # Nguồn khác chưa học gì
+    assert model.pattern_count('CafeF') == 3  # 2 specific (thi-truong, doanh-nghiep) + 1 general
+
+
+def test_specific_shape_overrides_general(tmp_path):
+    model = make_model(tmp_path)
+    model.record('VnExpress', 'https://vnexpress.net/kinh-doanh/bai-4850001.html', True)
+    model.record('VnExpress', 'https://vnexpress.net/the-gioi/bai-4850002.html', True)
+    model.record('VnExpress', 'https://vnexpress.net/video/clip-4850003.html', False)
+    model.record('VnExpress', 'https://vnexpress.net/video/clip-4850004.html', False)
+    assert not model.allow('VnExpress', 'https://vnexpress.net/video/clip-4850005.html')
+    assert model.allow('VnExpress', 'https://vnexpress.net/thoi-su/bai-4850006.html')
+
+
+def test_record_does_not_write_until_flush(tmp_path):
+    model = make_model(tmp_path)
+    model.record('CafeF', ARTICLE, True)
+    assert not (tmp_path / 'url_patterns.json').exists()
+    model.flush()
+    assert json.loads((tmp_path / 'url_patterns.json').read_text(encoding='utf-8'))['CafeF']['articles'] == 1
+
+
+def test_flush_adds_counts_of_other_processes(tmp_path):
+    first, second = make_model(tmp_path), make_model(tmp_path)
+    first.record('CafeF', ARTICLE, True)
+    second.record('CafeF', ARTICLE, True)
+    second.record('CafeF', 'https://cafef.vn/su-kien/', False)
+    first.flush()
+    second.flush()
+    first.flush()  # Không có gì mới: không cộng lại lần nữa
+
+    data = json.loads((tmp_path / 'url_patterns.json').read_text(encoding='utf-8'))
+    specific, general = url_patterns(ARTICLE)
+    assert data['CafeF']['articles'] == 2
+    assert data['CafeF']['patterns'][specific] == [2, 0]
+    assert data['CafeF']['patterns'][general] == [2, 0]
+    assert data['CafeF']['patterns'][url_patterns('https://cafef.vn/su-kien/')[0]] == [0, 1]
+
+
+def test_rejected_links_do_not_use_up_max_articles(tmp_path, monkeypatch):
+    model = make_model(tmp_path)
+    model.record('CafeF', ARTICLE, True)
+    model.record('CafeF', 'https://cafef.vn/doanh-nghiep/lai-quy-4-188260103.chn', True)
+    model.record('CafeF', 'https://cafef.vn/su-kien/', False)
+    model.record('CafeF', 'https://cafef.vn/chung-khoan/', False)
+    monkeypatch.setattr(base_module, 'url_model', model)
+    monkeypatch.setattr(seen_store, 'enabled', False)
+    monkeypatch.setattr(config, 'SKIP_EXISTING', False)
+
+    scraper = NewsScraperBase()
+    scraper.source = 'CafeF'
+    categories = [f'https://cafef.vn/chuyen-muc-{i}/' for i in range(5)]
+    articles = [f'https://cafef.vn/thi-truong/bai-{i}-18826010{i}.chn' for i in range(5)]
+
+    assert scraper.filter_new(categories + articles, limit=3) == articles[:3]
+    assert scraper.filter_new(articles) == articles
@@ -0,0 +1,76 @@
+import json
+from types import SimpleNamespace
+
+from scrapers.redirects import RedirectStore, is_permanent
+from utils.urls import canonicalize, normalize_url
+
+
+def test_normalize_url():
+    assert normalize_url('HTTPS://CafeF.vn:443/Bai-1.chn?b=2&utm_source=x&a=1#top') == 'https://cafef.vn/Bai-1.chn?a=1&b=2'
+    assert normalize_url('http://cafef.vn') == 'http://cafef.vn/'
+    assert normalize_url('https://cafef.vn:8443/a') == 'https://cafef.vn:8443/a'
+    assert normalize_url(' https://cafef.vn/a?fbclid=1&gidzl=2 ') == 'https://cafef.vn/a'
+
+
+def test_canonicalize():
+    assert canonicalize('/bai-1.chn', 'https://cafef.vn') == 'https://cafef.vn/bai-1.chn'
+    assert canonicalize('//cafef.vn/bai-1.chn') == 'https://cafef.vn/bai-1.chn'
+    assert canonicalize('http://cafef.vn/bai-1.chn') == 'https://cafef.vn/bai-1.chn'
+    assert canonicalize('https://cafef.vn/bai-1.chn?page=2', drop_query=True) == 'https://cafef.vn/bai-1.chn'
+    assert canonicalize('https://tinnhanhchungkhoan.vn/a', host='www.tinnhanhchungkhoan.vn') == \
+        'https://www.tinnhanhchungkhoan.vn/a'
+    assert canonicalize('https://cafef.vn/old/bai-1.chn', rewrites=[(r'^/old/', '/')]) == 'https://cafef.vn/bai-1.chn'
+    assert canonicalize('javascript:void(0)', 'https://cafef.vn') == 'javascript:void(0)'
+
+
+def test_is_permanent():
+    resp = lambda status: SimpleNamespace(status_code=status)
+    assert is_permanent([resp(301)])
+    assert is_permanent([resp(301), resp(308)])
+    assert not is_permanent([resp(301), resp(302)])
+    assert not is_permanent([resp(307)])
+    assert not is_permanent([])
+
+
+def test_resolve_follows_recorded_chain(tmp_path):
+    store = RedirectStore(tmp_path / 'redirects.json')
+    store.record('http://cafef.vn/a.chn', 'https://cafef.vn/b.chn')
+    store.record('https://cafef.vn/b.chn', 'https://cafef.vn/c.chn')
+    assert store.resolve('http://cafef.vn/a.chn') == 'https://cafef.vn/c.chn'
+    assert store.resolve('https://cafef.vn/khac.chn') == 'https://cafef.vn/khac.chn'
+
+
+def test_resolve_stops_on_loops(tmp_path):
+    store = RedirectStore(tmp_path / 'redirects.json')
+    store.record('https://cafef.vn/a.chn', 'https://cafef.vn/b.chn')
+    store.record('https://cafef.vn/b.chn', 'https://cafef.vn/a.chn')
+    assert store.resolve('https://cafef.vn/a.chn') in ('https://cafef.vn/a.chn', 'https://cafef.vn/b.chn')
+
+
+def test_record_ignores_same_normalized_url(tmp_path):
+    store = RedirectStore(tmp_path / 'redirects.json')
+    store.record('https://cafef.vn/a.chn?utm_source=rss', 'https://cafef.vn/a.chn')
+    store.flush()
+    assert not (tmp_path / 'redirects.json').exists()
+
+
+def test_flush_writes_once_and_merges_with_file(tmp_path):
+    path = tmp_path / 'redirects.json'
+    first, second = RedirectStore(path), RedirectStore(path)
+    first.record('https://cafef.vn/a.chn', 'https://cafef.vn/b.chn')
+    second.record('https://cafef.vn/c.chn', 'https://cafef.vn/d.chn')
+    assert not path.exists()  # record() chỉ ghi vào bộ nhớ
+
+    first.flush()
+    second.flush()
+    assert json.loads(path.read_text(encoding='utf-8')) == {
+        'https://cafef.vn/a.chn': 'https://cafef.vn/b.chn',
+        'https://cafef.vn/c.chn': 'https://cafef.vn/d.chn',
+    }
+    assert RedirectStore(path).resolve('https://cafef.vn/c.chn') == 'https://cafef.vn/d.chn'
+
+
+def test_disabled_store(tmp_path):
+    store = RedirectStore(tmp_path / 'redirects.json', enabled=False)
+    store.record('https://cafef.vn/a.chn', 'https://cafef.vn/b.chn')
+    assert store.resolve('https://cafef.vn/a.chn') == 'https://cafef.vn/a.chn'
@@ -2,7 +2,31 @@ import csv
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
+
+from database.article import Article
+
+# Article scraper trả về, hoặc dict cùng key (vd News.to_dict())
+ArticleLike = Union[Article, Dict[str, Any]]
+
+# Giá trị mặc định của các cột khi dict thiếu key
+_DEFAULTS = {
+    'published_at': 0,
+    'title': '',
+    'link': '',
+    'content': '',
+    'source': '',
+    'stock_related': 'NA',
+    'sentiment_score': 'NA',
+    'server_pushed': False,
+    'category': '',
+}
+
+
+def _as_dict(article: ArticleLike) -> Dict[str, Any]:
+    if isinstance(article, Article):
+        return article._asdict()
+    return article
 
 
 class CSVExporter:
@@ -14,7 +38,7 @@ class CSVExporter:
     
     def export(
         self, 
-        articles: List[Dict], 
+        articles: List[ArticleLike], 
         filename: Optional[str] = None,
         include_content: bool = True
     ) -> str:
@@ -22,7 +46,7 @@ class CSVExporter:
         Export danh sách articles ra file CSV.
         
         Args:
-            articles: List các dict chứa thông tin bài báo
+            articles: List Article (hoặc dict cùng key)
             filename: Tên file (không cần .csv)
             include_content: Có bao gồm nội dung đầy đủ không
         
@@ -60,19 +84,10 @@ class CSVExporter:
             writer.writeheader()
             
             for article in articles:
-                row = {
-                    'published_at': article.get('published_at', 0),
-                    'title': article.get('title', ''),
-                    'link': article.get('link', ''),
-                    'source': article.get('source', ''),
-                    'stock_related': article.get('stock_related', 'NA'),
-                    'sentiment_score': article.get('sentiment_score', 'NA'),
-                    'server_pushed': article.get('server_pushed', False),
-                    'category': article.get('category', ''),
-                }
-                
-                if include_content:
-                    row['content'] = article.get('content', '')
+                row = _as_dict(article)
+                row = {key: row.get(key, _DEFAULTS[key]) for key in fieldnames}
+                if row['category'] is None:
+                    row['category'] = ''
                 
                 writer.writerow(row)
         
@@ -81,7 +96,7 @@ class CSVExporter:
     
     def export_summary(
         self, 
-        articles: List[Dict], 
+        articles: List[ArticleLike], 
         filename: Optional[str] = None
     ) -> str:
         """Export phiên bản tóm tắt (không có content)"""
@@ -101,7 +116,7 @@ class JSONExporter:
     
     def export(
         self, 
-        articles: List[Dict], 
+        articles: List[ArticleLike], 
         filename: Optional[str] = None,
         indent: int = 2
     ) -> str:
@@ -117,20 +132,20 @@ class JSONExporter:
         filepath = self.output_dir / f"{filename}.json"
         
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=indent)
+            json.dump([_as_dict(article) for article in articles], f, ensure_ascii=False, indent=indent)
         
         print(f"✓ Exported {len(articles)} articles to: {filepath}")
         return str(filepath)
 
 
 # Convenience functions
-def export_to_csv(articles: List[Dict], filename: str = None, include_content: bool = True) -> str:
+def export_to_csv(articles: List[ArticleLike], filename: str = None, include_content: bool = True) -> str:
     """Quick export to CSV"""
     exporter = CSVExporter()
     return exporter.export(articles, filename, include_content)
 
 
-def export_to_json(articles: List[Dict], filename: str = None) -> str:
+def export_to_json(articles: List[ArticleLike], filename: str = None) -> str:
     """Quick export to JSON"""
     exporter = JSONExporter()
     return exporter.export(articles, filename)
@@ -0,0 +1,120 @@
+"""
+Tạo BeautifulSoup với parser backend cấu hình được
+
+Mặc định dùng lxml (C, nhanh hơn nhiều so với html.parser thuần Python).
+Nếu lxml chưa cài thì tự fallback về html.parser. API trả về vẫn là BeautifulSoup
+nên select / select_one / get_text ở các scraper không phải đổi.
+
+Targeted parse: scraper khai báo các vùng cần đọc (selector đơn giản như 'h1', 'span.date',
+'#content', 'a[data-role="cate-name"]'), parser chỉ dựng cây con của các vùng đó
+(SoupStrainer), bỏ qua script, quảng cáo, tin liên quan, bình luận...
+Selector của scraper vẫn chạy được trên soup thu gọn miễn là vùng chứa phần tử đầu tiên
+của selector đã được khai báo.
+"""
+
+import functools
+import re
+from typing import Iterable, Optional, Tuple
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+from config import config
+
+FALLBACK_PARSER = 'html.parser'
+
+_parser: Optional[str] = None
+
+# tag, .class, #id, [attr], [attr="value"] (có thể ghép: 'div.a.b', 'a[rel="x"]')
+_REGION_RE = re.compile(r'^([\w-]+)?((?:[.#][\w-]+|\[[\w:-]+(?:\s*=\s*["\']?[^"\'\]]*["\']?)?\])*)$')
+_PART_RE = re.compile(r'([.#])([\w-]+)|\[([\w:-]+)(?:\s*=\s*["\']?([^"\'\]]*)["\']?)?\]')
+
+
+def _available(name: str) -> bool:
+    try:
+        BeautifulSoup('', name)
+        return True
+    except FeatureNotFound:
+        return False
+
+
+def get_parser() -> str:
+    """Tên parser đang dùng (kiểm tra một lần, fallback html.parser nếu backend không có)"""
+    global _parser
+    if _parser is None:
+        name = config.HTML_PARSER
+        if name != FALLBACK_PARSER and not _available(name):
+            print(f"⚠ HTML parser '{name}' chưa được cài, dùng {FALLBACK_PARSER}")
+            name = FALLBACK_PARSER
+        _parser = name
+    return _parser
+
+
+def set_parser(name: str):
+    """Đổi parser trong process (dùng cho benchmark)"""
+    global _parser
+    _parser = name
+
+
+class Region:
+    """Selector đơn của một vùng cần parse, so khớp trên tên tag + attrs lúc parser gặp thẻ mở"""
+
+    def __init__(self, selector: str):
+        match = _REGION_RE.match(selector.strip())
+        if not match or not selector.strip():
+            raise ValueError(f"Region selector không hỗ trợ: {selector!r}")
+        self.selector = selector
+        self.tag = match.group(1).lower() if match.group(1) else None
+        self.classes = []
+        self.attrs = []  # (tên, giá trị hoặc None = chỉ cần có attr)
+        for css, name, attr, value in _PART_RE.findall(match.group(2)):
+            if css == '.':
+                self.classes.append(name)
+            elif css == '#':
+                self.attrs.append(('id', name))
+            else:
+                self.attrs.append((attr, value or None))
+
+    def match(self, name: str, attrs: dict) -> bool:
+        if self.tag and name != self.tag:
+            return False
+        if self.classes:
+            classes = attrs.get('class') or ''
+            if isinstance(classes, str):
+                classes = classes.split()
+            if not all(c in classes for c in self.classes):
+                return False
+        for attr, value in self.attrs:
+            actual = attrs.get(attr)
+            if actual is None:
+                return False
+            if value is not None and actual != value:
+                return False
+        return True
+
+
+@functools.lru_cache(maxsize=None)
+def region_strainer(regions: Tuple[str, ...]) -> SoupStrainer:
+    """SoupStrainer giữ lại các phần tử khớp một trong các region (kèm toàn bộ cây con)"""
+    compiled = [Region(selector) for selector in regions]
+
+    def wanted(name, attrs=None):
+        if not isinstance(name, str):
+            return False
+        attrs = attrs or {}
+        return any(region.match(name, attrs) for region in compiled)
+
+    return SoupStrainer(wanted)
+
+
+def make_soup(html: str, regions: Optional[Iterable[str]] = None, parser: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parse HTML bằng parser đã cấu hình
+
+    Args:
+        html: HTML của trang
+        regions: Các vùng cần dựng cây (None = parse cả trang)
+        parser: Override parser backend
+    """
+    if regions and config.TARGETED_PARSE:
+        return BeautifulSoup(html, parser or get_parser(), parse_only=region_strainer(tuple(regions)))
+    return BeautifulSoup(html, parser or get_parser())
@@ -0,0 +1,90 @@
+"""
+Chuẩn hóa URL bài viết
+
+Một bài có thể xuất hiện dưới nhiều dạng URL (href tương đối, '//host/...', http/https, query tracking,
+fragment, URL cũ của nguồn...). canonicalize() đưa tất cả về một dạng duy nhất, dùng làm link lưu DB,
+key của response cache và seen-set.
+"""
+
+import functools
+import re
+from typing import Iterable, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+# Query string tracking, bỏ khi chuẩn hóa
+TRACKING_PARAMS = {'fbclid', 'gclid', 'zarsrc', 'gidzl', 'ref', 'src', '_ga'}
+TRACKING_PREFIXES = ('utm_',)
+
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+
+def _bare_host(host: str) -> str:
+    host = host.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def _is_tracking(key: str) -> bool:
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+
+def normalize_url(url: str) -> str:
+    """Chuẩn hóa chung: scheme / host viết thường, bỏ port mặc định, fragment và query tracking, sắp xếp query"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if ':' in netloc and netloc.rsplit(':', 1)[1] == DEFAULT_PORTS.get(scheme):
+        netloc = netloc.rsplit(':', 1)[0]
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(key)
+    )
+    return urlunsplit((scheme, netloc, parts.path or '/', urlencode(query), ''))
+
+
+def absolute_url(href: str, base: Optional[str] = None) -> str:
+    """URL tuyệt đối từ href (tương đối, '/path', '//host/path' hoặc đã tuyệt đối)"""
+    href = href.strip()
+    if href.startswith('//'):
+        return f"https:{href}"
+    return urljoin(base, href) if base else href
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(pattern: str) -> Pattern:
+    return re.compile(pattern)
+
+
+def canonicalize(
+    href: str,
+    base: Optional[str] = None,
+    rewrites: Iterable[Tuple[str, str]] = (),
+    drop_query: bool = False,
+    host: Optional[str] = None,
+) -> str:
+    """
+    URL chuẩn của một bài viết
+
+    Args:
+        href: Link lấy từ trang danh sách / RSS
+        base: Gốc của nguồn cho href tương đối (vd 'https://cafef.vn')
+        rewrites: (regex, thay thế) áp lên path, vd URL cũ -> URL hiện tại của nguồn
+        drop_query: Bỏ toàn bộ query string (nguồn không dùng query trong URL bài viết)
+        host: Ép host chuẩn (vd 'www.tinnhanhchungkhoan.vn' cho cả 'tinnhanhchungkhoan.vn')
+    """
+    url = absolute_url(href, base)
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https'):
+        return url  # javascript:, mailto:... giữ nguyên
+
+    path = parts.path
+    for pattern, replacement in rewrites:
+        path = _compile(pattern).sub(replacement, path)
+    parts = parts._replace(path=path)
+    if host and parts.hostname and _bare_host(parts.hostname) == _bare_host(host):
+        parts = parts._replace(netloc=host)
+    parts = parts._replace(scheme='https' if parts.scheme == 'http' else parts.scheme)
+    if drop_query:
+        parts = parts._replace(query='')
+    return normalize_url(urlunsplit(parts))
+